@@ -0,0 +1,242 @@
+#
+# LC4K Core Generator benchmark
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# bench_gen_lc4k_core.py [<sx file or dir> ...] [-o <results.json>]
+#                        [-b <baseline.json>] [-t <threshold>] [--lookups]
+#
+# Measures the generator per device: S-expression parse, device index,
+# time of every emit_* block, peak memory and the size of the generated
+# core in lines and fm() references. Times are the best of --repeat runs,
+# the peak memory is taken with tracemalloc in a separate run. The GLB
+# count and the fusemap dimensions are recorded with each device, the
+# generate time per GLB shows how the generator scales up to LC4512.
+#
+# Results are written as JSON with -o. Given a baseline from an earlier
+# run with -b, the benchmark fails if a time or the peak memory of any
+# device grew by more than the threshold.
+#
+# --lookups compares the per-GLB/per-MC lookups of the generator when
+# served by repeated Sexp.search() scans against lookups from
+# lc4k_device's index instead.
+#
+# Defaults to all devices of the re4k submodule.
+#
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from lc4k_device import find_sx_files, lc4k_device, load_sx
+from gen_lc4k_core import generate_core, lc4k_generator, lc4k_writer
+from lc4k_profile import lc4k_profiler
+
+
+mc_features = ('cluster_routing', 'wide_routing', 'pt0_xor', 'clock_source',
+               'clock_enable_source', 'async_source', 'init_source',
+               'pt4_output_enable', 'init_state', 'invert', 'macrocell_function',
+               'product_terms')
+pin_features = ('macrocell_data', 'drive_type', 'output_routing', 'output_routing_mode')
+
+# version of the results format
+results_version = 1
+
+
+#
+# Lookups as done by the generator before the device index was introduced
+#
+def scan_glb(index, sexp):
+    return sexp.search(lambda x: x[0] == 'glb' and x[1] == index)
+
+def scan_mc(index, sexp):
+    return sexp.search(lambda x: x[0] == 'mc' and x[1] == index)
+
+def scan_pin_at(glb, mc, pins):
+    for pin in pins:
+        if pin.search('glb')[0][1] == glb and pin.search('mc')[0][1] == mc:
+            return pin
+    return False
+
+def lookups_scan(sx, glbs, num_mcs):
+    for glb in glbs:
+        for feature in mc_features:
+            mcs = scan_glb(glb, sx.search(f'{feature}/glb')).search('mc')
+            for mc in range(num_mcs):
+                scan_mc(mc, mcs)
+        for feature in pin_features:
+            pins = sx.search(f'{feature}/pin')
+            for mc in range(num_mcs):
+                scan_pin_at(glb, mc, pins)
+
+def lookups_index(dev, glbs, num_mcs):
+    for glb in glbs:
+        for feature in mc_features:
+            for mc in range(num_mcs):
+                dev.mc(feature, glb, mc)
+        for feature in pin_features:
+            for mc in range(num_mcs):
+                dev.pin_at(feature, glb, mc)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def generate(dev):
+    '''Returns the core and the times of the emit_* blocks.'''
+    out = lc4k_writer()
+    profiler = lc4k_profiler()
+    profiler.wrap(lc4k_generator)(dev).generate(dev.sx, out)
+    return out.getvalue(), {name: phase['seconds'] for name, phase in profiler.phases.items()}
+
+def peak_memory(filename):
+    '''Peak of traced allocations while parsing, indexing and generating.'''
+    tracemalloc.start()
+    try:
+        dev = lc4k_device(load_sx(filename))
+        generate(dev)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_device(filename, repeat):
+    runs = []
+    for _ in range(repeat):
+        sx, t_parse = timed(load_sx, filename)
+        dev, t_index = timed(lc4k_device, sx)
+        (core, emits), t_generate = timed(generate, dev)
+        runs.append((t_parse, t_index, t_generate, emits))
+
+    return dev.name, {
+        'glbs'     : len(dev.glbs),
+        'rows'     : dev.num_rows,
+        'columns'  : dev.num_columns,
+        'dimensions' : dev.dimension_source,
+        'parse'    : min(run[0] for run in runs),
+        'index'    : min(run[1] for run in runs),
+        'generate' : min(run[2] for run in runs),
+        'emit'     : {name: min(run[3][name] for run in runs) for name in sorted(runs[0][3])},
+        'peak_memory' : peak_memory(filename),
+        'lines'    : core.count('\n'),
+        'fm_refs'  : core.count('fm('),
+    }
+
+
+#
+# Baseline comparison
+#
+def metrics(result):
+    '''Flat (name, value, kind) of the metrics a regression is checked for.'''
+    yield 'parse', result['parse'], 'time'
+    yield 'index', result['index'], 'time'
+    yield 'generate', result['generate'], 'time'
+    for name, seconds in result['emit'].items():
+        yield name, seconds, 'time'
+    yield 'peak_memory', result['peak_memory'], 'memory'
+
+def compare(results, baseline, threshold, min_delta):
+    '''Regressions of results against baseline as list of messages.'''
+    regressions = []
+    for device, result in results['devices'].items():
+        base = baseline['devices'].get(device)
+        if base is None:
+            continue
+        base_metrics = {name: value for name, value, kind in metrics(base)}
+        for name, value, kind in metrics(result):
+            if name not in base_metrics:
+                continue
+            limit = base_metrics[name] * (1 + threshold)
+            # ignore timer noise on very short blocks
+            if kind == 'time':
+                limit = max(limit, base_metrics[name] + min_delta)
+            if value > limit:
+                regressions.append(f'{device} {name}: {value:.4g} > {base_metrics[name]:.4g} '
+                                   f'(+{(value / max(base_metrics[name], 1e-12) - 1):.0%})')
+        for name in ('rows', 'columns', 'lines', 'fm_refs'):
+            if name in base and result[name] != base[name]:
+                print(f'{device} {name}: {base[name]} -> {result[name]}', file=sys.stderr)
+    return regressions
+
+
+def main_lookups(files):
+    print(f"{'device':<20s} {'parse':>8s} {'index':>8s} {'scan':>9s} {'lookup':>9s} {'speedup':>8s} {'generate':>9s}")
+    for filename in files:
+        sx, t_parse = timed(load_sx, filename)
+        dev, t_index = timed(lc4k_device, sx)
+        glbs = [glb[1] for glb in dev.search('bclk_polarity/glb')]
+
+        _, t_scan = timed(lookups_scan, sx, glbs, 16)
+        _, t_lookup = timed(lookups_index, dev, glbs, 16)
+        _, t_gen = timed(generate_core, sx)
+
+        print(f'{dev.name:<20s} {t_parse:8.3f} {t_index:8.3f} {t_scan:9.3f} {t_lookup:9.5f} '
+              f'{t_scan / max(t_lookup, 1e-9):7.0f}x {t_gen:9.3f}')
+
+def main():
+    import argparse
+
+    try:
+        from importlib.metadata import version
+        simp_sexp_version = version('simp_sexp')
+    except Exception:
+        simp_sexp_version = None
+
+    parser = argparse.ArgumentParser(description='Benchmark the LC4K core generator per device.')
+    parser.add_argument('sx', nargs='*', help='re4k device files (.sx) or directories, all of re4k by default')
+    parser.add_argument('-o', '--output', help='write results to this JSON file')
+    parser.add_argument('-b', '--baseline', help='JSON results of an earlier run to compare against')
+    parser.add_argument('-t', '--threshold', type=float, default=0.2,
+                        help='allowed relative regression against the baseline (default: 0.2)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='time regressions below this many seconds are ignored (default: 0.005)')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='runs per device, the best is taken')
+    parser.add_argument('--lookups', action='store_true', help='compare index lookups against Sexp.search() scans')
+    args = parser.parse_args()
+
+    files = find_sx_files(args.sx)
+    if not files:
+        sys.exit('no .sx files found')
+
+    if args.lookups:
+        main_lookups(files)
+        return
+
+    results = {
+        'version'   : results_version,
+        'python'    : platform.python_version(),
+        'simp_sexp' : simp_sexp_version,
+        'devices'   : {},
+    }
+
+    print(f"{'device':<20s} {'fusemap':>10s} {'parse':>8s} {'index':>8s} {'generate':>9s} {'ms/GLB':>7s} "
+          f"{'slowest emit':>30s} {'peak MB':>8s} {'lines':>8s} {'fm()':>7s}")
+    for filename in files:
+        name, result = bench_device(filename, max(1, args.repeat))
+        results['devices'][name] = result
+        slowest = max(result['emit'], key=result['emit'].get)
+        print(f"{name:<20s} {result['rows']:4d}x{result['columns']:<5d} {result['parse']:8.3f} {result['index']:8.3f} "
+              f"{result['generate']:9.3f} {1000 * result['generate'] / result['glbs']:7.1f} "
+              f"{slowest:>21s} {result['emit'][slowest]:8.3f} {result['peak_memory'] / 1e6:8.1f} "
+              f"{result['lines']:8d} {result['fm_refs']:7d}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+            f.write('\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for message in regressions:
+            print(f'REGRESSION {message}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#
+# JEDEC loader benchmark
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# bench_jedec.py [<jed file or dir> ...]
+#
+# Compares the bulk JEDEC loader of jedec.Jedec against the former
+# line/character based parser in time and fuse storage size. Without
+# arguments, synthetic JEDEC files of typical LC4K sizes are used.
+#
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+import jedec
+
+
+#
+# Loader as it was before bulk parsing, fuses are stored as list of str
+#
+def legacy_load(file):
+    fuse_data = []
+    number_of_fuses = 0
+    default_fuse_value = -1
+    got_asterisk = False
+    in_header = True
+    fuse_number = 0
+
+    with open(file, 'r') as fp:
+        for line in fp:
+            line = line.rstrip()
+            if line.startswith('*'):
+                if not got_asterisk:
+                    got_asterisk = True
+                    in_header = False
+                line = line[1:]
+            if line.endswith('*'):
+                got_asterisk = True
+                line = line[:-1]
+            words = line.split()
+
+            if in_header:
+                if got_asterisk:
+                    in_header = False
+
+            if not in_header:
+                while len(words) > 0:
+                    if words[0].startswith('*'):
+                        words[0] = words[0][1:]
+                    if words[0].endswith('*'):
+                        words[0] = words[0][:-1]
+
+                    if words[0].startswith('QP'):
+                        words.pop(0)
+                    elif words[0].startswith('F'):
+                        default_fuse_value = words[0][1:]
+                        words.pop(0)
+                        if number_of_fuses > 0 and default_fuse_value != -1:
+                            fuse_data = [default_fuse_value] * number_of_fuses
+                    elif words[0].startswith('QF'):
+                        number_of_fuses = int(words[0][2:])
+                        words.pop(0)
+                        if number_of_fuses > 0 and default_fuse_value != -1:
+                            fuse_data = [default_fuse_value] * number_of_fuses
+                    elif words[0].startswith('C'):
+                        words.pop(0)
+                    elif words[0].startswith('L'):
+                        fuse_number = int(words[0][1:])
+                        words.pop(0)
+                    elif words[0].startswith('0') or words[0].startswith('1'):
+                        data = words[0]
+                        words.pop(0)
+                        for v in data:
+                            fuse_data[fuse_number] = v
+                            fuse_number = fuse_number + 1
+                    elif words[0].startswith('N') or words[0].startswith('V'):
+                        words = []
+                    else:
+                        words.pop(0)
+
+    return fuse_data
+
+
+#
+# Synthetic JEDEC files
+#
+# fusemap rows x columns, as lc4k_device derives them from the device files
+synthetic_sizes = {
+    'LC4032': (100, 172),
+    'LC4064': (100, 356),
+    'LC4128': (100, 740),
+}
+
+def write_synthetic(filename, num_fuses, width=172, seed=1):
+    rnd = random.Random(seed)
+    jed = jedec.Jedec()
+    jed.fuse_data = ''.join('0' if rnd.random() < 0.05 else '1' for _ in range(num_fuses))
+    fuses = jed.fuse_data
+    with open(filename, 'w') as f:
+        f.write('\x02synthetic fusemap*\n')
+        f.write(f'QP100*\nQF{num_fuses}*\nG0*\nF0*\n')
+        for start in range(0, num_fuses, width):
+            f.write(f'L{start:06d}\n{fuses[start:start+width]}*\n')
+        f.write(f'C{jed.compute_checksum():04X}*\n')
+        f.write('\x030000\n')
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def best_of(n, func, *args):
+    runs = [timed(func, *args) for _ in range(n)]
+    return runs[0][0], min(seconds for result, seconds in runs)
+
+def load(file):
+    jed = jedec.Jedec()
+    jed.load(file)
+    return jed
+
+def main():
+    tmpdir = None
+    files = jedec.find_jed_files(sys.argv[1:])
+
+    if not sys.argv[1:]:
+        tmpdir = tempfile.TemporaryDirectory()
+        for name, (rows, columns) in synthetic_sizes.items():
+            filename = os.path.join(tmpdir.name, f'{name}.jed')
+            write_synthetic(filename, rows * columns, columns)
+            files.append(filename)
+
+    print(f"{'file':<20s} {'fuses':>8s} {'legacy':>9s} {'bulk':>9s} {'speedup':>8s} {'legacy mem':>11s} {'bulk mem':>9s}")
+    for filename in files:
+        legacy, t_legacy = best_of(3, legacy_load, filename)
+        jed, t_bulk = best_of(3, load, filename)
+        if list(jed.fuse_data) != legacy:
+            sys.exit(f'{filename}: loaders disagree')
+
+        mem_legacy = sys.getsizeof(legacy)
+        mem_bulk   = sys.getsizeof(jed.fuses)
+        print(f'{os.path.basename(filename):<20s} {len(jed.fuses):8d} {t_legacy:9.4f} {t_bulk:9.5f} '
+              f'{t_legacy / max(t_bulk, 1e-9):7.0f}x {mem_legacy:11d} {mem_bulk:9d}')
+
+    if tmpdir:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
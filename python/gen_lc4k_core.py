@@ -5,17 +5,27 @@
 #
 #
 
-def gen_fuse_vector(sexp):
-    outstr = ''
-    first = True
-    for fuse in sexp.search('fuse'):
-        if first: first = False
-        else:
-            outstr += ' & '
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+
+from lc4k_device import children, find_sx_files, lc4k_device, load_device
+from lc4k_fusemap import lc4k_fusemap
+
+
+# bump when the generated cores change without a change of the generator
+# sources, invalidates the manifests of generated cores
+version = 1
 
-        outstr += f'fm({fuse[1]}, {fuse[2]})'
+# version of the manifest format
+manifest_version = 1
 
-    return outstr
+
+def gen_fuse_vector(sexp):
+    return ' & '.join([f'fm({fuse[1]}, {fuse[2]})' for fuse in sexp.search('fuse')])
 
 def gen_fuse_vector_byvalue(sexp):
     values = {}
@@ -27,28 +37,10 @@ def gen_fuse_vector_byvalue(sexp):
             value = 1
         values[value] = gen_fuse_vector(fuse)
 
-    outstr = ''
-    first = True
-    for item in sorted(values, reverse=True):
-        if first: first = False
-        else:
-            outstr += (' & ')
-
-        outstr += values[item]
-
-    return outstr
+    return ' & '.join([values[item] for item in sorted(values, reverse=True)])
 
-def get_pin_of(pin_nr, sexp):
-    return sexp.search(lambda x: x[0] == 'pin' and x[1] == pin_nr)
-
-def get_glb_of(glb_nr, sexp):
-    return sexp.search(lambda x: x[0] == 'glb' and x[1] == glb_nr)
-
-def index_glb(index, sexp):
-    return sexp.search(lambda x: x[0] == 'glb' and x[1] == index)
-
-def index_mc(index, sexp):
-    return sexp.search(lambda x: x[0] == 'mc' and x[1] == index)
+def verilog_concat(refs):
+    return refs[0] if len(refs) == 1 else '{' + ', '.join(refs) + '}'
 
 def lookup_value_id(id, sexp):
     for value in sexp:
@@ -56,20 +48,73 @@ def lookup_value_id(id, sexp):
             return value[1]
     return -1
 
-def pin_match_glb_mc(glb, mc, pins):
-    for pin in pins:
-        g = pin.search('glb')
-        if g[0][1] == glb:
-            m = pin.search('mc')
-            if m[0][1] == mc:
-                return pin
-    return False
+
+class lc4k_writer():
+    '''
+    Output sink of the generator.
+
+    Fragments are collected and written to the target in large blocks. The
+    target is a file name, an open text stream (stdout, pipe, io.StringIO)
+    or None for an in-memory buffer that's read back with getvalue().
+    '''
+
+    __slots__ = ('stream', 'owned', 'block_size', 'fragments', 'size')
+
+    def __init__(self, target=None, block_size=1 << 20):
+        self.block_size = block_size
+        self.fragments  = []
+        self.size       = 0
+        self.owned      = False
+
+        if isinstance(target, (str, os.PathLike)):
+            self.stream = open(target, 'w', buffering=block_size)
+            self.owned  = True
+        else:
+            self.stream = target
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, text):
+        self.fragments.append(text)
+        self.size += len(text)
+        if self.size >= self.block_size and self.stream is not None:
+            self.flush()
+
+    def print(self, text='', end='\n'):
+        self.fragments.append(text)
+        self.fragments.append(end)
+        self.size += len(text) + len(end)
+        if self.size >= self.block_size and self.stream is not None:
+            self.flush()
+
+    def flush(self):
+        if self.stream is None:
+            return
+        if self.fragments:
+            self.stream.write(''.join(self.fragments))
+            self.fragments.clear()
+            self.size = 0
+        self.stream.flush()
+
+    def getvalue(self):
+        value = ''.join(self.fragments)
+        self.fragments = [value]
+        return value
+
+    def close(self):
+        self.flush()
+        if self.owned:
+            self.stream.close()
 
 
 
 class lc4k_generator():
 
-    __slots__ = ('num_mcs', 'num_gis', 'is_ze', 'num_rows', 'num_columns',
+    __slots__ = ('dev', 'out', 'num_mcs', 'num_gis', 'is_ze', 'num_rows', 'num_columns',
     'input_threshold_pins',
     'slew_rate_pins',
     'drive_type_pins',
@@ -78,35 +123,166 @@ class lc4k_generator():
 
 
     def __init__(self, sx):
-        def get_num_columns(sx):
-            gi_mux_size = len(sx.search('global_routing_pool/glb')[0].search('gi')[0].search('fuse'))
-            num_glbs = len(sx.search('global_routing_pool/glb'))
-            return int((gi_mux_size + 166) * (num_glbs / 2))
+        '''sx is the device's S-expression or its lc4k_device index.'''
+
+        # index the device once, all emit_* methods look up from here
+        self.dev = sx if isinstance(sx, lc4k_device) else lc4k_device(sx)
 
         # architectural constants
         self.num_mcs = 16
         self.num_gis = 36
 
-        osctimer = sx.search('osctimer')
-        if osctimer:
-            self.is_ze = True
-        else:
-            self.is_ze = False
+        self.is_ze = self.dev.is_ze
 
-        self.num_rows = sx.search('input_threshold/pin/fuse')[0][1]+1
-        self.num_columns = get_num_columns(sx)
+        self.num_rows = self.dev.num_rows
+        self.num_columns = self.dev.num_columns
 
         # cache some commonly used searches
-        self.input_threshold_pins       = sx.search('input_threshold/pin')
-        self.slew_rate_pins             = sx.search('slew_rate/pin')
-        self.drive_type_pins            = sx.search('drive_type/pin')
-        self.shared_pt_oe_glbs          = sx.search('shared_pt_oe_bus/glb')
-        self.global_routing_pool_glbs   = sx.search('global_routing_pool/glb')
+        self.input_threshold_pins       = self.dev.search('input_threshold/pin')
+        self.slew_rate_pins             = self.dev.search('slew_rate/pin')
+        self.drive_type_pins            = self.dev.search('drive_type/pin')
+        self.shared_pt_oe_glbs          = self.dev.search('shared_pt_oe_bus/glb')
+        self.global_routing_pool_glbs   = self.dev.search('global_routing_pool/glb')
+
+
+
+    def mark(self, name):
+        '''Start of section name within an emit_* block, hook for lc4k_profile.'''
+        pass
+
+    #
+    # Configuration, constants from the fusemap generic
+    #
+    # fusemap that the GRP and decode_pterms() read from
+    fusemap_vector = 'c_fusemap'
+
+    def entity_name(self, sx):
+        return f'{sx[0].lower()}_core'
+
+    def component(self, name):
+        return name
+
+    def config(self, name, type, value, indent='    '):
+        '''Declare configuration name of type with value from fuse_vector().'''
+        self.print(f'{indent}constant {name} : {type} := {value};')
+
+    def config_assignments(self):
+        '''Statements of the block's configuration, after its begin.'''
+        pass
+
+    def instance_maps(self, indent, configs, generics=(), ports=()):
+        '''
+        Generic map and start of the port map of a component instance.
+        configs and generics are (name, value), configs come from the
+        fusemap. ports are (name, value) of components with configuration
+        ports only.
+        '''
+        generics = list(generics) + list(configs)
+        width = max([len(name) for name, value in generics])
+        self.print(f'{indent}generic map (')
+        self.print(',\n'.join([f'{indent}  {name:<{width}s} => {value}' for name, value in generics]))
+        self.print(f'{indent})')
+        self.print(f'{indent}port map (')
+
+    def print_fusemap_generics(self):
+        self.print( '  generic (')
+        self.print(f"    g_fusemap       : std_logic_vector(0 to ({self.num_rows} * {self.num_columns}) - 1) := (others => '1');")
+        self.print( '    g_fusemap_zeros : string := ""')
+        self.print('  );')
+
+    def print_fusemap_ports(self):
+        pass
+
+    def print_gi_rows(self):
+        # PT fuse rows per GI, the same for all GLBs
+        gi_rows = self.pt_gi_rows()
+        self.print( '  constant c_gi_rows : gi_rows_t := (')
+        self.print(',\n'.join([f"    {gi:>2d} => ({gi_rows[gi]['normal']}, {gi_rows[gi]['inverted']})"
+                               for gi in range(0, self.num_gis)]))
+        self.print( '  );')
+        self.print()
+
+    def pt_gi_rows(self):
+        '''Fusemap rows of the normal and inverted PT inputs of each GI.'''
+        gi_rows = {}
+        for gi in self.dev.search('product_terms/gi'):
+            gi_rows[gi[1]] = {
+                'normal'   : gi.search(lambda x: x[0] == 'row' and x[2] == 'normal')[0][1],
+                'inverted' : gi.search(lambda x: x[0] == 'row' and x[2] == 'inverted')[0][1],
+            }
+        return gi_rows
+
+    def pt_columns(self, glbnum):
+        '''Fusemap columns of the PTs of GLB glbnum, 5 per macrocell followed by the shared PTs.'''
+        columns = []
+        for idx in range (0, self.num_mcs):
+            cols = {col[2]: col[1] for col in children(self.dev.mc('product_terms', glbnum, idx), 'column')}
+            columns += [cols[ptname] for ptname in ['pt0', 'pt1', 'pt2', 'pt3', 'pt4']]
+        cols = {col[2]: col[1] for col in children(self.dev.glb('product_terms', glbnum), 'column')}
+        columns += [cols[ptname] for ptname in ['shared_pt_clk', 'shared_pt_init', 'shared_pt_enable']]
+        return columns
+
+    def grp_sources(self):
+        '''GRP sources, the pins followed by the macrocells of all GLBs.'''
+        pins = [pin[1] for pin in self.input_threshold_pins]
+        glbs = [glb[1] for glb in self.global_routing_pool_glbs]
+        return [('pin', pin) for pin in pins] + \
+               [('glb', glb, mc) for glb in glbs for mc in range(0, self.num_mcs)]
+
+    def grp_muxes(self):
+        '''
+        Inputs of the GRP muxes as (row, column, source) per GLB and GI.
+        source indexes grp_sources(), it's -1 for an unused input.
+        '''
+        source_idx = {source: idx for idx, source in enumerate(self.grp_sources())}
+
+        # the mux inputs are the bulk of the device, read their entries
+        # directly instead of searching each fuse
+        def grp_mux(fuse):
+            attrs = {attr[0]: attr for attr in fuse[3:] if isinstance(attr, list) and attr}
+            if 'unused' in attrs:
+                source = -1
+            elif 'pin' in attrs:
+                source = source_idx[('pin', attrs['pin'][1])]
+            else:
+                source = source_idx[('glb', attrs['glb'][1], attrs['mc'][1])]
+            return (fuse[1], fuse[2], source)
+
+        muxes = {}
+        for glb in self.global_routing_pool_glbs:
+            self.mark(f'glb{glb[1]}')
+            muxes[glb[1]] = [[grp_mux(fuse) for fuse in children(gi, 'fuse')] for gi in children(glb, 'gi')]
+        return muxes
 
+    def clk_pins(self):
+        '''Pins of the clock inputs by clock number.'''
+        clkpins = {}
+        for pin in self.input_threshold_pins:
+            clkpin = pin.search(lambda x: x[0] == "clk")
+            if clkpin:
+                clkpins[clkpin[0][1]] = pin[1]
+        return clkpins
 
+    def oe_pins(self):
+        '''Pins of the global output enable inputs by OE number.'''
+        oepins = {}
+        for pin in self.input_threshold_pins:
+            oepin = pin.search(lambda x: x[0] == "oe")
+            if oepin:
+                oepins[oepin[0][1]] = pin[1]
+        return oepins
 
     def pin_is_out(self, pin_nr):
-        return get_pin_of(pin_nr, self.slew_rate_pins)
+        return self.dev.pin('slew_rate', pin_nr)
+
+    def print(self, text='', end='\n'):
+        self.out.print(text, end)
+
+    def fuse_vector(self, sexp):
+        return gen_fuse_vector(sexp)
+
+    def fuse_vector_byvalue(self, sexp):
+        return gen_fuse_vector_byvalue(sexp)
 
 
 
@@ -114,7 +290,7 @@ class lc4k_generator():
     # Entity
     #
     def emit_entity(self, sx):
-        print('''
+        self.print('''
 -- ----------------------------------------------------------------------------
 --
 -- LC4K Core
@@ -124,75 +300,79 @@ class lc4k_generator():
 -- ----------------------------------------------------------------------------
 ''')
 
-        print('''
+        self.print('''
 library ieee;
 use ieee.std_logic_1164.all;
 ''')
-        print(f'entity {sx[0].lower()}_core is')
-        print( '  generic (')
-        print(f'    g_fusemap : std_logic_vector(0 to ({self.num_rows} * {self.num_columns}) - 1)')
-        print('  );')
-        print('  port (')
+        self.print(f'entity {self.entity_name(sx)} is')
+        self.print_fusemap_generics()
+        self.print('  port (')
+        self.print_fusemap_ports()
 
         first = True
         for pin in self.input_threshold_pins:
             if first: first = False
             else:
-                print(';')
-                print( '    --')
+                self.print(';')
+                self.print( '    --')
 
             if self.pin_is_out(pin[1]):
-                print(f'    i_{str(pin[1]):<3s}  : in  std_logic;')
-                print(f'    o_{str(pin[1]):<3s}  : out std_logic;')
-                print(f'    oe_{str(pin[1]):<3s} : out std_logic', end='')
+                self.print(f'    i_{str(pin[1]):<3s}  : in  std_logic;')
+                self.print(f'    o_{str(pin[1]):<3s}  : out std_logic;')
+                self.print(f'    oe_{str(pin[1]):<3s} : out std_logic', end='')
             else:
-                print(f'    i_{str(pin[1]):<3s}  : in  std_logic', end='')
+                self.print(f'    i_{str(pin[1]):<3s}  : in  std_logic', end='')
             if self.is_ze:
-                print(';')
-                print(f'    pu_{str(pin[1]):<3s} : out std_logic;')
-                print(f'    pd_{str(pin[1]):<3s} : out std_logic;')
-                print(f'    kp_{str(pin[1]):<3s} : out std_logic', end='')
-        print(';')
-        print( '    --')
+                self.print(';')
+                self.print(f'    pu_{str(pin[1]):<3s} : out std_logic;')
+                self.print(f'    pd_{str(pin[1]):<3s} : out std_logic;')
+                self.print(f'    kp_{str(pin[1]):<3s} : out std_logic', end='')
+        self.print(';')
+        self.print( '    --')
 
         if not self.is_ze:
-            print( '    o_pu : out std_logic;')
-            print( '    o_pd : out std_logic;')
-            print( '    o_kp : out std_logic')
+            self.print( '    o_pu : out std_logic;')
+            self.print( '    o_pd : out std_logic;')
+            self.print( '    o_kp : out std_logic')
 
         else:
-            print( '    i_oscclk : in std_logic')
+            self.print( '    i_oscclk : in std_logic')
 
 
-        print('  );')
-        print('end;')
-        print()
+        self.print('  );')
+        self.print('end;')
+        self.print()
 
     #
     # Architecture header
     #
     def emit_architecture_header(self, sx):
-        print('''
+        self.print('''
 library ieee;
 use ieee.numeric_std.all;
 
 use work.lc4k_pack.all;
 ''')
-        print(f'architecture rtl of {sx[0].lower()}_core is')
-        print(f'''
+        self.print(f'architecture rtl of {self.entity_name(sx)} is')
+        self.print(f'''
+  -- dense fusemap, cleared at the fuses listed in g_fusemap_zeros
+  constant c_fusemap : std_logic_vector(0 to ({self.num_rows} * {self.num_columns}) - 1) :=
+    g_fusemap and decode_fusemap(g_fusemap_zeros, {self.num_rows} * {self.num_columns});
+
   function fm(row : in natural; column : in natural) return f_t is
   begin
-    return g_fusemap(row * {self.num_columns} + column);
+    return c_fusemap(row * {self.num_columns} + column);
   end;
 ''')
+        self.print_gi_rows()
 
     #
     # Toplevel constants
     #
     def emit_toplevel_constants(self, sx):
-        zht = sx.search('zero_hold_time')
-        print(f"  constant c_zht : f_t := {gen_fuse_vector(zht)};")
-        print()
+        zht = self.dev.search('zero_hold_time')
+        self.config('c_zht', 'f_t', self.fuse_vector(zht), '  ')
+        self.print()
 
 
     #
@@ -202,50 +382,50 @@ use work.lc4k_pack.all;
         # pin signals
         for pin in self.input_threshold_pins:
             if self.pin_is_out(pin[1]):
-                print(f'  signal orm_to_{pin[1]}, orm_oe_to_{pin[1]}, from_{pin[1]}_to_mc_grp : std_logic;')
+                self.print(f'  signal orm_to_{pin[1]}, orm_oe_to_{pin[1]}, from_{pin[1]}_to_mc_grp : std_logic;')
             else:
-                print(f'  signal from_{pin[1]}_to_mc_grp : std_logic;')
-        print()
+                self.print(f'  signal from_{pin[1]}_to_mc_grp : std_logic;')
+        self.print()
 
-        print('  signal ', end='')
+        self.print('  signal ', end='')
         first = True
         for glb in self.global_routing_pool_glbs:
             if first: first = False
             else:
-                print(', ', end='')
+                self.print(', ', end='')
 
-            print(f'glb{glb[1]}_mcs_to_grp', end='')
+            self.print(f'glb{glb[1]}_mcs_to_grp', end='')
 
-        print(f' : std_logic_vector(0 to {self.num_mcs-1});')
-        print()
+        self.print(f' : std_logic_vector(0 to {self.num_mcs-1});')
+        self.print()
 
-        print('  signal ', end='')
+        self.print('  signal ', end='')
         first = True
         for glb in self.global_routing_pool_glbs:
             if first: first = False
             else:
-                print(', ', end='')
+                self.print(', ', end='')
 
-            print(f'glb{glb[1]}_grp', end='')
+            self.print(f'glb{glb[1]}_grp', end='')
 
-        print(f' : std_logic_vector(0 to {self.num_gis-1});')
-        print()
+        self.print(f' : std_logic_vector(0 to {self.num_gis-1});')
+        self.print()
 
         # GLB shared PTOE outputs
-        print(f'  signal glb_shared_ptoes : std_logic_vector(0 to {len(self.shared_pt_oe_glbs)-1});')
-        print()
-        print('  signal goe : std_logic_vector(0 to 3);')
-        print()
+        self.print(f'  signal glb_shared_ptoes : std_logic_vector(0 to {len(self.shared_pt_oe_glbs)-1});')
+        self.print()
+        self.print('  signal goe : std_logic_vector(0 to 3);')
+        self.print()
 
         # OSCTIMER signals
         if self.is_ze:
-            print( "  signal oscout, timerout, dynoscdis, timerres : std_logic;")
-            print(f"  constant c_use_oscout   : boolean := {gen_fuse_vector(sx.search('osctimer/osc_out'))} = '0';")
-            print(f"  constant c_use_timerout : boolean := {gen_fuse_vector(sx.search('osctimer/timer_out'))} = '0';")
-            print()
+            self.print( "  signal oscout, timerout, dynoscdis, timerres : std_logic;")
+            self.config('c_use_oscout  ', 'boolean', f"{self.fuse_vector(self.dev.search('osctimer/osc_out'))} = '0'", '  ')
+            self.config('c_use_timerout', 'boolean', f"{self.fuse_vector(self.dev.search('osctimer/timer_out'))} = '0'", '  ')
+            self.print()
 
         #bus_maintenance_extra_fuses = sx.search('bus_maintenance_extra/fuse')
-        #print(f'  signal bus_maintenance_extra : std_logic_vector(0 to {len(bus_maintenance_extra_fuses)-1}) := {gen_fuse_vector(bus_maintenance_extra_fuses)};')
+        #print(f'  signal bus_maintenance_extra : std_logic_vector(0 to {len(bus_maintenance_extra_fuses)-1}) := {self.fuse_vector(bus_maintenance_extra_fuses)};')
         #print()
 
 
@@ -253,115 +433,107 @@ use work.lc4k_pack.all;
     # OSC/TIMER block
     #
     def emit_osctimer_block(self, sx):
-        print('''
+        self.print('''
   ----------------------------------------------------------------------------
   -- OSC/TIMER
   --
   osctimer_block : block
 ''')
 
-        print()
-        print( "    constant c_osctimer : osctimer_r := (")
-        print(f"      timer_div => {gen_fuse_vector(sx.search('osctimer/timer_div'))}")
-        print( "    );")
-        print()
+        self.print()
+        self.config('c_osctimer', 'osctimer_r', f"(\n      timer_div => {self.fuse_vector(self.dev.search('osctimer/timer_div'))}\n    )")
+        self.print()
 
-        print("  begin")
-        print()
+        self.print("  begin")
+        self.print()
+        self.config_assignments()
 
-        print("    no_osctimer : if not c_use_oscout and not c_use_timerout generate")
-        print("      oscout   <= '0';")
-        print("      timerout <= '0';")
-        print("    end generate no_osctimer;")
+        self.print("    no_osctimer : if not c_use_oscout and not c_use_timerout generate")
+        self.print("      oscout   <= '0';")
+        self.print("      timerout <= '0';")
+        self.print("    end generate no_osctimer;")
 
-        print("    --")
+        self.print("    --")
 
-        print("    inst_osctimer : if c_use_oscout or c_use_timerout generate")
-        print("      osctimer_b : entity work.lc4k_osctimer")
-        print("        generic map (")
-        print("          g_config => c_osctimer")
-        print("        )")
-        print("        port map (")
-        print("          i_oscclk    => i_oscclk,")
-        print("          i_dynoscdis => dynoscdis,")
-        print("          i_timerres  => timerres,")
-        print("          o_oscout    => oscout,")
-        print("          o_timerout  => timerout")
-        print("        );")
-        print("    end generate inst_osctimer;")
+        self.print("    inst_osctimer : if c_use_oscout or c_use_timerout generate")
+        self.print(f"      osctimer_b : entity work.{self.component('lc4k_osctimer')}")
+        self.instance_maps('        ', [('g_config', 'c_osctimer')])
+        self.print("          i_oscclk    => i_oscclk,")
+        self.print("          i_dynoscdis => dynoscdis,")
+        self.print("          i_timerres  => timerres,")
+        self.print("          o_oscout    => oscout,")
+        self.print("          o_timerout  => timerout")
+        self.print("        );")
+        self.print("    end generate inst_osctimer;")
 
-        print()
-        print("  end block;")
-        print()
+        self.print()
+        self.print("  end block;")
+        self.print()
 
 
     #
     # Global output enable block
     #
     def emit_goe_block(self, sx):
-        if sx.search('goe_source'):
+        if self.dev.search('goe_source'):
             num_internal_ptoes = 4
         else:
             num_internal_ptoes = 2
 
-        print('''
+        self.print('''
   ----------------------------------------------------------------------------
   -- Global Output Enable
   --
   goe_block : block
 ''')
 
-        source = sx.search('goe_source')
+        source = self.dev.search('goe_source')
         if source:
-            print('    signal int_goe_0, int_goe_1 : std_logic;')
-            print()
+            self.print('    signal int_goe_0, int_goe_1 : std_logic;')
+            self.print()
 
         # internal shared pt oe bus
-        print(f'    signal shared_ptoes : std_logic_vector(0 to {num_internal_ptoes-1});')
+        self.print(f'    signal shared_ptoes : std_logic_vector(0 to {num_internal_ptoes-1});')
 
-        print()
-        print('  begin')
-        print()
+        self.print()
+        self.print('  begin')
+        self.print()
 
         # build internal shared PT OE bus
         for idx in range(0, num_internal_ptoes):
-            print    (f"    shared_ptoes({idx}) <=")
+            self.print    (f"    shared_ptoes({idx}) <=")
             for glb in self.shared_pt_oe_glbs:
-                print(f"      glb_shared_ptoes({glb[1]}) when {gen_fuse_vector(glb.search(f'goe{idx}'))} = '0' else")
-            print    (f"      '1';")
-            print()
+                self.print(f"      glb_shared_ptoes({glb[1]}) when {self.fuse_vector(glb.search(f'goe{idx}'))} = '0' else")
+            self.print    (f"      '1';")
+            self.print()
 
-        # search pins with oe functionality
-        oepins = {}
-        for pin in self.input_threshold_pins:
-            oepin = pin.search(lambda x: x[0] == "oe")
-            if oepin:
-                oepins[oepin[0][1]] = pin[1]
+        # pins with oe functionality
+        oepins = self.oe_pins()
 
-        polarity = sx.search('goe_polarity')
+        polarity = self.dev.search('goe_polarity')
         if source:
-            print(f"    int_goe_0 <= i_{oepins[0]} when {gen_fuse_vector(source.search('goe0/fuse'))} = '0' else shared_ptoes(0);")
-            print(f"    int_goe_1 <= i_{oepins[1]} when {gen_fuse_vector(source.search('goe1/fuse'))} = '0' else shared_ptoes(1);")
-            print(f"    goe(0) <= not int_goe_0       when {gen_fuse_vector(polarity.search('goe0/fuse'))} = '0' else int_goe_0;")
-            print(f"    goe(1) <= not int_goe_1       when {gen_fuse_vector(polarity.search('goe1/fuse'))} = '0' else int_goe_1;")
-            print(f"    goe(2) <= not shared_ptoes(2) when {gen_fuse_vector(polarity.search('goe2/fuse'))} = '0' else shared_ptoes(2);")
-            print(f"    goe(3) <= not shared_ptoes(3) when {gen_fuse_vector(polarity.search('goe3/fuse'))} = '0' else shared_ptoes(3);")
+            self.print(f"    int_goe_0 <= i_{oepins[0]} when {self.fuse_vector(source.search('goe0/fuse'))} = '0' else shared_ptoes(0);")
+            self.print(f"    int_goe_1 <= i_{oepins[1]} when {self.fuse_vector(source.search('goe1/fuse'))} = '0' else shared_ptoes(1);")
+            self.print(f"    goe(0) <= not int_goe_0       when {self.fuse_vector(polarity.search('goe0/fuse'))} = '0' else int_goe_0;")
+            self.print(f"    goe(1) <= not int_goe_1       when {self.fuse_vector(polarity.search('goe1/fuse'))} = '0' else int_goe_1;")
+            self.print(f"    goe(2) <= not shared_ptoes(2) when {self.fuse_vector(polarity.search('goe2/fuse'))} = '0' else shared_ptoes(2);")
+            self.print(f"    goe(3) <= not shared_ptoes(3) when {self.fuse_vector(polarity.search('goe3/fuse'))} = '0' else shared_ptoes(3);")
         else:
-            print(f"    goe(0) <= not shared_ptoes(0) when {gen_fuse_vector(polarity.search('goe0/fuse'))} = '0' else shared_ptoes(0);")
-            print(f"    goe(1) <= not shared_ptoes(1) when {gen_fuse_vector(polarity.search('goe1/fuse'))} = '0' else shared_ptoes(1);")
-            print(f"    goe(2) <= not i_{oepins[0]} when {gen_fuse_vector(polarity.search('goe2/fuse'))} = '0' else i_{oepins[0]};")
-            print(f"    goe(3) <= not i_{oepins[1]} when {gen_fuse_vector(polarity.search('goe3/fuse'))} = '0' else i_{oepins[1]};")
-        print()
+            self.print(f"    goe(0) <= not shared_ptoes(0) when {self.fuse_vector(polarity.search('goe0/fuse'))} = '0' else shared_ptoes(0);")
+            self.print(f"    goe(1) <= not shared_ptoes(1) when {self.fuse_vector(polarity.search('goe1/fuse'))} = '0' else shared_ptoes(1);")
+            self.print(f"    goe(2) <= not i_{oepins[0]} when {self.fuse_vector(polarity.search('goe2/fuse'))} = '0' else i_{oepins[0]};")
+            self.print(f"    goe(3) <= not i_{oepins[1]} when {self.fuse_vector(polarity.search('goe3/fuse'))} = '0' else i_{oepins[1]};")
+        self.print()
 
-        print('  end block;')
-        print()
+        self.print('  end block;')
+        self.print()
 
 
     #
     # IO Cell block
     #
     def emit_io_cell_block(self, sx):
-        print('''
+        self.print('''
   ----------------------------------------------------------------------------
   -- IO Cells
   --
@@ -371,120 +543,88 @@ use work.lc4k_pack.all;
         # generate constants for io cells
 
         if not self.is_ze:
-            print(f'    constant c_bus_maintenance : fv_t(0 to 1) := {gen_fuse_vector(sx.search('bus_maintenance/fuse'))};')
+            self.config('c_bus_maintenance', 'fv_t(0 to 1)', self.fuse_vector(self.dev.search('bus_maintenance/fuse')))
 
-        output_enable_source_pins  = sx.search('output_enable_source/pin')
-        bus_maintenance_pins       = sx.search('bus_maintenance/pin')
         for pin in self.input_threshold_pins:
             if self.pin_is_out(pin[1]):
-                print(f'    constant c_io_cell_{pin[1]} : io_cell_r := (')
-                print(f'      oe_source       => {gen_fuse_vector(get_pin_of(pin[1], output_enable_source_pins))},')
-                print(f'      drive_type      => {gen_fuse_vector(get_pin_of(pin[1], self.drive_type_pins))},')
-                print(f'      slew_rate       => {gen_fuse_vector(get_pin_of(pin[1], self.slew_rate_pins))},')
-                print(f'      input_threshold => {gen_fuse_vector(get_pin_of(pin[1], self.input_threshold_pins))}')
-                print( '    );')
+                self.config(f'c_io_cell_{pin[1]}', 'io_cell_r', '(\n' +
+                            f"      oe_source       => {self.fuse_vector(self.dev.pin('output_enable_source', pin[1]))},\n" +
+                            f"      drive_type      => {self.fuse_vector(self.dev.pin('drive_type', pin[1]))},\n" +
+                            f"      slew_rate       => {self.fuse_vector(self.dev.pin('slew_rate', pin[1]))},\n" +
+                            f"      input_threshold => {self.fuse_vector(self.dev.pin('input_threshold', pin[1]))}\n" +
+                             '    )')
 
             else:
-                print(f'    constant c_in_cell_{pin[1]} : f_t := {gen_fuse_vector(pin)};')
+                self.config(f'c_in_cell_{pin[1]}', 'f_t', self.fuse_vector(pin))
 
             if self.is_ze:
-                print(f'    constant c_bus_maintenance_{pin[1]} : fv_t := {gen_fuse_vector(get_pin_of(pin[1], bus_maintenance_pins))};')
+                self.config(f'c_bus_maintenance_{pin[1]}', 'fv_t(0 to 1)', self.fuse_vector(self.dev.pin('bus_maintenance', pin[1])))
 
-        print()
+        self.print()
 
-        print('  begin')
-        print()
+        self.print('  begin')
+        self.print()
+        self.config_assignments()
 
         if not self.is_ze:
-            print(f"    o_pu <= '1' when c_bus_maintenance = \"11\" else '0';")
-            print(f"    o_pd <= '1' when c_bus_maintenance = \"00\" else '0';")
-            print(f"    o_kp <= '1' when c_bus_maintenance = \"01\" else '0';")
-            print()
+            self.print(f"    o_pu <= '1' when c_bus_maintenance = \"11\" else '0';")
+            self.print(f"    o_pd <= '1' when c_bus_maintenance = \"00\" else '0';")
+            self.print(f"    o_kp <= '1' when c_bus_maintenance = \"01\" else '0';")
+            self.print()
 
-        power_guard_pins = sx.search('power_guard/pin')
         for pin in self.input_threshold_pins:
             if self.pin_is_out(pin[1]):
+                configs = [('g_io_cell', f'c_io_cell_{pin[1]}')]
                 if self.is_ze:
-                    print(f'    io_cell_{pin[1]}_b : entity work.lc4k_ze_io_cell')
+                    self.print(f"    io_cell_{pin[1]}_b : entity work.{self.component('lc4k_ze_io_cell')}")
+                    configs = [('g_bus_maintenance', f'c_bus_maintenance_{pin[1]}'),
+                               ('g_pgdf', self.fuse_vector(self.dev.pin('power_guard', pin[1])))] + configs
                 else:
-                    print(f'    io_cell_{pin[1]}_b : entity work.lc4k_io_cell')
-                print( '       generic map (')
-                if self.is_ze:
-                    print(f'         g_bus_maintenance => c_bus_maintenance_{pin[1]},')
-                    print(f'         g_pgdf => {gen_fuse_vector(get_pin_of(pin[1], power_guard_pins))},')
-                print(f'         g_io_cell => c_io_cell_{pin[1]}')
-                print( '       )')
-                print( '       port map (')
-                print(f'         i_pin    => i_{pin[1]},')
-                print(f'         o_pin    => o_{pin[1]},')
-                print(f'         o_pin_oe => oe_{pin[1]},')
-                print(f'         i_orm    => orm_to_{pin[1]},')
-                print(f'         i_orm_oe => orm_oe_to_{pin[1]},')
-                print( '         i_goe    => goe,')
-                print(f'         o_mc_grp => from_{pin[1]}_to_mc_grp', end='')
+                    self.print(f"    io_cell_{pin[1]}_b : entity work.{self.component('lc4k_io_cell')}")
+                self.instance_maps('       ', configs)
+                self.print(f'         i_pin    => i_{pin[1]},')
+                self.print(f'         o_pin    => o_{pin[1]},')
+                self.print(f'         o_pin_oe => oe_{pin[1]},')
+                self.print(f'         i_orm    => orm_to_{pin[1]},')
+                self.print(f'         i_orm_oe => orm_oe_to_{pin[1]},')
+                self.print( '         i_goe    => goe,')
+                self.print(f'         o_mc_grp => from_{pin[1]}_to_mc_grp', end='')
 
             else:
+                configs = [('g_input_threshold', f'c_in_cell_{pin[1]}')]
                 if self.is_ze:
-                    print(f'    in_cell_{pin[1]}_b : entity work.lc4k_ze_in_cell')
+                    self.print(f"    in_cell_{pin[1]}_b : entity work.{self.component('lc4k_ze_in_cell')}")
+                    configs = [('g_bus_maintenance', f'c_bus_maintenance_{pin[1]}'),
+                               ('g_pgdf', self.fuse_vector(self.dev.pin('power_guard', pin[1])))] + configs
                 else:
-                    print(f'    in_cell_{pin[1]}_b : entity work.lc4k_in_cell')
-                print( '       generic map (')
-                if self.is_ze:
-                    print(f'         g_bus_maintenance => c_bus_maintenance_{pin[1]},')
-                    print(f'         g_pgdf => {gen_fuse_vector(get_pin_of(pin[1], power_guard_pins))},')
-                print(f'         g_input_threshold => c_in_cell_{pin[1]}')
-                print( '       )')
-                print( '       port map (')
-                print(f'         i_pin    => i_{pin[1]},')
-                print(f'         o_mc_grp => from_{pin[1]}_to_mc_grp', end='')
+                    self.print(f"    in_cell_{pin[1]}_b : entity work.{self.component('lc4k_in_cell')}")
+                self.instance_maps('       ', configs)
+                self.print(f'         i_pin    => i_{pin[1]},')
+                self.print(f'         o_mc_grp => from_{pin[1]}_to_mc_grp', end='')
 
             if self.is_ze:
-                print(',')
-                print(f'         o_pin_pu => pu_{pin[1]},')
-                print(f'         o_pin_pd => pd_{pin[1]},')
-                print(f'         o_pin_kp => kp_{pin[1]},')
-                print(f'         i_bie    => glb_shared_ptoes({get_pin_of(pin[1], power_guard_pins).search('glb')[0][1]})', end='')
-            print()
-            print( '       );')
-            print()
+                self.print(',')
+                self.print(f'         o_pin_pu => pu_{pin[1]},')
+                self.print(f'         o_pin_pd => pd_{pin[1]},')
+                self.print(f'         o_pin_kp => kp_{pin[1]},')
+                self.print(f'         i_bie    => glb_shared_ptoes({self.dev.pin('power_guard', pin[1]).search('glb')[0][1]})', end='')
+            self.print()
+            self.print( '       );')
+            self.print()
 
-        print('  end block;')
-        print()
+        self.print('  end block;')
+        self.print()
 
 
     def emit_glb_block(self, sx):
-        clkpins = {}
-        for pin in self.input_threshold_pins:
-            clkpin = pin.search(lambda x: x[0] == "clk")
-            if clkpin:
-                clkpins[clkpin[0][1]] = pin[1]
+        clkpins = self.clk_pins()
 
-        #
-        # Extract Product Term GI rows
-        #
-        pt_gis = sx.search('product_terms/gi')
-        gi_rows = {}
-        for gi in pt_gis:
-            obj = {}
-            gi_rows[gi[1]] = obj
-            obj['normal'] = gi.search(lambda x: x[0] == 'row' and x[2] == 'normal')[0][1]
-            obj['inverted'] = gi.search(lambda x: x[0] == 'row' and x[2] == 'inverted')[0][1]
-
-
-        wide_routing_values = sx.search('wide_routing/value')
-        wide_routing_glbs = sx.search('wide_routing/glb')
-        cluster_routing_values = sx.search('cluster_routing/value')
-        cluster_routing_glbs = sx.search('cluster_routing/glb')
-        shared_pt_clk_polarity_glbs = sx.search('shared_pt_clk_polarity/glb')
-        shared_pt_init_polarity_glbs = sx.search('shared_pt_init_polarity/glb')
-        product_terms_glbs = sx.search('product_terms/glb')
-        output_routing_pins = sx.search('output_routing/pin')
-        output_routing_mode_pins = sx.search('output_routing_mode/pin')
-        output_routing_mode_values = sx.search('output_routing_mode/value')
-        for glb in sx.search('bclk_polarity/glb'):
+        output_routing_mode_values = self.dev.search('output_routing_mode/value')
+        for glb in self.dev.search('bclk_polarity/glb'):
             glbnum = glb[1]
+            self.mark(f'glb{glbnum}')
 
-            print(f'''
+            self.print(f'''
   ----------------------------------------------------------------------------
   -- Generic Logic Block {glbnum}
   --
@@ -494,233 +634,150 @@ use work.lc4k_pack.all;
             #
             # Determine ZE type OSC/TIMER configuration
             #
-            is_ze_osc_glb = False
-            is_ze_tim_glb = False
-            if self.is_ze:
-                if (
-                           ('4032' in sx[0] and glbnum == 0)  # GLB A
-                        or ('4064' in sx[0] and glbnum == 0)  # GLB A
-                        or ('4128' in sx[0] and glbnum == 0)  # GLB A
-                        or ('4256' in sx[0] and glbnum == 2)  # GLB C
-                   ):
-                    is_ze_osc_glb = True
-                elif (
-                           ('4032' in sx[0] and glbnum == 1)  # GLB B
-                        or ('4064' in sx[0] and glbnum == 3)  # GLB D
-                        or ('4128' in sx[0] and glbnum == 6)  # GLB G
-                        or ('4256' in sx[0] and glbnum == 5)  # GLB F
-                   ):
-                    is_ze_tim_glb = True
+            is_ze_osc_glb = self.is_ze and glbnum == self.dev.osc_glb
+            is_ze_tim_glb = self.is_ze and glbnum == self.dev.timer_glb
 
             #
             # Generate GLB config
             #
-            print( '    constant c_glb_config : glb_r := (')
-            for clks in glb.search('clk'):
-                print(f"      bclk{clks[1]}{clks[2]}_polarity => {gen_fuse_vector(clks)},")
-            print(    f"      shared_pt_clk_polarity  => {gen_fuse_vector(index_glb(glbnum, shared_pt_clk_polarity_glbs))},")
-            print(    f"      shared_pt_init_polarity => {gen_fuse_vector(index_glb(glbnum, shared_pt_init_polarity_glbs))});")
-            print()
+            lines = [f"      bclk{clks[1]}{clks[2]}_polarity => {self.fuse_vector(clks)}," for clks in glb.search('clk')]
+            lines.append(f"      shared_pt_clk_polarity  => {self.fuse_vector(self.dev.glb('shared_pt_clk_polarity', glbnum))},")
+            lines.append(f"      shared_pt_init_polarity => {self.fuse_vector(self.dev.glb('shared_pt_init_polarity', glbnum))}")
+            self.config('c_glb_config', 'glb_r', '(\n' + '\n'.join(lines) + ')')
+            self.print()
 
             #
             # Generate config for 16 Enhanced Logic Allocators
             #
-            cluster_routing_mcs     = index_glb(glbnum, sx.search('cluster_routing/glb')).search('mc')
-            wide_routing_mcs        = index_glb(glbnum, sx.search('wide_routing/glb')).search('mc')
-            pt0_xor_mcs             = index_glb(glbnum, sx.search('pt0_xor/glb')).search('mc')
-            clock_source_mcs        = index_glb(glbnum, sx.search('clock_source/glb')).search('mc')
-            clock_enable_source_mcs = index_glb(glbnum, sx.search('clock_enable_source/glb')).search('mc')
-            async_source_mcs        = index_glb(glbnum, sx.search('async_source/glb')).search('mc')
-            init_source_mcs         = index_glb(glbnum, sx.search('init_source/glb')).search('mc')
-            pt4_output_enable_mcs   = index_glb(glbnum, sx.search('pt4_output_enable/glb')).search('mc')
-            print( '    constant c_elas_config : elas_t := (')
-            first = True
+            def mc_fuses(feature, idx):
+                return self.fuse_vector(self.dev.mc(feature, glbnum, idx))
+
+            elas = []
             for idx in range(0, self.num_mcs):
-                if first: first = False
-                else:
-                    print(',')
-
-                print(f"      {idx} => (")
-                print(f"        cluster_routing     => {gen_fuse_vector(index_mc(idx, cluster_routing_mcs))},")
-                print(f"        wide_routing        => {gen_fuse_vector(index_mc(idx, wide_routing_mcs))},")
-                print(f"        pt0_xor             => {gen_fuse_vector(index_mc(idx, pt0_xor_mcs))},")
-                print(f"        clock_source        => {gen_fuse_vector(index_mc(idx, clock_source_mcs))},")
-                print(f"        clock_enable_source => {gen_fuse_vector(index_mc(idx, clock_enable_source_mcs))},")
-                print(f"        async_source        => {gen_fuse_vector(index_mc(idx, async_source_mcs))},")
-                print(f"        init_source         => {gen_fuse_vector(index_mc(idx, init_source_mcs))},")
-                print(f"        pt4_output_enable   => {gen_fuse_vector(index_mc(idx, pt4_output_enable_mcs))}")
-                print( "      )", end='')
-            print()
-            print("    );")
-            print()
+                elas.append(f"      {idx} => (\n"
+                            f"        cluster_routing     => {mc_fuses('cluster_routing', idx)},\n"
+                            f"        wide_routing        => {mc_fuses('wide_routing', idx)},\n"
+                            f"        pt0_xor             => {mc_fuses('pt0_xor', idx)},\n"
+                            f"        clock_source        => {mc_fuses('clock_source', idx)},\n"
+                            f"        clock_enable_source => {mc_fuses('clock_enable_source', idx)},\n"
+                            f"        async_source        => {mc_fuses('async_source', idx)},\n"
+                            f"        init_source         => {mc_fuses('init_source', idx)},\n"
+                            f"        pt4_output_enable   => {mc_fuses('pt4_output_enable', idx)}\n"
+                             "      )")
+            self.config('c_elas_config', 'elas_t', '(\n' + ',\n'.join(elas) + '\n    )')
+            self.print()
 
             #
             # Generate config for 16 Macrocells
             #
-            init_state_mcs         = index_glb(glbnum, sx.search('init_state/glb')).search('mc')
-            init_source_mcs        = index_glb(glbnum, sx.search('init_source/glb')).search('mc')
-            async_source_mcs       = index_glb(glbnum, sx.search('async_source/glb')).search('mc')
-            input_bypass_pins      = sx.search('macrocell_data/pin')
-            invert_mcs             = index_glb(glbnum, sx.search('invert/glb')).search('mc')
-            macrocell_function_mcs = index_glb(glbnum, sx.search('macrocell_function/glb')).search('mc')
-            print( '    constant c_macrocells_config : macrocells_t := (')
-            first = True
+            mcs = []
             for idx in range(0, self.num_mcs):
-                if first: first = False
-                else:
-                    print(',')
-
-                print(f"      {idx} => (")
-                print(f"        init_state          => {gen_fuse_vector(index_mc(idx, init_state_mcs))},")
-                print(f"        init_source         => {gen_fuse_vector(index_mc(idx, init_source_mcs))},")
-                print(f"        async_source        => {gen_fuse_vector(index_mc(idx, async_source_mcs))},")
-                print(f"        input_bypass        => ", end='')
-                input_bypass = pin_match_glb_mc(glbnum, idx, input_bypass_pins)
-                if input_bypass:
-                    print(f"{gen_fuse_vector(input_bypass)},")
-                else:
-                    print("'1',")
-                print(f"        invert              => {gen_fuse_vector(index_mc(idx, invert_mcs))},")
-                print(f"        clock_enable_source => {gen_fuse_vector(index_mc(idx, clock_enable_source_mcs))},")
-                print(f"        clock_source        => {gen_fuse_vector(index_mc(idx, clock_source_mcs))},")
-                print(f"        macrocell_function  => {gen_fuse_vector(index_mc(idx, macrocell_function_mcs))}")
-                print( "      )", end='')
-            print()
-            print("    );")
-            print()
+                input_bypass = self.dev.pin_at('macrocell_data', glbnum, idx)
+                input_bypass = self.fuse_vector(input_bypass) if input_bypass else "'1'"
+                mcs.append(f"      {idx} => (\n"
+                           f"        init_state          => {mc_fuses('init_state', idx)},\n"
+                           f"        init_source         => {mc_fuses('init_source', idx)},\n"
+                           f"        async_source        => {mc_fuses('async_source', idx)},\n"
+                           f"        input_bypass        => {input_bypass},\n"
+                           f"        invert              => {mc_fuses('invert', idx)},\n"
+                           f"        clock_enable_source => {mc_fuses('clock_enable_source', idx)},\n"
+                           f"        clock_source        => {mc_fuses('clock_source', idx)},\n"
+                           f"        macrocell_function  => {mc_fuses('macrocell_function', idx)}\n"
+                            "      )")
+            self.config('c_macrocells_config', 'macrocells_t', '(\n' + ',\n'.join(mcs) + '\n    )')
+            self.print()
 
             #
-            # Generate config for Product Terms
+            # Generate config for Product Terms, from the PT columns and
+            # the device's GI rows
             #
-            def emit_pterm(pt_idx, col):
-                print(f"      {pt_idx} => (")
-                print(f"        normal => ", end='')
-                first = True
-                for row in range(0, self.num_gis):
-                    if first: first = False
-                    else:
-                        print(' & ', end='')
-                    print(f"fm({gi_rows[row]['normal']}, {col})", end='')
-
-                print(',')
-                print(f"        invert => ", end='')
-                first = True
-                for row in range(0, self.num_gis):
-                    if first: first = False
-                    else:
-                        print(' & ', end='')
-
-                    print(f"fm({gi_rows[row]['inverted']}, {col})", end='')
-
-                print('')
-                print( "      )", end='')
-
-
-            pterms_glb = index_glb(glbnum, product_terms_glbs)
-            pterms_mcs = pterms_glb.search('mc')
-            print( '    constant c_pterms_config : pterms_t := (')
-            pt_idx = 0
-            for idx in range (0, self.num_mcs):
-                cols = index_mc(idx, pterms_mcs).search('column')
-                for ptname in ['pt0', 'pt1', 'pt2', 'pt3', 'pt4']:
-                    col = cols.search(lambda x: x[2] == ptname)[0][1]
-                    emit_pterm(pt_idx, col)
-                    print(',')
-                    pt_idx += 1
-            cols = pterms_glb.search('column')
-            first = True
-            for ptname in ['shared_pt_clk', 'shared_pt_init', 'shared_pt_enable']:
-                if first: first = False
-                else:
-                    print(',')
-
-                col = cols.search(lambda x: x[0] == 'column' and x[2] == ptname)[0][1]
-                emit_pterm(pt_idx, col)
-                pt_idx += 1
-
-            print()
-            print("    );")
-            print()
-
-            print('    signal io2mcs, mcs2orp, f5pts2orp, ptoes2orp : std_logic_vector(0 to num_mcs-1);')
-            print('    signal ptoe2orp : std_logic;')
-            print()
+            columns = self.pt_columns(glbnum)
+            self.print( '    constant c_pt_columns : pt_columns_t := (')
+            self.print(',\n'.join(['      ' + ', '.join([str(col) for col in columns[idx:idx+5]])
+                                   for idx in range(0, len(columns), 5)]))
+            self.print( '    );')
+            self.print()
+            self.config('c_pterms_config', 'pterms_t',
+                        f'decode_pterms({self.fusemap_vector}, {self.num_columns}, c_gi_rows, c_pt_columns)')
+            self.print()
+
+            self.print('    signal io2mcs, mcs2orp, f5pts2orp, ptoes2orp : std_logic_vector(0 to num_mcs-1);')
+            self.print('    signal ptoe2orp : std_logic;')
+            self.print()
 
             # For ZE OSC/TIMER MUX
             if is_ze_osc_glb or is_ze_tim_glb:
-                print('    signal osctimer : std_logic;')
-                print()
-
-            print()
-            print('  begin')
-            print()
+                self.print('    signal osctimer : std_logic;')
+                self.print()
 
+            self.print()
+            self.print('  begin')
+            self.print()
+            self.config_assignments()
 
-            print( '    io2mcs <= (')
+            self.print( '    io2mcs <= (')
             for idx in range(0, self.num_mcs):
-                input_bypass = pin_match_glb_mc(glbnum, idx, input_bypass_pins)
+                input_bypass = self.dev.pin_at('macrocell_data', glbnum, idx)
                 if input_bypass:
-                    print(f"      {idx} => from_{input_bypass[1]}_to_mc_grp,")
-            print("      others => '0');")
-            print()
+                    self.print(f"      {idx} => from_{input_bypass[1]}_to_mc_grp,")
+            self.print("      others => '0');")
+            self.print()
 
             #
             # Instantiate GLB
             #
-            print( '    glb_b : entity work.lc4k_glb')
-            print( '      generic map (')
-            print( '        g_config => c_glb_config,')
-            print( '        g_pts    => c_pterms_config,')
-            print( '        g_mcs    => c_macrocells_config,')
-            print( '        g_elas   => c_elas_config,')
-            print( '        g_zht    => c_zht')
-            print( '      )')
-            print( '      port map (')
-            print(f'        i_clk0  => from_{clkpins[0]}_to_mc_grp,')
-            print( '        i_clk1  => ', end='')
+            self.print(f"    glb_b : entity work.{self.component('lc4k_glb')}")
+            self.instance_maps('      ', [('g_config', 'c_glb_config'),
+                                          ('g_pts',    'c_pterms_config'),
+                                          ('g_mcs',    'c_macrocells_config'),
+                                          ('g_elas',   'c_elas_config'),
+                                          ('g_zht',    'c_zht')],
+                               ports=[('i_por', 'i_por')])
+            self.print(f'        i_clk0  => from_{clkpins[0]}_to_mc_grp,')
+            self.print( '        i_clk1  => ', end='')
             if 1 in clkpins:
-                print(f'from_{clkpins[1]}_to_mc_grp,')
+                self.print(f'from_{clkpins[1]}_to_mc_grp,')
             else:
-                print( "'0',")
-            print(f'        i_clk2  => from_{clkpins[2]}_to_mc_grp,')
-            print( '        i_clk3  => ', end='')
+                self.print( "'0',")
+            self.print(f'        i_clk2  => from_{clkpins[2]}_to_mc_grp,')
+            self.print( '        i_clk3  => ', end='')
             if 3 in clkpins:
-                print(f'from_{clkpins[3]}_to_mc_grp,')
+                self.print(f'from_{clkpins[3]}_to_mc_grp,')
             else:
-                print( "'0',")
-            print(f"        i_grp   => glb{glbnum}_grp,")
-            print( "        i_ios   => io2mcs,")
-            print( "        o_mcs   => mcs2orp,")
-            print( "        o_5pts  => f5pts2orp,")
-            print( "        o_ptoes => ptoes2orp,")
-            print(f"        o_shared_ptoe => glb_shared_ptoes({glbnum})")
-            print( "      );")
+                self.print( "'0',")
+            self.print(f"        i_grp   => glb{glbnum}_grp,")
+            self.print( "        i_ios   => io2mcs,")
+            self.print( "        o_mcs   => mcs2orp,")
+            self.print( "        o_5pts  => f5pts2orp,")
+            self.print( "        o_ptoes => ptoes2orp,")
+            self.print(f"        o_shared_ptoe => glb_shared_ptoes({glbnum})")
+            self.print( "      );")
 
             # Insert ZE OSC/TIMER MUX
             if is_ze_osc_glb or is_ze_tim_glb:
-                print()
-                print(f"      glb{glbnum}_mcs_to_grp <= (")
+                self.print()
+                self.print(f"      glb{glbnum}_mcs_to_grp <= (")
                 for idx in range(0, self.num_mcs-1):
-                    print(f"        {idx} => mcs2orp({idx}),")
-                print("        15 => osctimer);")
+                    self.print(f"        {idx} => mcs2orp({idx}),")
+                self.print("        15 => osctimer);")
                 if is_ze_osc_glb:
-                    print( "      osctimer  <= oscout when c_use_oscout else mcs2orp(15);")
-                    print(f"      dynoscdis <= mcs2orp(15) when {gen_fuse_vector(sx.search('osctimer/enable'))} = '0' else '0';")
+                    self.print( "      osctimer  <= oscout when c_use_oscout else mcs2orp(15);")
+                    self.print(f"      dynoscdis <= mcs2orp(15) when {self.fuse_vector(self.dev.search('osctimer/enable'))} = '0' else '0';")
                 elif is_ze_tim_glb:
-                    print( "      osctimer <= timerout when c_use_timerout else mcs2orp(15);")
-                    print(f"      timerres <= mcs2orp(15) when {gen_fuse_vector(sx.search('osctimer/reset'))} = '0' else '0';")
+                    self.print( "      osctimer <= timerout when c_use_timerout else mcs2orp(15);")
+                    self.print(f"      timerres <= mcs2orp(15) when {self.fuse_vector(self.dev.search('osctimer/reset'))} = '0' else '0';")
                 else:
-                    print("      osctimer <= '0';")
+                    self.print("      osctimer <= '0';")
 
             else:
-                print(f"      glb{glbnum}_mcs_to_grp <= mcs2orp;")
+                self.print(f"      glb{glbnum}_mcs_to_grp <= mcs2orp;")
 
-            print()
+            self.print()
 
             #
             # Generate Output Routing Pools
             #
-            print(f'''
+            self.print(f'''
     ------------------------------------------------------------------------
     -- Output Routing Pool
     --
@@ -729,136 +786,1345 @@ use work.lc4k_pack.all;
 ''')
             num_orm_inputs = 8
             for idx in range(0, self.num_mcs):
-                pin_orp = pin_match_glb_mc(glbnum, idx, self.drive_type_pins)
+                pin_orp = self.dev.pin_at('drive_type', glbnum, idx)
                 if pin_orp:
-                    print(f'      pin{pin_orp[1]}_mc{idx}_block : block')
-                    print()
+                    self.print(f'      pin{pin_orp[1]}_mc{idx}_block : block')
+                    self.print()
 
-                    print(f'        constant c_output_routing : unsigned(2 downto 0) := {gen_fuse_vector_byvalue(pin_match_glb_mc(glbnum, idx, output_routing_pins))};')
+                    self.config('c_output_routing', 'unsigned(2 downto 0)',
+                                self.fuse_vector_byvalue(self.dev.pin_at('output_routing', glbnum, idx)), '        ')
                     if not self.is_ze:
-                        print(f'        constant c_output_routing_mode : unsigned(1 downto 0) := {gen_fuse_vector_byvalue(pin_match_glb_mc(glbnum, idx, output_routing_mode_pins))};')
-                    print()
-
-                    print( '        signal orm : std_logic;')
-                    print()
-                    print( '      begin')
-                    print()
+                        self.config('c_output_routing_mode', 'unsigned(1 downto 0)',
+                                    self.fuse_vector_byvalue(self.dev.pin_at('output_routing_mode', glbnum, idx)), '        ')
+                    self.print()
+
+                    self.print( '        signal orm : std_logic;')
+                    self.print()
+                    self.print( '      begin')
+                    self.print()
+                    self.config_assignments()
                     #
                     # OE Output Routing Multiplexer
                     #
-                    print(f'        with to_integer(c_output_routing) select orm_oe_to_{pin_orp[1]} <=')
+                    self.print(f'        with to_integer(c_output_routing) select orm_oe_to_{pin_orp[1]} <=')
                     for offset in range (1, num_orm_inputs):
-                        print(f'          ptoes2orp({(idx+offset) % self.num_mcs}) when {offset},')
-                    print(    f'          ptoes2orp({idx}) when others;')
-                    print()
+                        self.print(f'          ptoes2orp({(idx+offset) % self.num_mcs}) when {offset},')
+                    self.print(    f'          ptoes2orp({idx}) when others;')
+                    self.print()
                     #
                     # Output Routing Multiplexer
                     #
-                    print(f'        with to_integer(c_output_routing) select orm <=')
+                    self.print(f'        with to_integer(c_output_routing) select orm <=')
                     for offset in range (1, num_orm_inputs):
-                        print(f'          mcs2orp({(idx+offset) % self.num_mcs}) when {offset},')
-                    print(    f'          mcs2orp({idx}) when others;')
-                    print()
+                        self.print(f'          mcs2orp({(idx+offset) % self.num_mcs}) when {offset},')
+                    self.print(    f'          mcs2orp({idx}) when others;')
+                    self.print()
                     #
                     # ORP Bypass Multiplexer
                     #
                     if not self.is_ze:
-                        print(f'        with to_integer(c_output_routing_mode) select orm_to_{pin_orp[1]} <=')
-                        print(f"              f5pts2orp({idx}) when {lookup_value_id('fast_bypass', output_routing_mode_values)},")
-                        print(f"          not f5pts2orp({idx}) when {lookup_value_id('fast_bypass_inverted', output_routing_mode_values)},")
-                        print(f"          orm when {lookup_value_id('orm', output_routing_mode_values)},")
-                        print(f"          mcs2orp({idx}) when others;")
+                        self.print(f'        with to_integer(c_output_routing_mode) select orm_to_{pin_orp[1]} <=')
+                        self.print(f"              f5pts2orp({idx}) when {lookup_value_id('fast_bypass', output_routing_mode_values)},")
+                        self.print(f"          not f5pts2orp({idx}) when {lookup_value_id('fast_bypass_inverted', output_routing_mode_values)},")
+                        self.print(f"          orm when {lookup_value_id('orm', output_routing_mode_values)},")
+                        self.print(f"          mcs2orp({idx}) when others;")
                     else:
                         # ZE family doesn't have a bypass multiplexer
-                        print(f"        orm_to_{pin_orp[1]} <= orm;")
-                    print()
-                    print( '      end block;')
-                    print()
+                        self.print(f"        orm_to_{pin_orp[1]} <= orm;")
+                    self.print()
+                    self.print( '      end block;')
+                    self.print()
 
-            print('    end block;')
-            print()
+            self.print('    end block;')
+            self.print()
 
-            print('  end block;')
-            print()
+            self.print('  end block;')
+            self.print()
 
 
     def emit_grp_block(self, sx):
-        print('''
+        self.print('''
   ----------------------------------------------------------------------------
   -- Global Routing Pool
   --
   grp_block : block
 ''')
-        print( '  begin')
-        print()
+        # GRP sources, the pins followed by the macrocells of all GLBs
+        pins = [pin[1] for pin in self.input_threshold_pins]
+        glbs = [glb[1] for glb in self.global_routing_pool_glbs]
+        num_sources = len(self.grp_sources())
+
+        muxes = self.grp_muxes()
+        mux_size = len(muxes[glbs[0]][0])
+        glb_size = self.num_gis * mux_size
+
+        self.print(f'    signal sources : std_logic_vector(0 to {num_sources-1});')
+        self.print()
+        self.print( '    -- row, column and source of the mux inputs, per GLB and GI')
+        self.print(f'    constant c_grp_muxes : grp_muxes_t(0 to {len(glbs) * glb_size - 1}) := (')
+        self.print(',\n'.join(['      ' + ', '.join([f'({row}, {column}, {source})' for row, column, source in gi])
+                               for glb in glbs for gi in muxes[glb]]))
+        self.print( '    );')
+        self.print()
+        self.print( '  begin')
+        self.print()
+
+        for idx, pin in enumerate(pins):
+            self.print(f'    sources({idx}) <= from_{pin}_to_mc_grp;')
+        for glb_idx, glb in enumerate(glbs):
+            first = len(pins) + glb_idx * self.num_mcs
+            self.print(f'    sources({first} to {first + self.num_mcs - 1}) <= glb{glb}_mcs_to_grp;')
+        self.print()
+
+        for glb_idx, glb in enumerate(glbs):
+            self.print(f"    glb{glb}_grp_b : entity work.{self.component('lc4k_grp')}")
+            self.instance_maps('      ', [('g_fusemap', self.fusemap_vector)],
+                               [('g_num_columns', self.num_columns),
+                                ('g_mux_size', mux_size),
+                                ('g_muxes', f'c_grp_muxes({glb_idx * glb_size} to {(glb_idx + 1) * glb_size - 1})')])
+            self.print( '        i_sources => sources,')
+            self.print(f'        o_grp     => glb{glb}_grp')
+            self.print( '      );')
+            self.print()
+
+        self.print( '  end block;')
+        self.print()
+
+
+    # start and end of the concurrent statements, no start line if None
+    body_begin = 'begin'
+    body_end   = 'end;'
+
+    def generate(self, sx, out=None):
+        '''Emit the core to out: a lc4k_writer, file name or text stream, stdout by default.'''
+
+        if isinstance(out, lc4k_writer):
+            self.out = out
+        else:
+            self.out = lc4k_writer(sys.stdout if out is None else out)
 
-        for glb in self.global_routing_pool_glbs:
-            print(f'    glb{glb[1]}_grp <= (')
-            gi_first = True
-            for gi in glb.search('gi'):
-                if gi_first: gi_first = False
+        self.emit_entity(sx)
+        self.emit_architecture_header(sx)
+        self.emit_toplevel_constants(sx)
+        self.emit_toplevel_signals(sx)
+        if self.body_begin:
+            self.print(self.body_begin)
+            self.print()
+        self.config_assignments()
+        self.emit_goe_block(sx)
+        if self.is_ze: self.emit_osctimer_block(sx)
+        self.emit_io_cell_block(sx)
+        self.emit_glb_block(sx)
+        self.emit_grp_block(sx)
+
+        self.print(self.body_end)
+
+        if self.out is out:
+            self.out.flush()
+        else:
+            self.out.close()
+
+
+class lc4k_cfg_generator(lc4k_generator):
+    '''
+    Generator for a core that's configured at runtime.
+
+    The fusemap is the input port i_fusemap instead of a generic, so one
+    synthesized core serves all designs of a device. The configuration
+    constants of the generic core become signals that are assigned from
+    i_fusemap, the components are their lc4k_cfg_* counterparts with
+    configuration ports. The macrocells hold their power up values while
+    i_por is '1', which must be the case until i_fusemap is valid.
+    '''
+
+    __slots__ = ('assignments',)
+
+    fusemap_vector = 'i_fusemap'
+
+    def __init__(self, sx):
+        super().__init__(sx)
+        self.assignments = []
+
+    def entity_name(self, sx):
+        return f'{sx[0].lower()}_cfg_core'
+
+    def component(self, name):
+        return name.replace('lc4k_', 'lc4k_cfg_', 1)
+
+    def config(self, name, type, value, indent='    '):
+        self.print(f'{indent}signal {name} : {type};')
+        self.assignments.append(f'{indent}{name.rstrip()} <= {value};')
+
+    def config_assignments(self):
+        if self.assignments:
+            self.print('\n'.join(self.assignments))
+            self.print()
+            self.assignments = []
+
+    def instance_maps(self, indent, configs, generics=(), ports=()):
+        if generics:
+            width = max([len(name) for name, value in generics])
+            self.print(f'{indent}generic map (')
+            self.print(',\n'.join([f'{indent}  {name:<{width}s} => {value}' for name, value in generics]))
+            self.print(f'{indent})')
+        ports = [('i_' + name[2:], value) for name, value in configs] + list(ports)
+        width = max([len(name) for name, value in ports])
+        self.print(f'{indent}port map (')
+        for name, value in ports:
+            self.print(f'{indent}  {name:<{width}s} => {value},')
+        self.print(f'{indent}  --')
+
+    def print_fusemap_generics(self):
+        pass
+
+    def print_fusemap_ports(self):
+        self.print(f'    i_fusemap : in  std_logic_vector(0 to ({self.num_rows} * {self.num_columns}) - 1);')
+        self.print( "    i_por     : in  std_logic;  -- Power up values while '1'")
+        self.print( '    --')
+
+    #
+    # Architecture header
+    #
+    def emit_architecture_header(self, sx):
+        self.print('''
+library ieee;
+use ieee.numeric_std.all;
+
+use work.lc4k_pack.all;
+''')
+        self.print(f'architecture rtl of {self.entity_name(sx)} is')
+        self.print(f'''
+  -- i_fusemap by row and column
+  type fm_t is array (0 to {self.num_rows-1}, 0 to {self.num_columns-1}) of f_t;
+  signal fm : fm_t;
+''')
+        self.print_gi_rows()
+
+        self.assignments.append(f'''  fm_rows : for row in 0 to {self.num_rows-1} generate
+    fm_columns : for column in 0 to {self.num_columns-1} generate
+      fm(row, column) <= i_fusemap(row * {self.num_columns} + column);
+    end generate;
+  end generate;
+''')
+
+    #
+    # OSC/TIMER block
+    #
+    def emit_osctimer_block(self, sx):
+        # c_use_oscout and c_use_timerout are signals, the OSC/TIMER is
+        # always present and the GLBs select its outputs
+        self.print('''
+  ----------------------------------------------------------------------------
+  -- OSC/TIMER
+  --
+  osctimer_block : block
+''')
+
+        self.print()
+        self.config('c_osctimer', 'osctimer_r', f"(\n      timer_div => {self.fuse_vector(self.dev.search('osctimer/timer_div'))}\n    )")
+        self.print()
+
+        self.print("  begin")
+        self.print()
+        self.config_assignments()
+
+        self.print(f"    osctimer_b : entity work.{self.component('lc4k_osctimer')}")
+        self.instance_maps('      ', [('g_config', 'c_osctimer')])
+        self.print("        i_oscclk    => i_oscclk,")
+        self.print("        i_dynoscdis => dynoscdis,")
+        self.print("        i_timerres  => timerres,")
+        self.print("        o_oscout    => oscout,")
+        self.print("        o_timerout  => timerout")
+        self.print("      );")
+
+        self.print()
+        self.print("  end block;")
+        self.print()
+
+
+class lc4k_verilog_generator(lc4k_generator):
+    '''
+    Generator for the Verilog counterpart of the generic core.
+
+    The module has the ports of the VHDL entity and the parameter
+    g_fusemap, it instantiates the components of lc4k_components.v.
+    Configurations are localparams with the fields of the lc4k_pack records
+    concatenated, the fuses are bits of g_fusemap. g_fusemap_zeros has no
+    Verilog counterpart.
+    '''
+
+    __slots__ = ()
+
+    body_begin = None
+    body_end   = 'endmodule'
+
+    #
+    # Fuses as bits of g_fusemap
+    #
+    def fuse_refs(self, sexp):
+        return [f'g_fusemap[{fuse[1] * self.num_columns + fuse[2]}]' for fuse in sexp.search('fuse')]
+
+    def fuse_vector(self, sexp):
+        return verilog_concat(self.fuse_refs(sexp))
+
+    def fuse_refs_byvalue(self, sexp):
+        values = {}
+        for fuse in sexp.search('fuse'):
+            val = fuse.search('value')
+            values[val[0][1] if val else 1] = self.fuse_refs(fuse)
+        return [ref for value in sorted(values, reverse=True) for ref in values[value]]
+
+    def fuse_vector_byvalue(self, sexp):
+        return verilog_concat(self.fuse_refs_byvalue(sexp))
+
+    def localparam(self, name, fields, indent='  '):
+        '''
+        Configuration name, the concatenation of fields as (comment, refs)
+        with refs the bits of the field, e.g. from fuse_refs().
+        '''
+        width = sum([len(refs) for comment, refs in fields])
+        if len(fields) == 1 and len(fields[0][1]) == 1:
+            self.print(f'{indent}localparam {name} = {fields[0][1][0]};')
+            return
+        lines = [', '.join(refs) for comment, refs in fields]
+        lines = [line + ',' for line in lines[:-1]] + lines[-1:]
+        align = max([len(line) for line in lines])
+        self.print(f'{indent}localparam [0:{width-1}] {name} = {{')
+        for line, (comment, refs) in zip(lines, fields):
+            self.print(f'{indent}  {line:<{align}s}  // {comment}')
+        self.print(f'{indent}}};')
+
+    def instance(self, component, name, params, ports, indent='  '):
+        '''Instance name of component with params and ports as (name, value).'''
+        self.print(f'{indent}{component} #(')
+        width = max([len(param) for param, value in params])
+        self.print(',\n'.join([f'{indent}  .{param:<{width}s} ({value})' for param, value in params]))
+        self.print(f'{indent}) {name} (')
+        width = max([len(port) for port, value in ports])
+        self.print(',\n'.join([f'{indent}  .{port:<{width}s} ({value})' for port, value in ports]))
+        self.print(f'{indent});')
+
+    def section(self, title):
+        self.print(f'''
+  // --------------------------------------------------------------------------
+  // {title}
+  //''')
+
+
+    #
+    # Module
+    #
+    def emit_entity(self, sx):
+        self.print('''
+// ----------------------------------------------------------------------------
+//
+// LC4K Core
+//
+// Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+//
+// ----------------------------------------------------------------------------
+''')
+        self.print(f'module {self.entity_name(sx)} #(')
+        self.print(f"  parameter [0:({self.num_rows} * {self.num_columns}) - 1] g_fusemap = "
+                   f"{{({self.num_rows} * {self.num_columns}){{1'b1}}}}")
+        self.print(') (')
+
+        groups = []
+        for pin in self.input_threshold_pins:
+            if self.pin_is_out(pin[1]):
+                ports = [f'input  i_{pin[1]}', f'output o_{pin[1]}', f'output oe_{pin[1]}']
+            else:
+                ports = [f'input  i_{pin[1]}']
+            if self.is_ze:
+                ports += [f'output pu_{pin[1]}', f'output pd_{pin[1]}', f'output kp_{pin[1]}']
+            groups.append(ports)
+        if not self.is_ze:
+            groups.append(['output o_pu', 'output o_pd', 'output o_kp'])
+        else:
+            groups.append(['input  i_oscclk'])
+
+        self.print(',\n  //\n'.join([',\n'.join([f'  {port}' for port in ports]) for ports in groups]))
+        self.print(');')
+        self.print()
+
+    #
+    # Module header
+    #
+    def emit_architecture_header(self, sx):
+        self.print(f'  localparam integer c_num_columns  = {self.num_columns};')
+        self.print(f'  localparam integer c_fusemap_size = {self.num_rows} * {self.num_columns};')
+        self.print()
+
+        # PT fuse rows per GI, the same for all GLBs
+        gi_rows = self.pt_gi_rows()
+        self.print( '  // normal and inverted PT fuse rows per GI, the same for all GLBs')
+        self.print(f'  localparam [0:{self.num_gis * 2 * 16 - 1}] c_gi_rows = {{')
+        self.print(',\n'.join([f"    16'd{gi_rows[gi]['normal']}, 16'd{gi_rows[gi]['inverted']}"
+                               for gi in range(0, self.num_gis)]))
+        self.print( '  };')
+        self.print()
+
+    #
+    # Toplevel constants
+    #
+    def emit_toplevel_constants(self, sx):
+        self.localparam('c_zht', [('zero_hold_time', self.fuse_refs(self.dev.search('zero_hold_time')))])
+        self.print()
+
+    #
+    # Toplevel signals
+    #
+    def emit_toplevel_signals(self, sx):
+        # pin signals
+        for pin in self.input_threshold_pins:
+            if self.pin_is_out(pin[1]):
+                self.print(f'  wire orm_to_{pin[1]}, orm_oe_to_{pin[1]}, from_{pin[1]}_to_mc_grp;')
+            else:
+                self.print(f'  wire from_{pin[1]}_to_mc_grp;')
+        self.print()
+
+        glbs = [glb[1] for glb in self.global_routing_pool_glbs]
+        self.print(f'  wire [0:{self.num_mcs-1}] ' + ', '.join([f'glb{glb}_mcs_to_grp' for glb in glbs]) + ';')
+        self.print()
+        self.print(f'  wire [0:{self.num_gis-1}] ' + ', '.join([f'glb{glb}_grp' for glb in glbs]) + ';')
+        self.print()
+
+        # GLB shared PTOE outputs
+        self.print(f'  wire [0:{len(self.shared_pt_oe_glbs)-1}] glb_shared_ptoes;')
+        self.print()
+        self.print('  wire [0:3] goe;')
+        self.print()
+
+        # OSCTIMER signals
+        if self.is_ze:
+            self.print( '  wire oscout, timerout, dynoscdis, timerres;')
+            self.print(f"  localparam c_use_oscout   = {self.fuse_vector(self.dev.search('osctimer/osc_out'))} == 1'b0;")
+            self.print(f"  localparam c_use_timerout = {self.fuse_vector(self.dev.search('osctimer/timer_out'))} == 1'b0;")
+            self.print()
+
+
+    #
+    # OSC/TIMER block
+    #
+    def emit_osctimer_block(self, sx):
+        self.section('OSC/TIMER')
+        self.localparam('c_osctimer', [('timer_div', self.fuse_refs(self.dev.search('osctimer/timer_div')))])
+        self.print()
+
+        self.print( '  generate')
+        self.print( '    if (c_use_oscout || c_use_timerout) begin : osctimer_block')
+        self.instance('lc4k_osctimer', 'osctimer_b',
+                      [('g_config', 'c_osctimer')],
+                      [('i_oscclk',    'i_oscclk'),
+                       ('i_dynoscdis', 'dynoscdis'),
+                       ('i_timerres',  'timerres'),
+                       ('o_oscout',    'oscout'),
+                       ('o_timerout',  'timerout')], '      ')
+        self.print( '    end')
+        self.print( '    else begin : no_osctimer')
+        self.print("      assign oscout   = 1'b0;")
+        self.print("      assign timerout = 1'b0;")
+        self.print( '    end')
+        self.print( '  endgenerate')
+        self.print()
+
+
+    #
+    # Global output enable block
+    #
+    def emit_goe_block(self, sx):
+        if self.dev.search('goe_source'):
+            num_internal_ptoes = 4
+        else:
+            num_internal_ptoes = 2
+
+        self.section('Global Output Enable')
+
+        source = self.dev.search('goe_source')
+        if source:
+            self.print('  wire goe_int_0, goe_int_1;')
+
+        # internal shared pt oe bus
+        self.print(f'  wire [0:{num_internal_ptoes-1}] goe_shared_ptoes;')
+        self.print()
+
+        # build internal shared PT OE bus
+        for idx in range(0, num_internal_ptoes):
+            self.print    (f'  assign goe_shared_ptoes[{idx}] =')
+            for glb in self.shared_pt_oe_glbs:
+                self.print(f"    {self.fuse_vector(glb.search(f'goe{idx}'))} == 1'b0 ? glb_shared_ptoes[{glb[1]}] :")
+            self.print    ( "    1'b1;")
+            self.print()
+
+        # pins with oe functionality
+        oepins = self.oe_pins()
+
+        def select(fuses, inverted, normal):
+            return f"{self.fuse_vector(fuses)} == 1'b0 ? {inverted} : {normal};"
+
+        polarity = self.dev.search('goe_polarity')
+        if source:
+            self.print(f"  assign goe_int_0 = {select(source.search('goe0/fuse'), f'i_{oepins[0]}', 'goe_shared_ptoes[0]')}")
+            self.print(f"  assign goe_int_1 = {select(source.search('goe1/fuse'), f'i_{oepins[1]}', 'goe_shared_ptoes[1]')}")
+            self.print(f"  assign goe[0] = {select(polarity.search('goe0/fuse'), '~goe_int_0', 'goe_int_0')}")
+            self.print(f"  assign goe[1] = {select(polarity.search('goe1/fuse'), '~goe_int_1', 'goe_int_1')}")
+            self.print(f"  assign goe[2] = {select(polarity.search('goe2/fuse'), '~goe_shared_ptoes[2]', 'goe_shared_ptoes[2]')}")
+            self.print(f"  assign goe[3] = {select(polarity.search('goe3/fuse'), '~goe_shared_ptoes[3]', 'goe_shared_ptoes[3]')}")
+        else:
+            self.print(f"  assign goe[0] = {select(polarity.search('goe0/fuse'), '~goe_shared_ptoes[0]', 'goe_shared_ptoes[0]')}")
+            self.print(f"  assign goe[1] = {select(polarity.search('goe1/fuse'), '~goe_shared_ptoes[1]', 'goe_shared_ptoes[1]')}")
+            self.print(f"  assign goe[2] = {select(polarity.search('goe2/fuse'), f'~i_{oepins[0]}', f'i_{oepins[0]}')}")
+            self.print(f"  assign goe[3] = {select(polarity.search('goe3/fuse'), f'~i_{oepins[1]}', f'i_{oepins[1]}')}")
+        self.print()
+
+
+    #
+    # IO Cell block
+    #
+    def emit_io_cell_block(self, sx):
+        self.section('IO Cells')
+
+        if not self.is_ze:
+            self.localparam('c_bus_maintenance', [('bus_maintenance', self.fuse_refs(self.dev.search('bus_maintenance/fuse')))])
+            self.print()
+            self.print("  assign o_pu = c_bus_maintenance == 2'b11;")
+            self.print("  assign o_pd = c_bus_maintenance == 2'b00;")
+            self.print("  assign o_kp = c_bus_maintenance == 2'b01;")
+            self.print()
+
+        for pin in self.input_threshold_pins:
+            params = []
+            if self.is_ze:
+                self.localparam(f'c_bus_maintenance_{pin[1]}',
+                                [('bus_maintenance', self.fuse_refs(self.dev.pin('bus_maintenance', pin[1])))])
+                params = [('g_bus_maintenance', f'c_bus_maintenance_{pin[1]}'),
+                          ('g_pgdf', self.fuse_vector(self.dev.pin('power_guard', pin[1])))]
+
+            if self.pin_is_out(pin[1]):
+                self.localparam(f'c_io_cell_{pin[1]}', [
+                    ('oe_source',       self.fuse_refs(self.dev.pin('output_enable_source', pin[1]))),
+                    ('drive_type',      self.fuse_refs(self.dev.pin('drive_type', pin[1]))),
+                    ('slew_rate',       self.fuse_refs(self.dev.pin('slew_rate', pin[1]))),
+                    ('input_threshold', self.fuse_refs(self.dev.pin('input_threshold', pin[1])))])
+                component = 'lc4k_ze_io_cell' if self.is_ze else 'lc4k_io_cell'
+                name      = f'io_cell_{pin[1]}_b'
+                params   += [('g_io_cell', f'c_io_cell_{pin[1]}')]
+                ports     = [('i_pin',    f'i_{pin[1]}'),
+                             ('o_pin',    f'o_{pin[1]}'),
+                             ('o_pin_oe', f'oe_{pin[1]}'),
+                             ('i_orm',    f'orm_to_{pin[1]}'),
+                             ('i_orm_oe', f'orm_oe_to_{pin[1]}'),
+                             ('i_goe',    'goe'),
+                             ('o_mc_grp', f'from_{pin[1]}_to_mc_grp')]
+            else:
+                self.localparam(f'c_in_cell_{pin[1]}', [('input_threshold', self.fuse_refs(pin))])
+                component = 'lc4k_ze_in_cell' if self.is_ze else 'lc4k_in_cell'
+                name      = f'in_cell_{pin[1]}_b'
+                params   += [('g_input_threshold', f'c_in_cell_{pin[1]}')]
+                ports     = [('i_pin',    f'i_{pin[1]}'),
+                             ('o_mc_grp', f'from_{pin[1]}_to_mc_grp')]
+
+            if self.is_ze:
+                ports += [('o_pin_pu', f'pu_{pin[1]}'),
+                          ('o_pin_pd', f'pd_{pin[1]}'),
+                          ('o_pin_kp', f'kp_{pin[1]}'),
+                          ('i_bie',    f"glb_shared_ptoes[{self.dev.pin('power_guard', pin[1]).search('glb')[0][1]}]")]
+            self.print()
+            self.instance(component, name, params, ports)
+            self.print()
+
+
+    #
+    # GLB block
+    #
+    def emit_glb_block(self, sx):
+        clkpins = self.clk_pins()
+        gi_rows_width = self.num_gis * 2 * 16
+
+        output_routing_mode_values = self.dev.search('output_routing_mode/value')
+        for glb in self.dev.search('bclk_polarity/glb'):
+            glbnum = glb[1]
+            self.mark(f'glb{glbnum}')
+
+            self.section(f'Generic Logic Block {glbnum}')
+
+            is_ze_osc_glb = self.is_ze and glbnum == self.dev.osc_glb
+            is_ze_tim_glb = self.is_ze and glbnum == self.dev.timer_glb
+
+            #
+            # GLB config, fields in the order of glb_r
+            #
+            bclks = {f'bclk{clks[1]}{clks[2]}_polarity': self.fuse_refs(clks) for clks in glb.search('clk')}
+            self.localparam(f'c_glb{glbnum}_config', [
+                ('bclk01_polarity',         bclks['bclk01_polarity']),
+                ('bclk23_polarity',         bclks['bclk23_polarity']),
+                ('shared_pt_clk_polarity',  self.fuse_refs(self.dev.glb('shared_pt_clk_polarity', glbnum))),
+                ('shared_pt_init_polarity', self.fuse_refs(self.dev.glb('shared_pt_init_polarity', glbnum)))])
+            self.print()
+
+            def mc_fuses(feature, idx):
+                return self.fuse_refs(self.dev.mc(feature, glbnum, idx))
+
+            #
+            # 16 Enhanced Logic Allocators
+            #
+            fields = []
+            for idx in range(0, self.num_mcs):
+                fields += [(f'{idx}.{feature}', mc_fuses(feature, idx))
+                           for feature in ('cluster_routing', 'wide_routing', 'pt0_xor', 'clock_source',
+                                           'clock_enable_source', 'async_source', 'init_source',
+                                           'pt4_output_enable')]
+            self.localparam(f'c_glb{glbnum}_elas_config', fields)
+            self.print()
+
+            #
+            # 16 Macrocells
+            #
+            fields = []
+            for idx in range(0, self.num_mcs):
+                input_bypass = self.dev.pin_at('macrocell_data', glbnum, idx)
+                fields += [(f'{idx}.init_state',          mc_fuses('init_state', idx)),
+                           (f'{idx}.init_source',         mc_fuses('init_source', idx)),
+                           (f'{idx}.async_source',        mc_fuses('async_source', idx)),
+                           (f'{idx}.input_bypass',        self.fuse_refs(input_bypass) if input_bypass else ["1'b1"]),
+                           (f'{idx}.invert',              mc_fuses('invert', idx)),
+                           (f'{idx}.clock_enable_source', mc_fuses('clock_enable_source', idx)),
+                           (f'{idx}.clock_source',        mc_fuses('clock_source', idx)),
+                           (f'{idx}.macrocell_function',  mc_fuses('macrocell_function', idx))]
+            self.localparam(f'c_glb{glbnum}_macrocells_config', fields)
+            self.print()
+
+            #
+            # PT columns, the GLB decodes the PTs with the GI rows
+            #
+            columns = self.pt_columns(glbnum)
+            self.print(f'  localparam [0:{len(columns) * 16 - 1}] c_glb{glbnum}_pt_columns = {{')
+            self.print(',\n'.join(['    ' + ', '.join([f"16'd{col}" for col in columns[idx:idx+5]])
+                                   for idx in range(0, len(columns), 5)]))
+            self.print( '  };')
+            self.print()
+
+            self.print(f'  wire [0:{self.num_mcs-1}] glb{glbnum}_io2mcs, glb{glbnum}_mcs2orp, '
+                       f'glb{glbnum}_f5pts2orp, glb{glbnum}_ptoes2orp;')
+            if is_ze_osc_glb or is_ze_tim_glb:
+                self.print(f'  wire glb{glbnum}_osctimer;')
+            self.print()
+
+            ios = []
+            for idx in range(0, self.num_mcs):
+                input_bypass = self.dev.pin_at('macrocell_data', glbnum, idx)
+                ios.append(f'from_{input_bypass[1]}_to_mc_grp' if input_bypass else "1'b0")
+            self.print(f'  assign glb{glbnum}_io2mcs = {{')
+            self.print(',\n'.join(['    ' + ', '.join(ios[idx:idx+4]) for idx in range(0, self.num_mcs, 4)]))
+            self.print( '  };')
+            self.print()
+
+            #
+            # Instantiate GLB
+            #
+            self.instance('lc4k_glb', f'glb{glbnum}_b',
+                          [('g_config',       f'c_glb{glbnum}_config'),
+                           ('g_num_columns',  'c_num_columns'),
+                           ('g_fusemap_size', 'c_fusemap_size'),
+                           ('g_fusemap',      'g_fusemap'),
+                           ('g_gi_rows',      'c_gi_rows'),
+                           ('g_pt_columns',   f'c_glb{glbnum}_pt_columns'),
+                           ('g_mcs',          f'c_glb{glbnum}_macrocells_config'),
+                           ('g_elas',         f'c_glb{glbnum}_elas_config'),
+                           ('g_zht',          'c_zht')],
+                          [('i_clk0',  f'from_{clkpins[0]}_to_mc_grp'),
+                           ('i_clk1',  f'from_{clkpins[1]}_to_mc_grp' if 1 in clkpins else "1'b0"),
+                           ('i_clk2',  f'from_{clkpins[2]}_to_mc_grp'),
+                           ('i_clk3',  f'from_{clkpins[3]}_to_mc_grp' if 3 in clkpins else "1'b0"),
+                           ('i_grp',   f'glb{glbnum}_grp'),
+                           ('i_ios',   f'glb{glbnum}_io2mcs'),
+                           ('o_mcs',   f'glb{glbnum}_mcs2orp'),
+                           ('o_5pts',  f'glb{glbnum}_f5pts2orp'),
+                           ('o_ptoes', f'glb{glbnum}_ptoes2orp'),
+                           ('o_shared_ptoe', f'glb_shared_ptoes[{glbnum}]')])
+            self.print()
+
+            # Insert ZE OSC/TIMER MUX
+            if is_ze_osc_glb or is_ze_tim_glb:
+                self.print(f'  assign glb{glbnum}_mcs_to_grp = {{glb{glbnum}_mcs2orp[0:{self.num_mcs-2}], glb{glbnum}_osctimer}};')
+                if is_ze_osc_glb:
+                    self.print(f'  assign glb{glbnum}_osctimer = c_use_oscout ? oscout : glb{glbnum}_mcs2orp[{self.num_mcs-1}];')
+                    self.print(f"  assign dynoscdis = {self.fuse_vector(self.dev.search('osctimer/enable'))} == 1'b0 ? "
+                               f"glb{glbnum}_mcs2orp[{self.num_mcs-1}] : 1'b0;")
                 else:
-                    print(',')
+                    self.print(f'  assign glb{glbnum}_osctimer = c_use_timerout ? timerout : glb{glbnum}_mcs2orp[{self.num_mcs-1}];')
+                    self.print(f"  assign timerres = {self.fuse_vector(self.dev.search('osctimer/reset'))} == 1'b0 ? "
+                               f"glb{glbnum}_mcs2orp[{self.num_mcs-1}] : 1'b0;")
+            else:
+                self.print(f'  assign glb{glbnum}_mcs_to_grp = glb{glbnum}_mcs2orp;')
 
-                print(f'      {gi[1]:>2d} => ', end='')
+            #
+            # Output Routing Pool, the ORM selects macrocell idx + c_output_routing
+            #
+            for idx in range(0, self.num_mcs):
+                pin_orp = self.dev.pin_at('drive_type', glbnum, idx)
+                if not pin_orp:
+                    continue
+                pin = pin_orp[1]
+
+                self.print()
+                self.print(f'  // Output Routing Pool of pin {pin}, macrocell {idx}')
+                self.localparam(f'c_output_routing_{pin}',
+                                [('output_routing', self.fuse_refs_byvalue(self.dev.pin_at('output_routing', glbnum, idx)))])
+                if not self.is_ze:
+                    self.localparam(f'c_output_routing_mode_{pin}',
+                                    [('output_routing_mode', self.fuse_refs_byvalue(self.dev.pin_at('output_routing_mode', glbnum, idx)))])
+                self.print(f'  wire orm_{pin};')
+                self.print()
+                self.print(f'  assign orm_oe_to_{pin} = glb{glbnum}_ptoes2orp[({idx} + c_output_routing_{pin}) % {self.num_mcs}];')
+                self.print(f'  assign orm_{pin} = glb{glbnum}_mcs2orp[({idx} + c_output_routing_{pin}) % {self.num_mcs}];')
+                if not self.is_ze:
+                    mode = f'c_output_routing_mode_{pin}'
+                    self.print(f'  assign orm_to_{pin} =')
+                    self.print(f"    {mode} == {lookup_value_id('fast_bypass', output_routing_mode_values)} ?  glb{glbnum}_f5pts2orp[{idx}] :")
+                    self.print(f"    {mode} == {lookup_value_id('fast_bypass_inverted', output_routing_mode_values)} ? ~glb{glbnum}_f5pts2orp[{idx}] :")
+                    self.print(f"    {mode} == {lookup_value_id('orm', output_routing_mode_values)} ?  orm_{pin} :")
+                    self.print(f"    glb{glbnum}_mcs2orp[{idx}];")
+                else:
+                    # ZE family doesn't have a bypass multiplexer
+                    self.print(f'  assign orm_to_{pin} = orm_{pin};')
+            self.print()
 
-                fuse_first = True
-                for fuse in gi.search('fuse'):
-                    if fuse_first: fuse_first = False
-                    else:
-                        print(' and ', end='')
 
-                    print(f'({gen_fuse_vector(fuse):>12s} or ', end='')
-                    if fuse.search('fuse/unused'):
-                        print("{0:<20s}".format("'1'"),end='')
+    #
+    # Global Routing Pool block
+    #
+    def emit_grp_block(self, sx):
+        self.section('Global Routing Pool')
+
+        pins = [pin[1] for pin in self.input_threshold_pins]
+        glbs = [glb[1] for glb in self.global_routing_pool_glbs]
+        num_sources = len(self.grp_sources())
+
+        muxes = self.grp_muxes()
+        mux_size = len(muxes[glbs[0]][0])
+        glb_width = self.num_gis * mux_size * 3 * 16
+
+        def mux(row, column, source):
+            return f"16'd{row}, 16'd{column}, " + (f"16'd{source}" if source >= 0 else "16'hffff")
+
+        self.print(f'  wire [0:{num_sources-1}] grp_sources;')
+        self.print()
+        self.print( '  // row, column and source of the mux inputs, per GLB and GI')
+        self.print(f'  localparam [0:{len(glbs) * glb_width - 1}] c_grp_muxes = {{')
+        self.print(',\n'.join(['    ' + ', '.join([mux(*mux_input) for mux_input in gi])
+                               for glb in glbs for gi in muxes[glb]]))
+        self.print( '  };')
+        self.print()
+
+        for idx, pin in enumerate(pins):
+            self.print(f'  assign grp_sources[{idx}] = from_{pin}_to_mc_grp;')
+        for glb_idx, glb in enumerate(glbs):
+            first = len(pins) + glb_idx * self.num_mcs
+            self.print(f'  assign grp_sources[{first}:{first + self.num_mcs - 1}] = glb{glb}_mcs_to_grp;')
+
+        for glb_idx, glb in enumerate(glbs):
+            self.print()
+            self.instance('lc4k_grp', f'glb{glb}_grp_b',
+                          [('g_num_columns',  'c_num_columns'),
+                           ('g_fusemap_size', 'c_fusemap_size'),
+                           ('g_fusemap',      'g_fusemap'),
+                           ('g_mux_size',     mux_size),
+                           ('g_num_sources',  num_sources),
+                           ('g_muxes',        f'c_grp_muxes[{glb_idx * glb_width}:{(glb_idx + 1) * glb_width - 1}]')],
+                          [('i_sources', 'grp_sources'),
+                           ('o_grp',     f'glb{glb}_grp')])
+        self.print()
+
+
+class lc4k_specializer(lc4k_generator):
+    '''
+    Generator for a core that's specialized to one fusemap.
+
+    All fuses are folded into constants. Product terms, GRP inputs and
+    macrocells that don't contribute to an enabled pin output are dropped,
+    the remaining logic is emitted as plain equations around the macrocell
+    and IO cell components. The entity is the same as the generic core's,
+    g_fusemap and g_fusemap_zeros are accepted but ignored.
+    '''
+
+    __slots__ = ('fusemap', 'used')
+
+    def __init__(self, sx, fuses):
+        '''fuses is the fusemap as sequence of '0'/'1' characters, e.g. Jedec.fuse_data.'''
+        super().__init__(sx)
+        self.fusemap = lc4k_fusemap(self.dev, fuses)
+        self.used    = self.fusemap.used_logic()
+
+    def fuse_vector(self, sexp):
+        value = self.fusemap.value(sexp)
+        return f"'{value}'" if len(value) == 1 else f'"{value}"'
+
+    def fuse_vector_byvalue(self, sexp):
+        return f'"{self.fusemap.value_byvalue(sexp)}"'
+
+
+    #
+    # Architecture header
+    #
+    def emit_architecture_header(self, sx):
+        self.print('''
+library ieee;
+use ieee.numeric_std.all;
+
+use work.lc4k_pack.all;
+''')
+        self.print(f'architecture rtl of {sx[0].lower()}_core is')
+        self.print()
+
+    #
+    # Toplevel signals
+    #
+    def emit_toplevel_signals(self, sx):
+        # pin signals
+        for pin in self.input_threshold_pins:
+            if self.pin_is_out(pin[1]):
+                self.print(f'  signal orm_to_{pin[1]}, orm_oe_to_{pin[1]}, from_{pin[1]}_to_mc_grp : std_logic;')
+            else:
+                self.print(f'  signal from_{pin[1]}_to_mc_grp : std_logic;')
+        self.print()
+
+        # unused bits are never driven, keep them at a defined level
+        glbs = [glb[1] for glb in self.global_routing_pool_glbs]
+        self.print('  signal ' + ', '.join([f'glb{glb}_mcs_to_grp' for glb in glbs]) +
+                   f" : std_logic_vector(0 to {self.num_mcs-1}) := (others => '0');")
+        self.print()
+        self.print('  signal ' + ', '.join([f'glb{glb}_grp' for glb in glbs]) +
+                   f" : std_logic_vector(0 to {self.num_gis-1}) := (others => '1');")
+        self.print()
+
+        # GLB shared PTOE outputs
+        self.print(f"  signal glb_shared_ptoes : std_logic_vector(0 to {len(self.shared_pt_oe_glbs)-1}) := (others => '0');")
+        self.print()
+        self.print('  signal goe : std_logic_vector(0 to 3);')
+        self.print()
+
+        # OSCTIMER signals
+        if self.is_ze:
+            use_oscout   = self.fusemap.value(self.dev.search('osctimer/osc_out')) == '0'
+            use_timerout = self.fusemap.value(self.dev.search('osctimer/timer_out')) == '0'
+            self.print( "  signal oscout, timerout, dynoscdis, timerres : std_logic;")
+            self.print(f"  constant c_use_oscout   : boolean := {str(use_oscout).lower()};")
+            self.print(f"  constant c_use_timerout : boolean := {str(use_timerout).lower()};")
+            self.print()
+
+
+    #
+    # Global output enable block
+    #
+    def emit_goe_block(self, sx):
+        self.print('''
+  ----------------------------------------------------------------------------
+  -- Global Output Enable
+  --
+  goe_block : block
+  begin
+''')
+        for idx, (inverted, kind, ref) in enumerate(self.fusemap.goe()):
+            if kind == 'glb':
+                source = f'glb_shared_ptoes({ref})'
+            elif kind == 'pin':
+                source = f'i_{ref}'
+            else:
+                source = None
+
+            if source is None:
+                self.print(f"    goe({idx}) <= '{'0' if inverted else '1'}';")
+            else:
+                self.print(f"    goe({idx}) <= {'not ' if inverted else ''}{source};")
+        self.print()
+
+        self.print('  end block;')
+        self.print()
+
+
+    #
+    # GLB block
+    #
+    def emit_glb_block(self, sx):
+        fusemap = self.fusemap
+        clkpins = fusemap.clk_pins()
+
+        def pterm_expr(glbnum, pt):
+            literals = fusemap.pterm(glbnum, pt)
+            if literals is None:
+                return "'0'"
+            if not literals:
+                return "'1'"
+            return ' and '.join([f"{'not ' if inverted else ''}glb{glbnum}_grp({gi})" for gi, inverted in literals])
+
+        def or_expr(pts):
+            return ' or '.join([f'pts({pt})' for pt in sorted(pts)]) or "'0'"
+
+        for glb in self.dev.search('bclk_polarity/glb'):
+            glbnum = glb[1]
+            self.mark(f'glb{glbnum}')
+
+            used_mcs = sorted([mc for glb_mc, mc in self.used['mc'] if glb_mc == glbnum])
+            used_pts = sorted([pt for glb_pt, pt in self.used['pt'] if glb_pt == glbnum])
+            routing  = fusemap.ela_routing(glbnum)
+            config   = fusemap.glb_config(glbnum)
+
+            is_ze_osc_glb = self.is_ze and glbnum == self.dev.osc_glb
+            is_ze_tim_glb = self.is_ze and glbnum == self.dev.timer_glb
+
+            self.print(f'''
+  ----------------------------------------------------------------------------
+  -- Generic Logic Block {glbnum}
+  --
+  glb{glbnum}_block : block
+''')
+            if used_mcs or used_pts:
+                self.print("    signal pts : std_logic_vector(0 to num_pts-1) := (others => '0');")
+                self.print("    signal logic_alloc, pt0s, pt1s, pt2s, pt3s : std_logic_vector(0 to num_mcs-1) := (others => '0');")
+                self.print("    signal mcs2orp : std_logic_vector(0 to num_mcs-1) := (others => '0');")
+                self.print('    signal bclk0, bclk1, bclk2, bclk3 : std_logic;')
+                self.print('    signal shared_pt_clock, shared_pt_init : std_logic;')
+                self.print()
+
+            # For ZE OSC/TIMER MUX
+            if is_ze_osc_glb or is_ze_tim_glb:
+                self.print('    signal osctimer : std_logic;')
+                self.print()
+
+            self.print('  begin')
+            self.print()
+
+            if used_mcs or used_pts:
+                #
+                # Product terms
+                #
+                for pt in used_pts:
+                    self.print(f'    pts({pt}) <= {pterm_expr(glbnum, pt)};')
+                self.print()
+
+                #
+                # GLB clocks and shared product terms
+                #
+                clk = [f'from_{clkpins[idx]}_to_mc_grp' if idx in clkpins else "'0'" for idx in range(0, 4)]
+                for idx, pair in ((0, 1), (1, 0), (2, 3), (3, 2)):
+                    polarity = config[f'bclk{min(idx, pair)}{max(idx, pair)}_polarity'][idx % 2]
+                    if polarity == '1':
+                        self.print(f'    bclk{idx} <= {clk[idx]};')
                     else:
-                        source_pin = fuse.search('fuse/pin')
-                        if source_pin:
-                            print("{0:<20s}".format(f"from_{source_pin[0][1]}_to_mc_grp"), end='')
-                        else:
-                            source_glb = fuse.search('fuse/glb')
-                            if source_glb:
-                                source_mc = fuse.search('fuse/mc')
-                                print("{0:<20s}".format(f"glb{source_glb[0][1]}_mcs_to_grp({source_mc[0][1]})"), end='')
-                    print(')', end='')
+                        self.print(f"    bclk{idx} <= {'not ' + clk[pair] if pair in clkpins else "'1'"};")
+                self.print()
+                self.print(f"    shared_pt_clock <= {'' if config['shared_pt_clk_polarity'] == '1' else 'not '}pts({fusemap.shared_pt_clk});")
+                self.print(f"    shared_pt_init  <= {'' if config['shared_pt_init_polarity'] == '1' else 'not '}pts({fusemap.shared_pt_init});")
+                if fusemap.shared_pt_oe in used_pts:
+                    self.print(f'    glb_shared_ptoes({glbnum}) <= pts({fusemap.shared_pt_oe});')
+                self.print()
 
-            print(');')
-            print()
+            #
+            # Macrocells
+            #
+            for idx in used_mcs:
+                mc_config = fusemap.mc_config(glbnum, idx)
+                pts = routing[idx]['pt']
+
+                if mc_config['input_bypass'] != '0':
+                    if routing[idx]['mc']:
+                        self.print(f'    logic_alloc({idx}) <= {or_expr(routing[idx]["mc"])};')
+                    if pts[0] is not None:
+                        self.print(f'    pt0s({idx}) <= pts({pts[0]});')
+                if mc_config['macrocell_function'] != '00':
+                    for pt_idx in range(1, 4):
+                        if pts[pt_idx] is not None:
+                            self.print(f'    pt{pt_idx}s({idx}) <= pts({pts[pt_idx]});')
+
+                input_pin = fusemap.mc_input_pin(glbnum, idx)
+                self.print(f'    mc{idx}_b : entity work.lc4k_macrocell')
+                self.print( '      generic map (')
+                self.print( '        g_config => (')
+                self.print(f"          init_state          => '{mc_config['init_state']}',")
+                self.print(f"          init_source         => '{mc_config['init_source']}',")
+                self.print(f"          async_source        => '{mc_config['async_source']}',")
+                self.print(f"          input_bypass        => '{mc_config['input_bypass']}',")
+                self.print(f"          invert              => '{mc_config['invert']}',")
+                self.print(f"          clock_enable_source => \"{mc_config['clock_enable_source']}\",")
+                self.print(f"          clock_source        => \"{mc_config['clock_source']}\",")
+                self.print(f"          macrocell_function  => \"{mc_config['macrocell_function']}\"),")
+                self.print( '        g_zht    => c_zht')
+                self.print( '      )')
+                self.print( '      port map (')
+                self.print( '        i_shared_pt_init  => shared_pt_init,')
+                self.print(f"        i_io_cell         => {f'from_{input_pin}_to_mc_grp' if input_pin else "'0'"},")
+                self.print(f'        i_logic_alloc     => logic_alloc({idx}),')
+                self.print( '        i_bclk0           => bclk0,')
+                self.print( '        i_bclk1           => bclk1,')
+                self.print( '        i_bclk2           => bclk2,')
+                self.print( '        i_bclk3           => bclk3,')
+                self.print(f'        i_pt0             => pt0s({idx}),')
+                self.print(f'        i_pt1             => pt1s({idx}),')
+                self.print(f'        i_pt2             => pt2s({idx}),')
+                self.print(f'        i_pt3             => pt3s({idx}),')
+                self.print( '        i_shared_pt_clock => shared_pt_clock,')
+                self.print(f'        o_to_orp_grp      => mcs2orp({idx})')
+                self.print( '      );')
+                self.print()
+
+            if used_mcs:
+                # Insert ZE OSC/TIMER MUX
+                if is_ze_osc_glb or is_ze_tim_glb:
+                    self.print(f"    glb{glbnum}_mcs_to_grp <= mcs2orp(0 to {self.num_mcs-2}) & osctimer;")
+                    if is_ze_osc_glb:
+                        enable = fusemap.value(self.dev.search('osctimer/enable')) == '0'
+                        self.print( "    osctimer  <= oscout when c_use_oscout else mcs2orp(15);")
+                        self.print(f"    dynoscdis <= {'mcs2orp(15)' if enable else "'0'"};")
+                    else:
+                        reset = fusemap.value(self.dev.search('osctimer/reset')) == '0'
+                        self.print( "    osctimer <= timerout when c_use_timerout else mcs2orp(15);")
+                        self.print(f"    timerres <= {'mcs2orp(15)' if reset else "'0'"};")
+                else:
+                    self.print(f'    glb{glbnum}_mcs_to_grp <= mcs2orp;')
+                self.print()
 
-        print( '  end block;')
-        print()
+            #
+            # Output Routing Pool, folded to one assignment per pin
+            #
+            for pin, glb_pin, idx in fusemap.output_pins():
+                if glb_pin != glbnum:
+                    continue
+
+                if pin not in self.used['pin']:
+                    self.print(f"    orm_to_{pin} <= '0';")
+                    self.print(f"    orm_oe_to_{pin} <= '0';")
+                    continue
+
+                orp = fusemap.orp(pin)
+                if orp['source'] == 'fast_bypass':
+                    self.print(f"    orm_to_{pin} <= {or_expr(routing[idx]['5pt'])};")
+                elif orp['source'] == 'fast_bypass_inverted':
+                    self.print(f"    orm_to_{pin} <= not ({or_expr(routing[idx]['5pt'])});")
+                elif orp['source'] == 'orm':
+                    self.print(f"    orm_to_{pin} <= mcs2orp({orp['orm']});")
+                else:
+                    self.print(f"    orm_to_{pin} <= mcs2orp({idx});")
 
+                ptoe = routing[orp['orm']]['pt'][4]
+                io_cell = fusemap.io_cell(pin)
+                if (io_cell['drive_type'] == '1' and io_cell['oe_source'] in (fusemap.oe_orm, fusemap.oe_orm_inv)
+                        and ptoe is not None):
+                    self.print(f"    orm_oe_to_{pin} <= pts({ptoe});")
+                else:
+                    self.print(f"    orm_oe_to_{pin} <= '0';")
+            self.print()
 
-    def generate(self, sx):
+            self.print('  end block;')
+            self.print()
 
-        self.emit_entity(sx)
-        self.emit_architecture_header(sx)
-        self.emit_toplevel_constants(sx)
-        self.emit_toplevel_signals(sx)
-        print('begin')
-        print()
-        self.emit_goe_block(sx)
-        if self.is_ze: self.emit_osctimer_block(sx)
-        self.emit_io_cell_block(sx)
-        self.emit_glb_block(sx)
-        self.emit_grp_block(sx)
 
-        print('end;')
+    #
+    # Global Routing Pool block
+    #
+    def emit_grp_block(self, sx):
+        self.print('''
+  ----------------------------------------------------------------------------
+  -- Global Routing Pool
+  --
+  grp_block : block
+''')
+        self.print( '  begin')
+        self.print()
 
+        def grp_source(source):
+            if source[0] == 'pin':
+                return f'from_{source[1]}_to_mc_grp'
+            return f'glb{source[1]}_mcs_to_grp({source[2]})'
 
-def load_sx(filename):
-    from simp_sexp import Sexp
+        for glb in self.global_routing_pool_glbs:
+            self.mark(f'glb{glb[1]}')
+            gis = sorted([gi for glb_gi, gi in self.used['gi'] if glb_gi == glb[1]])
+            for gi in gis:
+                sources = self.fusemap.grp(glb[1], gi)
+                self.print(f"    glb{glb[1]}_grp({gi}) <= " +
+                           (' and '.join([grp_source(source) for source in sources]) or "'1'") + ';')
+            if gis:
+                self.print()
+
+        self.print( '  end block;')
+        self.print()
+
+
+def generate_core(sx):
+    '''Return the core of device sx as string.'''
+    out = lc4k_writer()
+    lc4k_generator(sx).generate(sx, out)
+    return out.getvalue()
+
+
+def core_filename(sx_file, fusemap_port=False, verilog=False):
+    '''
+    Name of the generated core, lc4032zc_tqfp48_core.vhd for LC4032ZC_TQFP48.sx,
+    lc4032zc_tqfp48_cfg_core.vhd with fusemap_port or lc4032zc_tqfp48_core.v
+    with verilog.
+    '''
+    if verilog:
+        suffix = '_core.v'
+    else:
+        suffix = '_cfg_core.vhd' if fusemap_port else '_core.vhd'
+    return os.path.splitext(os.path.basename(sx_file))[0].lower() + suffix
+
+def manifest_filename(filename):
+    '''Manifest of a generated core, .lc4032zc_tqfp48_core.vhd.manifest next to the core.'''
+    head, tail = os.path.split(filename)
+    return os.path.join(head, f'.{tail}.manifest')
+
+def file_digest(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# local modules the generator imports, eagerly or on demand for -f and
+# --profile, the generated cores depend on all of them
+generator_modules = ('gen_lc4k_core', 'lc4k_device', 'lc4k_fusemap', 'jedec', 'lc4k_profile')
+
+_sources_digest = None
+
+def sources_digest():
+    '''Content hash of the generator sources, the output depends on them.'''
+    global _sources_digest
+    if _sources_digest is None:
+        digest = hashlib.sha256()
+        source_dir = os.path.dirname(os.path.abspath(__file__))
+        for filename in [os.path.join(source_dir, f'{module}.py') for module in generator_modules]:
+            digest.update(os.path.basename(filename).encode())
+            digest.update(bytes.fromhex(file_digest(filename)))
+        _sources_digest = digest.hexdigest()
+    return _sources_digest
+
+def core_manifest(sx_file, options=None):
+    '''Inputs of the core of sx_file, it's only regenerated when they change.'''
+    return {
+        'manifest'  : manifest_version,
+        'sx'        : file_digest(sx_file),
+        'generator' : sources_digest(),
+        'version'   : version,
+        'options'   : options or {},
+    }
+
+def load_manifest(filename):
+    try:
+        with open(manifest_filename(filename)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_manifest(filename, manifest):
+    tmpname = manifest_filename(filename) + '.tmp'
+    with open(tmpname, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmpname, manifest_filename(filename))
+
+def is_up_to_date(filename, manifest):
+    '''Whether filename was generated from the inputs of manifest and is unmodified since.'''
+    previous = load_manifest(filename)
+    if previous is None or any(previous.get(key) != value for key, value in manifest.items()):
+        return False
+    try:
+        return file_digest(filename) == previous.get('output')
+    except OSError:
+        return False
+
+def generator_options(fusemap_port, verilog=False):
+    '''Options recorded in the manifest, empty for the generic core.'''
+    options = {}
+    if fusemap_port:
+        options['fusemap_port'] = True
+    if verilog:
+        options['verilog'] = True
+    return options
+
+def generator_class(fusemap_port, verilog=False):
+    if verilog:
+        return lc4k_verilog_generator
+    return lc4k_cfg_generator if fusemap_port else lc4k_generator
+
+def generate_file(sx_file, out_dir='.', cache_dir=None, force=False, fusemap_port=False, verilog=False):
+    '''
+    Generate the core of sx_file into out_dir, with the fusemap as port
+    instead of generic if fusemap_port is set, in Verilog if verilog is set.
+
+    Skipped unless the inputs recorded in the core's manifest changed or
+    force is set. The core is written to a temporary file first and renamed
+    when complete, so readers never see a partial file. An unchanged core
+    is left untouched. Returns the core's file name, the wall time in
+    seconds and the status 'generated', 'unchanged' or 'up to date'.
+    '''
+    start = time.perf_counter()
+
+    filename = os.path.join(out_dir, core_filename(sx_file, fusemap_port, verilog))
+    manifest = core_manifest(sx_file, generator_options(fusemap_port, verilog))
+    if not force and is_up_to_date(filename, manifest):
+        return filename, time.perf_counter() - start, 'up to date'
+
+    fd, tmpname = tempfile.mkstemp(dir=out_dir, prefix='.', suffix='.tmp')
+    try:
+        # mkstemp creates the file private, apply the umask like open() does
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmpname, 0o666 & ~umask)
+
+        with os.fdopen(fd, 'w') as f:
+            dev = load_device(sx_file, cache_dir)
+            generator_class(fusemap_port, verilog)(dev).generate(dev.sx, f)
+
+        manifest['output'] = file_digest(tmpname)
+        try:
+            unchanged = file_digest(filename) == manifest['output']
+        except OSError:
+            unchanged = False
+        if unchanged:
+            # keep the file and its timestamp for downstream tools
+            os.unlink(tmpname)
+        else:
+            os.replace(tmpname, filename)
+    except BaseException:
+        if os.path.exists(tmpname):
+            os.unlink(tmpname)
+        raise
+
+    save_manifest(filename, manifest)
+    return filename, time.perf_counter() - start, 'unchanged' if unchanged else 'generated'
+
+def generate_files(sx_files, out_dir='.', jobs=None, cache_dir=None, force=False, fusemap_port=False,
+                   verilog=False):
+    '''Generate the cores of all sx_files on a pool of jobs worker processes.'''
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # up to date cores are skipped without starting workers
+    todo = []
+    for sx_file in sx_files:
+        filename = os.path.join(out_dir, core_filename(sx_file, fusemap_port, verilog))
+        if force or not is_up_to_date(filename, core_manifest(sx_file, generator_options(fusemap_port, verilog))):
+            todo.append(sx_file)
+
+    failed = 0
+    start = time.perf_counter()
+    if todo:
+        with ProcessPoolExecutor(max_workers=min(jobs or os.cpu_count(), len(todo))) as pool:
+            futures = {pool.submit(generate_file, sx_file, out_dir, cache_dir, force, fusemap_port, verilog): sx_file
+                       for sx_file in todo}
+            for future in as_completed(futures):
+                name = os.path.splitext(os.path.basename(futures[future]))[0]
+                try:
+                    filename, seconds, status = future.result()
+                    print(f'{name:<20s} {seconds:7.2f}s  {filename} ({status})', file=sys.stderr)
+                except Exception as e:
+                    print(f'{name:<20s}  failed: {e!r}', file=sys.stderr)
+                    failed += 1
+
+    print(f'{len(sx_files)} devices, {len(sx_files) - len(todo)} up to date, '
+          f'{len(todo)} generated in {time.perf_counter() - start:.2f}s', file=sys.stderr)
+    return failed
 
-    with open(filename, 'r') as f:
-        config_str = f.read()
-    return Sexp(config_str)
 
 def main():
-    import sys
-
-    sx = load_sx(sys.argv[1])
-    gen = lc4k_generator(sx)
-    gen.generate(sx)
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate the LC4K core of re4k devices.')
+    parser.add_argument('sx', nargs='*', help='re4k device files (.sx) or directories')
+    parser.add_argument('-o', '--output', help='write core of a single device to file instead of stdout')
+    parser.add_argument('-a', '--all', action='store_true', help='generate all devices of the re4k submodule')
+    parser.add_argument('-d', '--out-dir', help='write <device>_core.vhd files to this directory')
+    parser.add_argument('-j', '--jobs', type=int, help='number of worker processes (default: number of cores)')
+    parser.add_argument('-c', '--cache-dir', default=os.environ.get('LC4K_CACHE_DIR'),
+                        help='cache parsed devices in this directory (default: $LC4K_CACHE_DIR)')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate the cores of -d even if their manifests are up to date')
+    parser.add_argument('-f', '--fusemap', metavar='JEDEC',
+                        help='specialize the core of a single device to the fusemap of this .jed file')
+    parser.add_argument('--fusemap-port', action='store_true',
+                        help='generate <device>_cfg_core with the fusemap as input port i_fusemap')
+    parser.add_argument('--verilog', action='store_true', help='generate the core as Verilog module, <device>_core.v')
+    parser.add_argument('--profile', metavar='REPORT',
+                        help='profile a single device, JSON report or cProfile dump for .prof/.pstats')
+    parser.add_argument('--profile-memory', action='store_true', help='trace memory per phase with --profile')
+    args = parser.parse_args()
+
+    if args.fusemap and args.fusemap_port:
+        parser.error('-f and --fusemap-port are mutually exclusive')
+    if args.verilog and (args.fusemap or args.fusemap_port):
+        parser.error('--verilog is only supported for the generic core')
+
+    if args.all or args.out_dir or len(args.sx) > 1 or any(os.path.isdir(sx) for sx in args.sx):
+        if args.output:
+            parser.error('-o is only supported for a single device, use -d')
+        if args.fusemap:
+            parser.error('-f is only supported for a single device')
+        if args.profile:
+            parser.error('--profile is only supported for a single device')
+        sx_files = find_sx_files(args.sx)
+        if not sx_files:
+            parser.error('no .sx files found')
+        out_dir = args.out_dir or '.'
+        os.makedirs(out_dir, exist_ok=True)
+        sys.exit(1 if generate_files(sx_files, out_dir, args.jobs, args.cache_dir, args.force,
+                                        args.fusemap_port, args.verilog) else 0)
+
+    if not args.sx:
+        parser.error('no device given')
+
+    if args.profile:
+        sys.exit(profile(args))
+
+    dev = load_device(args.sx[0], args.cache_dir)
+    if args.fusemap:
+        import jedec
+        jed = jedec.Jedec()
+        jed.load(args.fusemap, verify=True)
+        gen = lc4k_specializer(dev, jed.fuse_data)
+    else:
+        gen = generator_class(args.fusemap_port, args.verilog)(dev)
+    gen.generate(dev.sx, args.output)
+
+
+def profile(args):
+    '''Generate the core of args.sx[0] like main() does, under the profiler.'''
+    fuses = None
+    if args.fusemap:
+        import jedec
+        jed = jedec.Jedec()
+        jed.load(args.fusemap, verify=True)
+        fuses = jed.fuse_data
+
+    def run(gen_class):
+        start = time.perf_counter()
+        dev = load_device(args.sx[0], args.cache_dir)
+        t_load = time.perf_counter() - start
+        gen = gen_class(dev, fuses) if fuses is not None else gen_class(dev)
+        gen.generate(dev.sx, args.output or os.devnull)
+        return dev, t_load, time.perf_counter() - start
+
+    gen_class = lc4k_specializer if fuses is not None else generator_class(args.fusemap_port, args.verilog)
+
+    if os.path.splitext(args.profile)[1] in ('.prof', '.pstats'):
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.runcall(run, gen_class)
+        profiler.dump_stats(args.profile)
+        return 0
+
+    from lc4k_profile import lc4k_profiler
+    profiler = lc4k_profiler(memory=args.profile_memory)
+    with profiler.run():
+        dev, t_load, t_total = run(profiler.wrap(gen_class))
+
+    report = {'device': dev.name, 'generator': gen_class.__name__, 'load': t_load, 'total': t_total}
+    report.update(profiler.report())
+    with open(args.profile, 'w') as f:
+        json.dump(report, f, indent=1)
+        f.write('\n')
+
+    print(f'{dev.name}: load {t_load:.3f}s, total {t_total:.3f}s', file=sys.stderr)
+    for name, phase in sorted(report['phases'].items(), key=lambda item: -item[1]['seconds']):
+        print(f"  {name:<28s} {phase['seconds']:8.3f}s", file=sys.stderr)
+    return 0
 
 
 
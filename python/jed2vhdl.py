@@ -1,9 +1,23 @@
 #--------------------------------------------------------------------
 #
-# jed2vhdl.py <jed file>
+# jed2vhdl.py <jed file> <width> [-b] [-x | -z]
+# jed2vhdl.py <jed file or dir> [...] <width> [-b] [-x | -z] -d <out dir>
+# jed2vhdl.py <jed file or dir> [...] <width> [-x] -p [-w <core>] [-d <out dir>]
 #
 # Convert a .jed file into a std_logic_vector that's suitable for
-# the jedecmap generic. The vector is printed to stdout.
+# the jedecmap generic. The vector is printed to stdout, with -x as
+# hex bit string literals. -z prints the indices of the '0' fuses
+# instead, as string for the g_fusemap_zeros generic.
+#
+# With -d, any number of .jed files and directories thereof are
+# converted in one go. Each vector is written to <out dir>/<name>.fusemap.
+#
+# -p emits the vector as constant c_fusemap of the VHDL package
+# <name>_fusemap_pkg, written to <out dir>/<name>_fusemap_pkg.vhd with -d.
+# -w additionally writes the wrapper <out dir>/<name>_cpld.vhd, it has the
+# ports of the generated core <core> and sets its g_fusemap from the
+# package. A new fusemap of the design only changes the package, the core
+# and src/rtl stay analyzed.
 #
 # Core functionality is taken from Chris Alfred's suite at
 #   https://github.com/ChrisEAlfred/galparse
@@ -15,6 +29,8 @@
 #--------------------------------------------------------------------
 
 # System
+import argparse
+import re
 import sys
 import os
 
@@ -25,50 +41,199 @@ import jedec
 # Private
 #--------------------------------------------------------------------
 
+#--------------------------------------------------------------------
+# Public
+#--------------------------------------------------------------------
+
+def hex_literal(fuses):
+    '''Hex digits of fuses (bytes of '0'/'1'), the length must be a multiple of 4.'''
+    return format(int(fuses, 2), '0{}X'.format(len(fuses) // 4)).encode('ascii') if fuses else b''
+
+def fusemap_vector(fuses, max_fnum, bare=False, hex=False):
+    '''
+    Format fuses (bytes of '0'/'1') as VHDL std_logic_vector, max_fnum bits
+    per line and '&' concatenation. Only 1s and 0s with bare.
+
+    With hex, lines are x"..." bit string literals of max_fnum rounded down
+    to whole nibbles. A trailing partial nibble is appended as binary
+    string. Bare hex is a single x"..." literal.
+    '''
+    if hex:
+        whole = len(fuses) - len(fuses) % 4
+        if bare:
+            if whole != len(fuses):
+                raise ValueError('{} fuses don\'t fit a single hex literal'.format(len(fuses)))
+            return 'x"{}"\n'.format(hex_literal(fuses).decode('ascii'))
+
+        max_fnum = max(4, max_fnum - max_fnum % 4)
+        lines = [b'x"' + hex_literal(fuses[start:min(start+max_fnum, whole)]) + b'"' for start in range(0, whole, max_fnum)]
+        if whole != len(fuses):
+            lines.append(b'"' + fuses[whole:] + b'"')
+        return (b' &\n'.join(lines) + b'\n').decode('ascii')
+
+    lines = [fuses[start:start+max_fnum] for start in range(0, len(fuses), max_fnum)]
+    if bare:
+        return (b'\n'.join(lines) + b'\n').decode('ascii')
+    return (b'"' + b'" &\n"'.join(lines) + b'"\n').decode('ascii') if lines else '\n'
+
+def zero_fuses(fuses):
+    '''Indices of the '0' fuses.'''
+    zeros = []
+    index = fuses.find(b'0')
+    while index >= 0:
+        zeros.append(index)
+        index = fuses.find(b'0', index + 1)
+    return zeros
+
+def fusemap_zeros(fuses, max_num, bare=False):
+    '''
+    Format the indices of '0' fuses as string for g_fusemap_zeros, max_num
+    indices per line and '&' concatenation. Only the indices with bare.
+    '''
+    zeros = [str(index) for index in zero_fuses(fuses)]
+    lines = [' '.join(zeros[start:start+max_num]) for start in range(0, len(zeros), max_num)]
+    if bare:
+        return ' '.join(lines) + '\n'
+    return '"' + ' " &\n"'.join(lines) + '"\n'
+
+def design_name(jedec_file):
+    '''Name of the design of jedec_file as VHDL identifier, from its file name.'''
+    name = re.sub(r'[^a-z0-9]+', '_', os.path.splitext(os.path.basename(jedec_file))[0].lower()).strip('_')
+    return name if name[:1].isalpha() else 'd_' + name
+
+def fusemap_package(fuses, max_fnum, name, hex=False):
+    '''VHDL package <name>_fusemap_pkg with fuses (bytes of '0'/'1') as constant c_fusemap.'''
+    return ('library ieee;\n'
+            'use ieee.std_logic_1164.all;\n'
+            '\n'
+            'package {0}_fusemap_pkg is\n'
+            '\n'
+            '  constant c_fusemap : std_logic_vector(0 to {1}-1) :=\n'
+            '{2};\n'
+            '\n'
+            'end;\n').format(name, len(fuses), fusemap_vector(fuses, max_fnum, hex=hex).rstrip('\n'))
+
+def core_ports(core_file):
+    '''
+    Entity name and ports (name, mode) of a core generated by gen_lc4k_core,
+    ValueError if it has no g_fusemap generic.
+    '''
+    with open(core_file) as f:
+        text = f.read()
+    match = re.search(r'^entity (\w+) is(.*?)^end;', text, re.MULTILINE | re.DOTALL)
+    if not match:
+        raise ValueError('no entity found')
+    if not re.search(r'^\s+g_fusemap\s*:', match.group(2), re.MULTILINE):
+        raise ValueError('entity {} has no g_fusemap generic'.format(match.group(1)))
+    ports = re.findall(r'^\s+(\w+)\s*:\s*(in|out)\s+std_logic\b', match.group(2), re.MULTILINE)
+    return match.group(1), ports
+
+def fusemap_wrapper(core, ports, name):
+    '''
+    VHDL wrapper <name>_cpld with the ports of entity core, its g_fusemap
+    is c_fusemap of the package <name>_fusemap_pkg.
+    '''
+    width = max([len(port) for port, mode in ports])
+    lines = ['library ieee;',
+             'use ieee.std_logic_1164.all;',
+             '',
+             'entity {}_cpld is'.format(name),
+             '  port (',
+             ';\n'.join(['    {:<{}s} : {:<3s} std_logic'.format(port, width, mode) for port, mode in ports]),
+             '  );',
+             'end;',
+             '',
+             'use work.{}_fusemap_pkg.all;'.format(name),
+             '',
+             'architecture struct of {}_cpld is'.format(name),
+             'begin',
+             '',
+             '  core_b : entity work.{}'.format(core),
+             '    generic map (',
+             '      g_fusemap => c_fusemap',
+             '    )',
+             '    port map (',
+             ',\n'.join(['      {:<{}s} => {}'.format(port, width, port) for port, mode in ports]),
+             '    );',
+             '',
+             'end;']
+    return '\n'.join(lines) + '\n'
+
+def convert(jedec_file, max_fnum, bare=False, hex=False, zeros=False, package=False):
+    jed = jedec.Jedec()
+    jed.load(jedec_file)
+    if package:
+        return fusemap_package(jed.fuses, max_fnum, design_name(jedec_file), hex)
+    if zeros:
+        return fusemap_zeros(jed.fuses, max_fnum, bare)
+    return fusemap_vector(jed.fuses, max_fnum, bare, hex)
+
+def fusemap_filename(jedec_file, package=False):
+    if package:
+        return design_name(jedec_file) + '_fusemap_pkg.vhd'
+    return os.path.splitext(os.path.basename(jedec_file))[0] + '.fusemap'
+
+def wrapper_filename(jedec_file):
+    return design_name(jedec_file) + '_cpld.vhd'
+
 #--------------------------------------------------------------------
 # Public - Main
 #--------------------------------------------------------------------
 
 if __name__ == '__main__':
 
-    jedec_file = sys.argv[1]
-    max_fnum = int(sys.argv[2])
-    bare = False
-    if len(sys.argv) >= 4:
-        if sys.argv[3] == '-b':
-            bare = True
-
-    # Load the fuse data
-    jedec = jedec.Jedec()
-    jedec.load(jedec_file)
-
-    # Print fuse map as VHDL std_logic_vector
-    # max_fnum bits per line, '&' concatenation
-    fnum = 0
-    l = ''
-    first = True
-    for f in jedec.fuse_data:
-        if fnum == 0:
-            if first:
-                first = False
-            else:
-                print(' &' if not bare else '')
-            if not bare:
-                l += '"'
-
-        l += f
-        fnum += 1
-        if fnum == max_fnum:
-            if not bare:
-                l += '"'
-            print(l, end='')
-            l = ''
-            fnum = 0
-
-    if fnum > 0:
-        if not bare:
-            l += '"'
-        print(l)
-    else:
-        print()
+    parser = argparse.ArgumentParser(description='Convert JEDEC files to fusemap vectors for g_fusemap.')
+    parser.add_argument('jed', nargs='+', help='JEDEC file, several files or directories with -d')
+    parser.add_argument('width', type=int, help='number of bits per line')
+    parser.add_argument('-b', '--bare', action='store_true', help='omit \'"\' and \'&\', only 1s and 0s')
+    parser.add_argument('-x', '--hex', action='store_true', help='x"..." hex literals, 4 bits per character')
+    parser.add_argument('-z', '--zeros', action='store_true',
+                        help='list of \'0\' fuse indices for g_fusemap_zeros, <width> indices per line')
+    parser.add_argument('-p', '--package', action='store_true',
+                        help='VHDL package <name>_fusemap_pkg with the vector as constant c_fusemap')
+    parser.add_argument('-w', '--wrapper', metavar='CORE',
+                        help='with -p and -d, also write the wrapper <name>_cpld of this generated core')
+    parser.add_argument('-d', '--out-dir', help='write <name>.fusemap files to this directory')
+    args = parser.parse_args()
+
+    if args.hex and args.zeros:
+        parser.error('-x and -z are exclusive')
+    if args.package and (args.bare or args.zeros):
+        parser.error('-p can\'t be combined with -b or -z')
+    if args.wrapper and not (args.package and args.out_dir):
+        parser.error('-w requires -p and -d')
+
+    if not args.out_dir:
+        if len(args.jed) > 1 or os.path.isdir(args.jed[0]):
+            parser.error('multiple files or directories require -d')
+        try:
+            sys.stdout.write(convert(args.jed[0], args.width, args.bare, args.hex, args.zeros, args.package))
+        except ValueError as e:
+            sys.exit('{}: {}'.format(args.jed[0], e))
+        sys.exit(0)
+
+    if args.wrapper:
+        try:
+            core, ports = core_ports(args.wrapper)
+        except (OSError, ValueError) as e:
+            sys.exit('{}: {}'.format(args.wrapper, e))
+
+    jedec_files = jedec.find_jed_files(args.jed)
+    os.makedirs(args.out_dir, exist_ok=True)
+    failed = 0
+    for jedec_file in jedec_files:
+        try:
+            vector = convert(jedec_file, args.width, args.bare, args.hex, args.zeros, args.package)
+        except (OSError, ValueError) as e:
+            print('{}: {}'.format(jedec_file, e), file=sys.stderr)
+            failed += 1
+            continue
+
+        with open(os.path.join(args.out_dir, fusemap_filename(jedec_file, args.package)), 'w') as f:
+            f.write(vector)
+        if args.wrapper:
+            with open(os.path.join(args.out_dir, wrapper_filename(jedec_file)), 'w') as f:
+                f.write(fusemap_wrapper(core, ports, design_name(jedec_file)))
 
+    print('{} files converted, {} failed'.format(len(jedec_files) - failed, failed), file=sys.stderr)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,70 @@
+#--------------------------------------------------------------------
+#
+# jedcheck.py <jed file or dir> [...] [-j <jobs>] [-q]
+#
+# Verify the fuse checksum of JEDEC files. Directories are searched
+# recursively for .jed files. Prints one line per file and exits with
+# status 1 if any file fails.
+#
+#--------------------------------------------------------------------
+
+#--------------------------------------------------------------------
+# Imports
+#--------------------------------------------------------------------
+
+# System
+import argparse
+import sys
+
+# local
+import jedec
+
+#--------------------------------------------------------------------
+# Private
+#--------------------------------------------------------------------
+
+def check(jedec_file):
+    '''Returns (status, message), status is 'ok', 'none' without C field or 'fail'.'''
+    jed = jedec.Jedec()
+    try:
+        jed.load(jedec_file)
+    except (OSError, ValueError) as e:
+        return 'fail', str(e)
+
+    computed = jed.compute_checksum()
+    if not jed.has_checksum:
+        return 'none', '{:04X}'.format(computed)
+    if not jed.verify_checksum():
+        return 'fail', '{:04X}, C field says {}'.format(computed, jed.checksum)
+    return 'ok', '{:04X}'.format(computed)
+
+#--------------------------------------------------------------------
+# Public - Main
+#--------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Verify the fuse checksum of JEDEC files.')
+    parser.add_argument('jed', nargs='+', help='JEDEC files or directories')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of worker processes')
+    parser.add_argument('-q', '--quiet', action='store_true', help='only report failures')
+    args = parser.parse_args()
+
+    files = jedec.find_jed_files(args.jed)
+
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(check, files, chunksize=64))
+    else:
+        results = map(check, files)
+
+    failed = 0
+    for jedec_file, (status, message) in zip(files, results):
+        if status == 'fail':
+            failed += 1
+        if status == 'fail' or not args.quiet:
+            print('{:<4s}  {}  {}'.format(status.upper(), jedec_file, message))
+
+    print('{} files, {} failed'.format(len(files), failed), file=sys.stderr)
+    sys.exit(1 if failed else 0)
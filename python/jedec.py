@@ -19,11 +19,63 @@
 #   * N command: Skip entire command line
 #   * V command: Skip entire test vector line
 #
+# Arnim Laeuger 2026-10-18:
+#   * Parse the file in bulk, field by field
+#   * Store fuses as bytearray of '0'/'1', fuse_data is a str view on it
+#   * 2D view and NumPy array in the row/column layout of the core
+#   * Fuse checksum computation and verification
+#   * V command: Optionally parse test vectors, NumPy arrays by QP pin
+#   * find_jed_files() for the batch tools
+#   * Write JEDEC files, format() and save()
+#
 
 #--------------------------------------------------------------------
 # Imports
 #--------------------------------------------------------------------
 
+import glob
+import os
+
+#--------------------------------------------------------------------
+# Exceptions
+#--------------------------------------------------------------------
+
+class ChecksumError(ValueError):
+    pass
+
+#--------------------------------------------------------------------
+# Test vectors
+#--------------------------------------------------------------------
+
+# Test conditions of V fields, one character per pin:
+#   0, 1   drive input low/high
+#   C, K   drive clock pulse low-high-low/high-low-high
+#   H, L   expect output high/low
+#   Z      expect output high impedance
+#   X      don't care
+#   N      power pin, not tested
+#   F      float input
+#   P, B   preload and buried register, unsupported and ignored
+VECTOR_CONDITIONS = b'01CKHLZXNFPB'
+
+# vector_values() expect codes
+EXPECT_NONE = -1
+EXPECT_Z    = 2
+
+#--------------------------------------------------------------------
+# Files
+#--------------------------------------------------------------------
+
+def find_jed_files(paths):
+    '''Sorted .jed files of paths, directories are searched recursively.'''
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += glob.glob(os.path.join(path, '**', '*.jed'), recursive=True)
+        else:
+            files.append(path)
+    return sorted(files)
+
 #--------------------------------------------------------------------
 # Class
 #--------------------------------------------------------------------
@@ -32,11 +84,14 @@ class Jedec:
 
     def __init__(self):
         self._header_lines = []
-        self.fuse_data = [0] * 0
+        self.fuses = bytearray()
         self.number_of_pins = 0
         self.number_of_fuses = 0
         self.default_fuse_value = -1
         self.checksum = '0000'
+        self.has_checksum = False
+        self.vectors = bytearray()
+        self.vector_numbers = []
         self.debug = False
 
     #----------------------------------------------------------------
@@ -47,136 +102,222 @@ class Jedec:
         # Is all required information available?
         if self.number_of_fuses > 0 and self.default_fuse_value != -1:
             # Initialise data array to default value
-            self.fuse_data = [self.default_fuse_value] * self.number_of_fuses
+            self.fuses = bytearray(self.default_fuse_value, 'ascii') * self.number_of_fuses
+
+    def _load_fuses(self, field):
+        # L<number> followed by fuse characters, whitespace is insignificant
+        words = field[1:].split(None, 1)
+        fuse_number = int(words[0])
+        data = words[1].translate(None, b' \t\r\n') if len(words) > 1 else b''
+        end = fuse_number + len(data)
+        if self.debug:
+            print('[Fuse {}]'.format(fuse_number))
+
+        if end > len(self.fuses):
+            raise ValueError('fuses {}..{} beyond fuse count {}'.format(fuse_number, end - 1, len(self.fuses)))
+        if data.translate(None, b'01'):
+            raise ValueError('invalid fuse data at fuse {}'.format(fuse_number))
+
+        self.fuses[fuse_number:end] = data
+
+    def _load_vector(self, field):
+        # V<number> followed by one test condition per pin
+        words = field[1:].split(None, 1)
+        vector_number = int(words[0])
+        data = words[1].translate(None, b' \t\r\n') if len(words) > 1 else b''
+
+        if len(data) != self.number_of_pins:
+            raise ValueError('vector {} has {} pins, QP says {}'.format(vector_number, len(data), self.number_of_pins))
+        if data.upper().translate(None, VECTOR_CONDITIONS):
+            raise ValueError('invalid test condition in vector {}'.format(vector_number))
+
+        self.vectors += data.upper()
+        self.vector_numbers.append(vector_number)
 
     #----------------------------------------------------------------
     # Public
     #----------------------------------------------------------------
 
-    def load(self, file):
-
-        got_asterisk = False
-        in_header = True
-        fuse_number = 0
-        try:
-            fp = open(file, 'r')
-            for line in fp:
-
-                # Strip CRLF and trailing spaces
-                line = line.rstrip()
-
-                # Remove leading * if present
-                if line.startswith('*'):
-                    if not got_asterisk:
-                        got_asterisk = True
-                        in_header = False
-                    line = line[1:]
-
-                # Remove trailing * if present
-                if line.endswith('*'):
-                    got_asterisk = True
-                    line = line[:-1]
-
-                words = line.split()
-
-                if in_header:
-
-                    # This is a header line
-                    if self.debug:
-                        print("Header: " + line)
-                    self._header_lines.append(line)
-
-                    if got_asterisk:
-                        if self.debug:
-                            print("[End of header]")
-                        in_header = False
-
-
-                if not in_header:
-
-                    # Loop through all commands in a line
-                    # Each command processing block is supposed to remove its words from the list
-                    while len(words) > 0:
-                        # Remove leading * on word
-                        if words[0].startswith('*'):
-                            words[0] = words[0][1:]
-                        # Remove trailing * on word
-                        if words[0].endswith('*'):
-                            words[0] = words[0][:-1]
-
-                        # Check keywords
-                        if words[0].startswith('QP'):
-                            # Number of pins
-                            self.number_of_pins = int(words[0][2:])
-                            words.pop(0)
-                            if self.debug:
-                                print('[Pins {}]'.format(self.number_of_pins))
-
-                        elif words[0].startswith('F'):
-                            # Default fuse value
-                            self.default_fuse_value = words[0][1:]
-                            words.pop(0)
-                            if self.debug:
-                                print('[Fuse default {}]'.format(self.default_fuse_value))
-
-                            # Try to init fuses if all information is now available
-                            self._init_fuses()
-
-                        elif words[0].startswith('QF'):
-                            # Number of fuses
-                            self.number_of_fuses = int(words[0][2:])
-                            words.pop(0)
-                            if self.debug:
-                                print('[Fuses {}]'.format(self.number_of_fuses))
-
-                            # Try to init fuses if all information is now available
-                            self._init_fuses()
-
-                        elif words[0].startswith('C'):
-                            # Checksum
-                            self.checksum = words[0][1:]
-                            words.pop(0)
-                            if self.debug:
-                                print('[Checksum {}]'.format(self.checksum))
-
-                        elif words[0].startswith('L'):
-                            # Fuse index header line
-                            fuse_number = int(words[0][1:])
-                            words.pop(0)
-                            if self.debug:
-                                print('[Fuse {}]'.format(fuse_number))
-
-                            # The fuse data is read by the standalone block below
-
-                        elif words[0].startswith('0') or words[0].startswith('1'):
-                            # Fuse data on line by self
-                            data = words[0]
-                            words.pop(0)
-                            if self.debug:
-                                print('{:04d}: {}'.format(fuse_number, data))
-
-                            # Copy fuse data to array
-                            for v in data:
-                                self.fuse_data[fuse_number] = v
-                                fuse_number = fuse_number + 1
-
-                        elif words[0].startswith('N'):
-                            # Comment line
-                            if self.debug:
-                                print('[Comment {}]'.format(' '.join(words)))
-                            words = []
-
-                        elif words[0].startswith('V'):
-                            # Test vector line
-                            if self.debug:
-                                print('[Test vector {}]'.format(' '.join(words)))
-                            words = []
-
-                        else:
-                            words.pop(0)
-                            pass
-
-        finally:
-            fp.close()
-        
+    @property
+    def fuse_data(self):
+        '''Fuses as string of '0' and '1' characters, indexed by fuse number.'''
+        return self.fuses.decode('ascii')
+
+    @fuse_data.setter
+    def fuse_data(self, value):
+        self.fuses = bytearray(''.join(value), 'ascii')
+
+    def view(self, num_columns):
+        '''
+        2D view on the fuses, view[row, column] is fm(row, column) of the
+        generated core. Items are the character codes of '0' and '1'.
+        '''
+        return memoryview(self.fuses).cast('B', (len(self.fuses) // num_columns, num_columns))
+
+    def array(self, num_columns=None):
+        '''Fuses as NumPy uint8 array of 0 and 1, with num_columns as rows x columns.'''
+        import numpy as np
+
+        fuses = np.frombuffer(self.fuses, dtype=np.uint8) - ord('0')
+        if num_columns:
+            fuses = fuses.reshape(-1, num_columns)
+        return fuses
+
+    @property
+    def number_of_vectors(self):
+        return len(self.vector_numbers)
+
+    def vector_array(self):
+        '''
+        Test vectors as NumPy uint8 array of condition characters, vectors x
+        pins. Column pin-1 is pin of the QP numbering.
+        '''
+        import numpy as np
+
+        return np.frombuffer(bytes(self.vectors), dtype=np.uint8).reshape(-1, self.number_of_pins)
+
+    def vector_values(self):
+        '''
+        Test vectors decoded into NumPy arrays, vectors x pins each:
+
+          drive   int8, 0 or 1 driven, -1 not driven. The level between
+                  pulses for C and K.
+          pulse   bool, C or K pulse on the pin
+          expect  int8, 0 or 1 expected, EXPECT_Z for high impedance,
+                  EXPECT_NONE don't care
+        '''
+        import numpy as np
+
+        chars = self.vector_array()
+        drive = np.full(chars.shape, -1, dtype=np.int8)
+        expect = np.full(chars.shape, EXPECT_NONE, dtype=np.int8)
+        for char, level in ((b'0', 0), (b'1', 1), (b'C', 0), (b'K', 1)):
+            drive[chars == ord(char)] = level
+        for char, level in ((b'L', 0), (b'H', 1), (b'Z', EXPECT_Z)):
+            expect[chars == ord(char)] = level
+        pulse = (chars == ord('C')) | (chars == ord('K'))
+        return drive, pulse, expect
+
+    def compute_checksum(self):
+        '''
+        JEDEC fuse checksum: 16 bit sum of the fuses packed into bytes,
+        fuse 0 is the LSB of the first byte.
+        '''
+        if not self.fuses:
+            return 0
+        # reversed, the fuses are the binary digits of one little endian integer
+        packed = int(self.fuses[::-1], 2).to_bytes((len(self.fuses) + 7) // 8, 'little')
+        return sum(packed) & 0xffff
+
+    def verify_checksum(self):
+        '''True if the fuses match the C field, or if there is none.'''
+        if not self.has_checksum:
+            return True
+        return self.compute_checksum() == int(self.checksum, 16)
+
+    def load(self, file, verify=False, vectors=False):
+        '''
+        Load a JEDEC file, with verify a checksum mismatch raises
+        ChecksumError. Test vectors are skipped unless vectors is set.
+        '''
+        with open(file, 'rb') as fp:
+            self.parse(fp.read(), vectors)
+
+        if verify and not self.verify_checksum():
+            raise ChecksumError('{}: fuse checksum is {:04X}, C field says {}'.format(
+                file, self.compute_checksum(), self.checksum))
+
+    def format(self, header='', num_columns=80):
+        '''
+        The fuses as contents of a JEDEC file, bytes with num_columns fuses
+        per L field, the fuse checksum and the transmission checksum.
+        '''
+        fields = ['\x02{}*'.format(header), 'QF{}*'.format(len(self.fuses))]
+        if self.number_of_pins:
+            fields.append('QP{}*'.format(self.number_of_pins))
+        fields.append('F0*')
+        for start in range(0, len(self.fuses), num_columns):
+            fields.append('L{:05d} {}*'.format(start, self.fuses[start:start+num_columns].decode('ascii')))
+        fields.append('C{:04X}*'.format(self.compute_checksum()))
+
+        data = ('\r\n'.join(fields) + '\r\n\x03').encode('ascii')
+        return data + '{:04X}\r\n'.format(sum(data) & 0xffff).encode('ascii')
+
+    def save(self, file, header='', num_columns=80):
+        '''Write the fuses as JEDEC file, see format().'''
+        with open(file, 'wb') as fp:
+            fp.write(self.format(header, num_columns))
+
+    def parse(self, data, vectors=False):
+        '''Parse the contents of a JEDEC file given as bytes, test vectors with vectors.'''
+
+        # The transmission is framed by STX and ETX
+        stx = data.find(b'\x02')
+        if stx >= 0:
+            data = data[stx+1:]
+        etx = data.find(b'\x03')
+        if etx >= 0:
+            data = data[:etx]
+
+        # The design specification up to the first '*' is the header,
+        # all fields after are terminated by '*'
+        fields = data.split(b'*')
+        self._header_lines = [line.rstrip() for line in fields[0].decode('ascii', 'replace').splitlines()]
+        if self.debug:
+            for line in self._header_lines:
+                print("Header: " + line)
+            print("[End of header]")
+
+        for field in fields[1:]:
+            field = field.strip()
+            if not field:
+                continue
+
+            # Fuse data, by far the most frequent field
+            if field.startswith(b'L'):
+                self._load_fuses(field)
+
+            elif field.startswith(b'QP'):
+                # Number of pins
+                self.number_of_pins = int(field[2:])
+                if self.debug:
+                    print('[Pins {}]'.format(self.number_of_pins))
+
+            elif field.startswith(b'QF'):
+                # Number of fuses
+                self.number_of_fuses = int(field[2:])
+                if self.debug:
+                    print('[Fuses {}]'.format(self.number_of_fuses))
+
+                # Try to init fuses if all information is now available
+                self._init_fuses()
+
+            elif field.startswith(b'F'):
+                # Default fuse value
+                self.default_fuse_value = field[1:2].decode('ascii')
+                if self.debug:
+                    print('[Fuse default {}]'.format(self.default_fuse_value))
+
+                # Try to init fuses if all information is now available
+                self._init_fuses()
+
+            elif field.startswith(b'C'):
+                # Checksum
+                self.checksum = field[1:].decode('ascii')
+                self.has_checksum = True
+                if self.debug:
+                    print('[Checksum {}]'.format(self.checksum))
+
+            elif field.startswith(b'N'):
+                # Comment
+                if self.debug:
+                    print('[Comment {}]'.format(field[1:].decode('ascii', 'replace')))
+
+            elif field.startswith(b'V'):
+                # Test vector
+                if self.debug:
+                    print('[Test vector {}]'.format(field.decode('ascii', 'replace')))
+                if vectors:
+                    self._load_vector(field)
+
         return
@@ -0,0 +1,297 @@
+#
+# LC4K Cross-check
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_crosscheck.py <re4k dir> <tests dir> [-s <steps>] [-l <lanes>]
+#
+# Checks the Python tools on the fusemaps of the test wrappers,
+# tests/<test>/<device>/cpld/*_cpld.vhd. Each design is anchored by the
+# golden vectors in tests/<test>/<device>/golden.json, derived from the
+# golden RTL: the RTL ports are connected to the device pins like in the
+# wrapper and the vectors are replayed with lc4k_replay.
+#
+# The tools are also cross-checked against each other with random
+# stimulus. The dedicated clock pins toggle every step.
+#
+#   lc4k_eval      pin outputs for the register state of each simulation
+#                  step, against lc4k_sim
+#   lc4k_netlist   pin outputs of each step, against lc4k_sim, the netlist
+#                  is evaluated here with the register model of lc4k_sim
+#   lc4k_replay    vectors with the netlist outputs as expectations, the
+#                  clock pins are pulsed, only devices with numbered pins
+#
+# Outputs are compared when enabled. Prints one line per fusemap and exits
+# with status 1 if any check fails.
+#
+# golden.json lists the RTL port bits, like "i_d(0)", and the vectors, one
+# test condition of the JEDEC V field per port, see jedec.VECTOR_CONDITIONS.
+# Spaces in vectors are ignored. Unconnected pins of the wrapper are driven
+# '1' like its ncon signal.
+#
+
+import json
+
+import numpy as np
+
+import jedec
+from lc4k_eval import lc4k_evaluator, pack, unpack
+from lc4k_sim import lc4k_simulator
+from lc4k_netlist import lc4k_netlist, FALSE, LATCH, TRUE
+from lc4k_replay import lc4k_replay
+from lc4k_wrapper import wrapper_fusemap, wrapper_ports
+
+
+def golden_vectors(filename, wrapper):
+    '''
+    Golden vectors of a test design for the pins of its wrapper. Returns the
+    pin of each column, the port of each column (None for unconnected pins)
+    and the vectors as jedec.Jedec.
+    '''
+    with open(filename) as f:
+        golden = json.load(f)
+    inputs, outputs, ncon = wrapper_ports(wrapper)
+
+    ports = golden['ports']
+    unknown = [port for port in ports if port not in inputs and port not in outputs]
+    if unknown:
+        raise ValueError(f'{filename}: ports {" ".join(unknown)} aren\'t connected in the wrapper')
+    columns = [inputs.get(port) or outputs[port] for port in ports] + ncon
+
+    text = [f'golden vectors*QP{len(columns)}*']
+    for number, vector in enumerate(golden['vectors'], 1):
+        vector = vector.replace(' ', '')
+        if len(vector) != len(ports):
+            raise ValueError(f'{filename}: vector {number} has {len(vector)} conditions, {len(ports)} ports')
+        text.append(f'V{number:04d} {vector}{"1" * len(ncon)}*')
+    jed = jedec.Jedec()
+    jed.parse(''.join(text).encode('ascii'), vectors=True)
+    return columns, ports + [None] * len(ncon), jed
+
+def check_golden(fusemap, golden_file, wrapper):
+    '''Replay of the golden vectors, returns the first mismatch or None.'''
+    columns, ports, jed = golden_vectors(golden_file, wrapper)
+    failed = lc4k_replay(fusemap, len(columns), columns).check(jed)
+    if failed.any():
+        vector, col = np.argwhere(failed)[0]
+        return f'golden: vector {vector + 1} port {ports[col]} (pin {columns[col]}) failed'
+    return None
+
+
+class netlist_sim():
+
+    def __init__(self, netlist):
+        '''Step by step evaluation of a lc4k_netlist for one lane, following lc4k_simulator.'''
+        self.netlist = netlist
+        self.flops   = [ports for celltype, ports in netlist.cells if celltype != LATCH]
+        self.latches = [ports for celltype, ports in netlist.cells if celltype == LATCH]
+        self.regs = {q: int(value) for q, value in netlist.init.items()}
+        self.prev_clk = None
+
+    def values(self, inputs, regs):
+        '''Function that evaluates a net for the input ports and register outputs.'''
+        memo = dict(inputs)
+        memo.update(regs)
+        memo[TRUE]  = 1
+        memo[FALSE] = 0
+        covers = self.netlist.covers
+
+        def value(net):
+            net = self.netlist.resolve(net)
+            if net in memo:
+                if memo[net] is None:
+                    raise ValueError(f'combinational loop at {net}')
+                return memo[net]
+            memo[net] = None
+            memo[net] = int(any(all(value(literal) == bit for literal, bit in cube) for cube in covers[net]))
+            return memo[net]
+
+        return value
+
+    def step(self, inputs):
+        '''One step for the input ports, returns the net evaluation function after the update.'''
+        value = self.values(inputs, self.regs)
+        regs = dict(self.regs)
+
+        clk = {}
+        for ports in self.flops:
+            q = ports['Q']
+            clk[q] = value(ports['C'])
+            if self.prev_clk is not None and not self.prev_clk[q] and clk[q]:
+                regs[q] = value(ports['D'])
+            regs[q] = 0 if value(ports['R']) else 1 if value(ports['S']) else regs[q]
+
+        controls = {ports['Q']: (value(ports['E']), value(ports['S']), value(ports['R'])) for ports in self.latches}
+        for _ in range(0, len(self.latches) + 2):
+            value = self.values(inputs, regs)
+            changed = False
+            for ports in self.latches:
+                q = ports['Q']
+                enable, preset, reset = controls[q]
+                latched = 0 if reset else 1 if preset else value(ports['D']) if enable else self.regs[q]
+                if latched != regs[q]:
+                    regs[q] = latched
+                    changed = True
+            if not changed:
+                break
+        else:
+            raise ValueError('latch loop, transparent latches don\'t settle')
+
+        self.regs = regs
+        self.prev_clk = clk
+        return self.values(inputs, regs)
+
+
+def clock_stimulus(sim, steps, lanes, rng):
+    '''Random pins, steps x lanes x input_pins, the dedicated clock pins toggle every step.'''
+    stimulus = rng.integers(0, 2, (steps, lanes, sim.num_pins), dtype=np.uint8).astype(bool)
+    for clkpin in sim.fusemap.clk_pins().values():
+        stimulus[:, :, sim.input_pins.index(clkpin)] = (np.arange(steps) % 2 == 1)[:, None]
+    return stimulus
+
+def mismatch(name, step, lane, pin, expected, got):
+    return f'{name}: step {step} lane {lane} pin {pin}, (o, oe) {expected} expected, {got}'
+
+def check_eval(sim, stimulus):
+    '''lc4k_eval against lc4k_sim, returns the first mismatch or None.'''
+    evaluator = lc4k_evaluator(sim.fusemap)
+    steps, lanes = stimulus.shape[:2]
+    regs = sim.initial_state((lanes + 63) // 64)
+    clk = None
+    for step in range(0, steps):
+        pins = pack(stimulus[step])
+        regs, clk, pts = sim.step(pins, regs, clk)
+        out, oe = [unpack(words, lanes) for words in sim.outputs(pins, regs, pts)]
+        eval_out, eval_oe = evaluator.evaluate(stimulus[step], unpack(regs, lanes))
+        bad = (oe != eval_oe) | (oe & (out != eval_out))
+        if bad.any():
+            lane, idx = np.argwhere(bad)[0]
+            return mismatch('lc4k_eval', step, lane, sim.output_pins[idx],
+                            (int(out[lane, idx]), int(oe[lane, idx])), (int(eval_out[lane, idx]), int(eval_oe[lane, idx])))
+    return None
+
+def netlist_inputs(netlist, sim, pins):
+    inputs = {port: 0 for port in netlist.inputs}
+    inputs.update({f'i_{pin}': int(value) for pin, value in zip(sim.input_pins, pins)})
+    return inputs
+
+def check_netlist(sim, netlist, stimulus):
+    '''lc4k_netlist against lc4k_sim, returns the first mismatch or None.'''
+    out, oe, state = sim.run(stimulus)
+    for lane in range(0, stimulus.shape[1]):
+        model = netlist_sim(netlist)
+        for step in range(0, stimulus.shape[0]):
+            value = model.step(netlist_inputs(netlist, sim, stimulus[step, lane]))
+            for idx, pin in enumerate(sim.output_pins):
+                got = (value(f'o_{pin}'), value(f'oe_{pin}'))
+                expected = (int(out[step, lane, idx]), int(oe[step, lane, idx]))
+                if expected[1] != got[1] or (got[1] and expected != got):
+                    return mismatch('lc4k_netlist', step, lane, pin, expected, got)
+    return None
+
+def check_replay(sim, netlist, vectors, rng):
+    '''
+    lc4k_replay of vectors with the netlist outputs as expectations.
+    Returns the first mismatch, None or 'skipped' for devices without
+    numbered pins.
+    '''
+    dev = sim.fusemap.dev
+    pins = [pin[1] for pin in dev.search('input_threshold/pin')]
+    if not all(isinstance(pin, int) for pin in pins):
+        return 'skipped'
+
+    replay = lc4k_replay(sim.fusemap, max(pins))
+    columns = replay.columns
+    clk_columns = [columns.index(pin) for pin in sim.fusemap.clk_pins().values()]
+
+    # random levels on all input pins, clock pins at '0' and pulsed randomly
+    drive = np.full((vectors, len(columns)), -1, dtype=np.int8)
+    driven = [col for col, pin in enumerate(columns) if pin in sim.input_pins]
+    drive[:, driven] = rng.integers(0, 2, (vectors, len(driven)))
+    drive[:, clk_columns] = 0
+    pulse = np.zeros((vectors, len(columns)), dtype=bool)
+    pulse[:, clk_columns] = rng.integers(0, 2, (vectors, len(clk_columns))).astype(bool)
+
+    expect = np.full((vectors, len(columns)), jedec.EXPECT_NONE, dtype=np.int8)
+    model = netlist_sim(netlist)
+    pin_idx = {pin: idx for idx, pin in enumerate(sim.input_pins)}
+    for vector in range(0, vectors):
+        level = [0] * sim.num_pins
+        for col in driven:
+            level[pin_idx[columns[col]]] = int(drive[vector, col])
+        steps = [level]
+        if pulse[vector].any():
+            pulsed = list(level)
+            for col in np.flatnonzero(pulse[vector]):
+                pulsed[pin_idx[columns[col]]] ^= 1
+            steps += [pulsed, level]
+        for pins in steps:
+            value = model.step(netlist_inputs(netlist, sim, pins))
+        for col, pin in enumerate(columns):
+            if pin in sim.output_pins:
+                expect[vector, col] = value(f'o_{pin}') if value(f'oe_{pin}') else jedec.EXPECT_Z
+
+    failed = replay.replay(drive, pulse, expect)
+    if failed.any():
+        vector, col = np.argwhere(failed)[0]
+        return f'lc4k_replay: vector {vector} pin {columns[col]} failed'
+    return None
+
+
+def main():
+    import argparse
+    import glob
+    import os
+    import sys
+
+    from lc4k_device import find_sx_files, load_device
+    from lc4k_fusemap import lc4k_fusemap
+
+    parser = argparse.ArgumentParser(description='Cross-check evaluator, simulator, netlist and replay on the test fusemaps.')
+    parser.add_argument('re4k', help='re4k directory with the device files (.sx)')
+    parser.add_argument('tests', help='tests directory')
+    parser.add_argument('-s', '--steps', type=int, default=32, help='number of steps and vectors')
+    parser.add_argument('-l', '--lanes', type=int, default=8, help='number of stimulus lanes')
+    parser.add_argument('-c', '--cache-dir', help='device cache directory')
+    args = parser.parse_args()
+
+    sx_files = {os.path.splitext(os.path.basename(sx))[0]: sx for sx in find_sx_files([args.re4k])}
+    wrappers = sorted(glob.glob(os.path.join(args.tests, '*', 'LC*', 'cpld', '*_cpld.vhd')))
+
+    sys.setrecursionlimit(100000)
+    failed = 0
+    for seed, wrapper in enumerate(wrappers):
+        device = os.path.basename(os.path.dirname(os.path.dirname(wrapper)))
+        rng = np.random.default_rng(seed)
+        try:
+            if device not in sx_files:
+                raise ValueError(f'no device file {device}.sx')
+            dev = load_device(sx_files[device], args.cache_dir)
+            fusemap = lc4k_fusemap(dev, wrapper_fusemap(wrapper))
+            sim = lc4k_simulator(fusemap)
+            netlist = lc4k_netlist(fusemap)
+            stimulus = clock_stimulus(sim, args.steps, args.lanes, rng)
+            golden = os.path.join(os.path.dirname(os.path.dirname(wrapper)), 'golden.json')
+            errors = [check_golden(fusemap, golden, wrapper),
+                      check_eval(sim, stimulus),
+                      check_netlist(sim, netlist, stimulus),
+                      check_replay(sim, netlist, args.steps, rng)]
+        except (OSError, ValueError) as e:
+            errors = [str(e)]
+
+        if any(error not in (None, 'skipped') for error in errors):
+            failed += 1
+            print(f'FAIL  {wrapper}')
+            for error in errors:
+                if error not in (None, 'skipped'):
+                    print(f'        {error}')
+        else:
+            replay = ', replay skipped' if 'skipped' in errors else ''
+            print(f'OK    {wrapper}  {dev.name}{replay}')
+
+    print(f'{len(wrappers)} fusemaps, {failed} failed', file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#
+# LC4K Device Model
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# Indexed view on a re4k device S-expression. The tree is walked once and
+# all lookups of the generator are answered from dictionaries afterwards:
+#
+#   search('feature/key')      same result as Sexp.search() for relative
+#                              paths of up to three keys
+#   glb(feature, glb)          (glb ...) entry of a feature
+#   mc(feature, glb, mc)       (mc ...) entry of a feature's glb
+#   pin(feature, pin)          (pin ...) entry of a feature
+#   pin_at(feature, glb, mc)   (pin ...) entry that is bonded to glb/mc
+#
+# The fusemap dimensions are taken from the fuse coordinates of the walk.
+# They're cross-checked against the row of the input threshold fuses and,
+# for the parts the original generator covered, against the width that
+# follows from the GRP. A mismatch raises ValueError, dimension_source
+# tells which checks were applied.
+#
+# load_device() returns the index of a device file. Given a cache directory,
+# the index is stored there and reused as long as the file's content and
+# the model version are unchanged, skipping the S-expression parse.
+#
+
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+
+re4k_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 're4k')
+
+
+# bump when the index layout changes, invalidates cached devices
+version = 3
+
+
+class lc4k_device():
+
+    __slots__ = ('sx', 'name', '_paths', '_glbs', '_mcs', '_pins', '_pins_at', '_rows', '_columns', '_dimension_source')
+
+    # longest relative search path that's served from the index
+    max_path_len = 3
+    # keys of per-item entries, these don't open a new feature
+    item_keys = ('glb', 'mc', 'pin', 'gi', 'fuse')
+    # parts with a fusemap width of (GI mux size + 166) * GLBs / 2
+    grp_width_parts = ('4032', '4064', '4128')
+
+    def __init__(self, sx):
+        self.sx = sx
+        self.name = sx[0]
+
+        self._paths   = {}
+        self._glbs    = {}
+        self._mcs     = {}
+        self._pins    = {}
+        self._pins_at = {}
+
+        # pre-order walk, identical to the match order of Sexp.search()
+        sexp = type(sx)
+        stack = [(sx, ())]
+        while stack:
+            node, keypath = stack.pop()
+            keypath = keypath + (str(node[0]),)
+
+            for n in range(1, min(len(keypath), self.max_path_len) + 1):
+                path = '/'.join(keypath[-n:])
+                matches = self._paths.get(path)
+                if matches is None:
+                    matches = self._paths[path] = sexp()
+                matches.append(node)
+
+            if len(keypath) >= 2 and keypath[-2] not in self.item_keys:
+                self._index_item(node, keypath[-2])
+
+            for child in reversed(node):
+                if isinstance(child, list) and child:
+                    stack.append((child, keypath))
+
+        fuses = self._paths.get('fuse', ())
+        self._rows    = max([fuse[1] for fuse in fuses], default=-1) + 1
+        self._columns = max([fuse[2] for fuse in fuses], default=-1) + 1
+        self._dimension_source = self._check_dimensions()
+
+    def _check_dimensions(self):
+        '''
+        Compare the dimensions from the fuse coordinates with those derived
+        from the device structure. Returns the source of the dimensions.
+        '''
+        checks = []
+        threshold = self.search('input_threshold/pin/fuse')
+        if threshold:
+            checks.append(('rows', 'input threshold row', self._rows, threshold[0][1] + 1))
+        if any(part in self.name for part in self.grp_width_parts):
+            grp = self.search('global_routing_pool/glb')
+            gi_mux_size = len(grp[0].search('gi')[0].search('fuse'))
+            checks.append(('columns', 'GRP width', self._columns, (gi_mux_size + 166) * len(grp) // 2))
+
+        for dimension, source, value, derived in checks:
+            if value != derived:
+                raise ValueError(f'{self.name}: fuse coordinates give {value} {dimension}, {source} gives {derived}')
+        return ', '.join(['fuse coordinates'] + [source for dimension, source, value, derived in checks])
+
+    def _index_item(self, node, feature):
+        key = node[0]
+
+        if key == 'glb':
+            self._glbs.setdefault((feature, node[1]), node)
+            for child in node:
+                if isinstance(child, list) and child and child[0] == 'mc':
+                    self._mcs.setdefault((feature, node[1], child[1]), child)
+
+        elif key == 'pin':
+            self._pins.setdefault((feature, node[1]), node)
+            glb = node.search('glb')
+            mc  = node.search('mc')
+            if glb and mc:
+                self._pins_at.setdefault((feature, glb[0][1], mc[0][1]), node)
+
+    #
+    # Lookups
+    #
+    def search(self, path):
+        '''Relative path search, equivalent to Sexp.search(path).'''
+        if path.startswith('/') or path.count('/') >= self.max_path_len:
+            return self.sx.search(path)
+        return self._paths.get(path) or type(self.sx)()
+
+    def glb(self, feature, glb):
+        return self._glbs[(feature, glb)]
+
+    def mc(self, feature, glb, mc):
+        return self._mcs[(feature, glb, mc)]
+
+    def pin(self, feature, pin):
+        return self._pins.get((feature, pin))
+
+    def pin_at(self, feature, glb, mc):
+        return self._pins_at.get((feature, glb, mc))
+
+    #
+    # Device properties
+    #
+    @property
+    def is_ze(self):
+        return bool(self.search('osctimer'))
+
+    @property
+    def glbs(self):
+        return [glb[1] for glb in self.search('bclk_polarity/glb')]
+
+    # GLBs that route OSC and TIMER outputs through MC 15, ZE devices only
+    osctimer_glbs = {
+        #        OSC    TIMER
+        '4032': (0,     1),         # GLB A, GLB B
+        '4064': (0,     3),         # GLB A, GLB D
+        '4128': (0,     6),         # GLB A, GLB G
+        '4256': (2,     5),         # GLB C, GLB F
+    }
+
+    @property
+    def osc_glb(self):
+        for part, glbs in self.osctimer_glbs.items():
+            if part in self.name:
+                return glbs[0]
+        return None
+
+    @property
+    def timer_glb(self):
+        for part, glbs in self.osctimer_glbs.items():
+            if part in self.name:
+                return glbs[1]
+        return None
+
+    @property
+    def num_rows(self):
+        return self._rows
+
+    @property
+    def num_columns(self):
+        return self._columns
+
+    @property
+    def dimension_source(self):
+        '''Fuse coordinates and the derivations they were checked against.'''
+        return self._dimension_source
+
+
+def children(node, key):
+    '''Direct children of node with key, like node.search(key) for flat entries but without the recursion.'''
+    return [child for child in node if isinstance(child, list) and child and child[0] == key]
+
+
+def find_sx_files(paths=None):
+    '''Collect device files from files and directories, the re4k submodule by default.'''
+    if not paths:
+        paths = [re4k_dir]
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += glob.glob(os.path.join(path, '**', 'LC*.sx'), recursive=True)
+        else:
+            files.append(path)
+    return sorted(files, key=os.path.basename)
+
+
+def load_sx(filename):
+    from simp_sexp import Sexp
+
+    with open(filename, 'r') as f:
+        config_str = f.read()
+    return Sexp(config_str)
+
+def load_device(filename, cache_dir=None):
+    '''Load and index a device file, through the cache in cache_dir if given.'''
+    if not cache_dir:
+        return lc4k_device(load_sx(filename))
+
+    with open(filename, 'rb') as f:
+        content = f.read()
+    digest = hashlib.sha256(content).hexdigest()
+    name = os.path.splitext(os.path.basename(filename))[0]
+    cache_file = os.path.join(cache_dir, f'{name}-{digest[:32]}-v{version}.pickle')
+
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+
+    # parse only on a cache miss
+    from simp_sexp import Sexp
+    dev = lc4k_device(Sexp(content.decode()))
+
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmpname = tempfile.mkstemp(dir=cache_dir, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(dev, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmpname, cache_file)
+    except BaseException:
+        os.unlink(tmpname)
+        raise
+
+    return dev
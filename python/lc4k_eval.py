@@ -0,0 +1,329 @@
+#
+# LC4K Fusemap Evaluator
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_eval.py <sx file> <jed file> [-n <vectors>]
+#
+# Evaluates the pin outputs of a fusemap for batches of input vectors with
+# NumPy, without HDL tools. The configuration is decoded by lc4k_fusemap.
+#
+# Vectors are bit-sliced, 64 of them share one uint64 word and every signal
+# is a row of words. Per GLB, the GRP, the 36 GI x 83 PT array and the ELA
+# sums are index matrices into such signal tables, each evaluated with one
+# gather and one AND/OR reduction for all of its rows:
+#
+#   grp = AND(sources[grp_index])        connected sources per GI
+#   pts = AND([grp; ~grp][pt_index])     literals per PT
+#   la  = OR(pts[la_index])              allocated PTs per macrocell
+#
+# Combinational macrocells are evaluated until their outputs settle,
+# registered macrocells hold the values given as state. ZE input latches
+# are treated as transparent, OSC/TIMER outputs as '0'.
+#
+
+import numpy as np
+
+from lc4k_fusemap import lc4k_fusemap
+
+
+ONES  = np.uint64(0xffffffffffffffff)
+ZEROS = np.uint64(0)
+
+
+def pack(bits):
+    '''Bit-slice bits (batch x signals, bool) into words (signals x batch/64, uint64).'''
+    bits = np.asarray(bits, dtype=bool)
+    pad = -len(bits) % 64
+    if pad:
+        bits = np.concatenate((bits, np.zeros((pad, bits.shape[1]), dtype=bool)))
+    packed = np.packbits(bits.T, axis=1, bitorder='little')
+    return np.ascontiguousarray(packed).view(np.uint64)
+
+def unpack(words, batch):
+    '''Inverse of pack(), batch x signals of bool.'''
+    bits = np.unpackbits(np.ascontiguousarray(words).view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :batch].T.astype(bool)
+
+def index_matrix(rows, fill):
+    '''Rows of indices of different length as matrix, padded with fill.'''
+    width = max([len(row) for row in rows] + [1])
+    matrix = np.full((len(rows), width), fill, dtype=np.intp)
+    for idx, row in enumerate(rows):
+        matrix[idx, :len(row)] = row
+    return matrix
+
+
+class lc4k_evaluator():
+
+    # vectors per chunk, bounds the size of the gathered index matrices
+    chunk_size = 1 << 16
+
+    def __init__(self, fusemap):
+        '''fusemap is the lc4k_fusemap of the design.'''
+        self.fusemap = fusemap
+        dev = fusemap.dev
+        num_mcs = fusemap.num_mcs
+        num_gis = fusemap.num_gis
+        num_pts = fusemap.num_pts
+
+        self.glbs = dev.glbs
+        self.input_pins  = [pin[1] for pin in dev.search('input_threshold/pin')]
+        self.output_pins = [pin for pin, glb, mc in fusemap.output_pins()]
+        pin_idx = {pin: idx for idx, pin in enumerate(self.input_pins)}
+        glb_idx = {glb: idx for idx, glb in enumerate(self.glbs)}
+
+        # rows of the source table: pins, macrocells, constant '1'
+        self.num_pins = len(self.input_pins)
+        self.num_regs = len(self.glbs) * num_mcs
+        src_ones = self.num_pins + self.num_regs
+
+        def mc_idx(glb, mc):
+            return glb_idx[glb] * num_mcs + mc
+
+        # rows of the literal table: GIs, inverted GIs, constant '1' and '0'
+        lit_ones  = 2 * num_gis
+        lit_zeros = 2 * num_gis + 1
+        # rows of the product term table: PTs, constant '0'
+        pt_zeros  = num_pts
+
+        self.grp_index = []
+        self.pt_index  = []
+        self.la_index  = []
+        self.sum_index = []
+        self.pt0       = []
+        self.pt4       = []
+        for glb in self.glbs:
+            rows = []
+            for gi in range(0, num_gis):
+                rows.append([pin_idx[source[1]] if source[0] == 'pin' else self.num_pins + mc_idx(source[1], source[2])
+                             for source in fusemap.grp(glb, gi)])
+            self.grp_index.append(index_matrix(rows, src_ones))
+
+            rows = []
+            for pt in range(0, num_pts):
+                literals = fusemap.pterm(glb, pt)
+                if literals is None:
+                    rows.append([lit_zeros])
+                else:
+                    rows.append([gi + num_gis if inverted else gi for gi, inverted in literals])
+            self.pt_index.append(index_matrix(rows, lit_ones))
+
+            routing = fusemap.ela_routing(glb)
+            self.la_index.append(index_matrix([sorted(routing[mc]['mc']) for mc in range(0, num_mcs)], pt_zeros))
+            self.sum_index.append(index_matrix([sorted(routing[mc]['5pt']) for mc in range(0, num_mcs)], pt_zeros))
+            self.pt0.append(np.array([pt_zeros if routing[mc]['pt'][0] is None else routing[mc]['pt'][0]
+                                      for mc in range(0, num_mcs)]))
+            self.pt4.append(np.array([pt_zeros if routing[mc]['pt'][4] is None else routing[mc]['pt'][4]
+                                      for mc in range(0, num_mcs)]))
+
+        # macrocells
+        self.comb     = np.zeros(self.num_regs, dtype=bool)
+        self.bypass   = np.zeros(self.num_regs, dtype=bool)
+        self.invert   = np.zeros(self.num_regs, dtype=np.uint64)
+        self.io_pin   = np.zeros(self.num_regs, dtype=np.intp)
+        self.reg_init = np.zeros(self.num_regs, dtype=bool)
+        for glb in self.glbs:
+            for mc in range(0, num_mcs):
+                config = fusemap.mc_config(glb, mc)
+                idx = mc_idx(glb, mc)
+                self.comb[idx]     = config['macrocell_function'] == '00'
+                self.bypass[idx]   = config['input_bypass'] == '0'
+                self.invert[idx]   = ONES if config['invert'] == '1' else ZEROS
+                self.reg_init[idx] = config['init_state'] == '0'
+                input_pin = fusemap.mc_input_pin(glb, mc)
+                self.io_pin[idx]   = pin_idx[input_pin] if input_pin is not None else 0
+
+        # macrocells that are replaced by OSC/TIMER outputs towards the GRP
+        self.osctimer = []
+        if dev.is_ze:
+            for glb, feature in ((dev.osc_glb, 'osctimer/osc_out'), (dev.timer_glb, 'osctimer/timer_out')):
+                if glb is not None and fusemap.value(dev.search(feature)) == '0':
+                    self.osctimer.append(self.num_pins + mc_idx(glb, num_mcs-1))
+
+        # output pins
+        self.orp = []
+        for pin, glb, mc in fusemap.output_pins():
+            orp = fusemap.orp(pin)
+            io_cell = fusemap.io_cell(pin)
+            self.orp.append((glb_idx[glb], mc_idx(glb, orp['orm']), mc_idx(glb, mc), mc, orp['source'],
+                             self.pt4[glb_idx[glb]][orp['orm']], io_cell['oe_source'], io_cell['drive_type']))
+
+        self.goe = []
+        for inverted, kind, ref in fusemap.goe():
+            if kind == 'glb':
+                self.goe.append((inverted, kind, glb_idx[ref]))
+            elif kind == 'pin':
+                self.goe.append((inverted, kind, pin_idx[ref]))
+            else:
+                self.goe.append((inverted, kind, None))
+
+    #
+    # Evaluation on bit-sliced words
+    #
+    def initial_state(self, words):
+        '''Register words after power up, macrocells x words.'''
+        return np.where(self.reg_init[:, None], ONES, ZEROS) * np.ones(words, dtype=np.uint64)
+
+    def pterms(self, sources, glb):
+        '''Product term words of GLB index glb, with a constant '0' row appended.'''
+        grp = np.bitwise_and.reduce(sources[self.grp_index[glb]], axis=1)
+        ones = np.full((1, sources.shape[1]), ONES)
+        literals = np.concatenate((grp, ~grp, ones, ~ones))
+        pts = np.bitwise_and.reduce(literals[self.pt_index[glb]], axis=1)
+        return np.concatenate((pts, ~ones))
+
+    def logic(self, pins, regs):
+        '''
+        One pass over all GLBs. Returns the product terms of each GLB and
+        the D inputs of all macrocells.
+        '''
+        num_mcs = self.fusemap.num_mcs
+        ones = np.full((1, pins.shape[1]), ONES)
+        sources = np.concatenate((pins, regs, ones))
+        sources[self.osctimer] = ZEROS
+
+        pts = []
+        din = np.empty_like(regs)
+        for glb in range(0, len(self.glbs)):
+            glb_pts = self.pterms(sources, glb)
+            pts.append(glb_pts)
+            la = np.bitwise_or.reduce(glb_pts[self.la_index[glb]], axis=1)
+            mcs = slice(glb * num_mcs, (glb + 1) * num_mcs)
+            din[mcs] = la ^ glb_pts[self.pt0[glb]] ^ self.invert[mcs, None]
+
+        din[self.bypass] = pins[self.io_pin[self.bypass]]
+        return pts, din
+
+    def settle(self, pins, regs):
+        '''
+        Evaluate the combinational logic for the pin words, registered
+        macrocells from regs. Returns the macrocell outputs, the product
+        terms of each GLB and the D inputs of all macrocells.
+        '''
+        regs = regs.copy()
+        for _ in range(0, int(self.comb.sum()) + 2):
+            pts, din = self.logic(pins, regs)
+            if np.array_equal(din[self.comb], regs[self.comb]):
+                return regs, pts, din
+            regs[self.comb] = din[self.comb]
+
+        raise ValueError('combinational loop, macrocells don\'t settle')
+
+    def outputs(self, pins, regs, pts):
+        '''Output and output enable words of the output pins.'''
+        fusemap = self.fusemap
+        ones  = np.full(pins.shape[1], ONES)
+        zeros = ~ones
+
+        goe = []
+        for inverted, kind, ref in self.goe:
+            if kind == 'glb':
+                value = pts[ref][fusemap.shared_pt_oe]
+            elif kind == 'pin':
+                value = pins[ref]
+            else:
+                value = ones
+            goe.append(~value if inverted else value)
+
+        out = np.empty((len(self.orp), pins.shape[1]), dtype=np.uint64)
+        oe  = np.empty((len(self.orp), pins.shape[1]), dtype=np.uint64)
+        for idx, (glb, orm, own, mc, source, pt4, oe_source, drive_type) in enumerate(self.orp):
+            if source in ('fast_bypass', 'fast_bypass_inverted'):
+                orm_value = np.bitwise_or.reduce(pts[glb][self.sum_index[glb][mc]], axis=0)
+                if source == 'fast_bypass_inverted':
+                    orm_value = ~orm_value
+            elif source == 'orm':
+                orm_value = regs[orm]
+            else:
+                orm_value = regs[own]
+            orm_oe = pts[glb][pt4]
+
+            if oe_source in fusemap.oe_goe:
+                pin_oe = goe[fusemap.oe_goe[oe_source]]
+            elif oe_source == fusemap.oe_orm:
+                pin_oe = orm_oe
+            elif oe_source == fusemap.oe_orm_inv:
+                pin_oe = ~orm_oe
+            elif oe_source == fusemap.oe_on:
+                pin_oe = ones
+            else:
+                pin_oe = zeros
+
+            if drive_type == '1':
+                out[idx] = orm_value
+                oe[idx]  = pin_oe
+            else:
+                # open drain
+                out[idx] = zeros
+                oe[idx]  = ~orm_value
+
+        return out, oe
+
+    #
+    # Evaluation on vectors
+    #
+    def evaluate(self, pins, state=None):
+        '''
+        Pin outputs for pins (batch x input_pins, bool), registered
+        macrocells from state (batch x macrocells, power up values by
+        default). Returns output values and output enables, batch x
+        output_pins each.
+        '''
+        pins = np.asarray(pins, dtype=bool)
+        out = np.empty((len(pins), len(self.orp)), dtype=bool)
+        oe  = np.empty((len(pins), len(self.orp)), dtype=bool)
+
+        for start in range(0, len(pins), self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            batch = len(pins[chunk])
+            pin_words = pack(pins[chunk])
+            if state is None:
+                regs = self.initial_state(pin_words.shape[1])
+            else:
+                regs = pack(np.asarray(state, dtype=bool)[chunk])
+
+            regs, pts, din = self.settle(pin_words, regs)
+            out_words, oe_words = self.outputs(pin_words, regs, pts)
+            out[chunk] = unpack(out_words, batch)
+            oe[chunk]  = unpack(oe_words, batch)
+
+        return out, oe
+
+
+def main():
+    import argparse
+    import time
+
+    import jedec
+    from lc4k_device import load_device
+
+    parser = argparse.ArgumentParser(description='Evaluate a fusemap for random input vectors.')
+    parser.add_argument('sx', help='re4k device file (.sx)')
+    parser.add_argument('jed', help='JEDEC file of the design')
+    parser.add_argument('-n', '--vectors', type=int, default=1000000, help='number of random vectors')
+    parser.add_argument('-c', '--cache-dir', help='device cache directory')
+    args = parser.parse_args()
+
+    jed = jedec.Jedec()
+    jed.load(args.jed, verify=True)
+    dev = load_device(args.sx, args.cache_dir)
+
+    start = time.perf_counter()
+    evaluator = lc4k_evaluator(lc4k_fusemap(dev, jed.fuse_data))
+    t_setup = time.perf_counter() - start
+
+    pins = np.random.default_rng(0).integers(0, 2, (args.vectors, evaluator.num_pins), dtype=np.uint8).astype(bool)
+    start = time.perf_counter()
+    out, oe = evaluator.evaluate(pins)
+    t_eval = time.perf_counter() - start
+
+    print(f'{dev.name}: setup {t_setup:.3f}s, {args.vectors} vectors in {t_eval:.3f}s '
+          f'({args.vectors / max(t_eval, 1e-9):.0f} vectors/s)')
+    for idx, pin in enumerate(evaluator.output_pins):
+        if oe[:, idx].any():
+            print(f'  pin {pin}: enabled {oe[:, idx].mean():6.1%}, high {out[:, idx].mean():6.1%}')
+
+
+if __name__ == "__main__":
+    main()
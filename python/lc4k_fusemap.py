@@ -0,0 +1,442 @@
+#
+# LC4K Fusemap
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# Decodes a fusemap with the fuse coordinates of a device into the
+# configuration that the generic core derives from g_fusemap. Fuse vectors
+# are read in the same order as gen_lc4k_core emits them, all decoding
+# follows the VHDL components in src/rtl:
+#
+#   grp(glb, gi)            sources that are ANDed into a GRP input
+#   pterm(glb, pt)          literals of a product term
+#   glb_config(glb)         glb_r
+#   ela_config(glb, mc)     ela_r
+#   mc_config(glb, mc)      macrocell_r
+#   ela_routing(glb)        product terms per macrocell after cluster and
+#                           wide routing
+#   orp(pin)                macrocell and bypass that drive a pin
+#   io_cell(pin)            io_cell_r
+#   goe()                   sources of the global output enables
+#   used_logic()            macrocells, product terms and GRP inputs that
+#                           contribute to any pin
+#
+
+from lc4k_device import children
+
+
+class lc4k_fusemap():
+
+    num_mcs = 16
+    num_gis = 36
+    num_pts = 83
+
+    pt_names = ('pt0', 'pt1', 'pt2', 'pt3', 'pt4')
+    shared_pt_names = ('shared_pt_clk', 'shared_pt_init', 'shared_pt_enable')
+    # product term indices of the shared PTs
+    shared_pt_clk  = 80
+    shared_pt_init = 81
+    shared_pt_oe   = 82
+
+    # io_cell_r.oe_source
+    oe_goe     = {'000': 0, '100': 1, '010': 2, '110': 3}
+    oe_orm     = '001'
+    oe_orm_inv = '101'
+    oe_on      = '011'
+
+    # macrocell_r.clock_source
+    clk_bclk      = {'000': 0, '100': 1, '010': 2, '110': 3}
+    clk_pt        = '001'
+    clk_pt_inv    = '101'
+    clk_shared_pt = '011'
+
+    def __init__(self, dev, fuses):
+        '''fuses is a sequence of '0'/'1' characters in JEDEC order.'''
+        self.dev = dev
+        self.fuses = fuses
+        self.num_rows = dev.num_rows
+        self.num_columns = dev.num_columns
+
+        if len(fuses) != self.num_rows * self.num_columns:
+            raise ValueError(f'{dev.name} has {self.num_rows * self.num_columns} fuses, fusemap has {len(fuses)}')
+
+        self._cache = {}
+
+        self.gi_rows = {}
+        for gi in dev.search('product_terms/gi'):
+            self.gi_rows[gi[1]] = (
+                gi.search(lambda x: x[0] == 'row' and x[2] == 'normal')[0][1],
+                gi.search(lambda x: x[0] == 'row' and x[2] == 'inverted')[0][1])
+
+    def _cached(self, key, func, *args):
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = func(*args)
+            return value
+
+    #
+    # Raw fuse values
+    #
+    def fuse(self, row, column):
+        return self.fuses[row * self.num_columns + column]
+
+    def value(self, sexp):
+        '''Fuse values of sexp, the counterpart of gen_fuse_vector().'''
+        return ''.join([self.fuse(fuse[1], fuse[2]) for fuse in sexp.search('fuse')])
+
+    def value_byvalue(self, sexp):
+        '''Fuse values of sexp, the counterpart of gen_fuse_vector_byvalue().'''
+        values = {}
+        for fuse in sexp.search('fuse'):
+            val = fuse.search('value')
+            values[val[0][1] if val else 1] = self.value(fuse)
+        return ''.join([values[item] for item in sorted(values, reverse=True)])
+
+    #
+    # Pins
+    #
+    def output_pins(self):
+        '''Output capable pins with their glb and mc.'''
+        def get():
+            pins = []
+            for pin in self.dev.search('drive_type/pin'):
+                pins.append((pin[1], pin.search('glb')[0][1], pin.search('mc')[0][1]))
+            return pins
+        return self._cached('output_pins', get)
+
+    def clk_pins(self):
+        '''Dedicated clock pins by clock number.'''
+        def get():
+            clkpins = {}
+            for pin in self.dev.search('input_threshold/pin'):
+                clkpin = pin.search(lambda x: x[0] == "clk")
+                if clkpin:
+                    clkpins[clkpin[0][1]] = pin[1]
+            return clkpins
+        return self._cached('clk_pins', get)
+
+    def oe_pins(self):
+        def get():
+            oepins = {}
+            for pin in self.dev.search('input_threshold/pin'):
+                oepin = pin.search(lambda x: x[0] == "oe")
+                if oepin:
+                    oepins[oepin[0][1]] = pin[1]
+            return oepins
+        return self._cached('oe_pins', get)
+
+    def io_cell(self, pin):
+        return {
+            'oe_source'       : self.value(self.dev.pin('output_enable_source', pin)),
+            'drive_type'      : self.value(self.dev.pin('drive_type', pin)),
+            'slew_rate'       : self.value(self.dev.pin('slew_rate', pin)),
+            'input_threshold' : self.value(self.dev.pin('input_threshold', pin)),
+        }
+
+    def bie_glb(self, pin):
+        '''GLB whose shared PT OE latches the input of a ZE pin, None if the latch is transparent.'''
+        power_guard = self.dev.pin('power_guard', pin)
+        if self.value(power_guard) == '1':
+            return None
+        return power_guard.search('glb')[0][1]
+
+    #
+    # Global Routing Pool
+    #
+    def grp(self, glb, gi):
+        '''
+        Sources connected to a GRP input, ('pin', pin) or ('mc', glb, mc).
+        The input is the AND of all of them, '1' for none.
+        '''
+        def get_gis():
+            return {node[1]: node for node in children(self.dev.glb('global_routing_pool', glb), 'gi')}
+
+        def get():
+            sources = []
+            for fuse in children(self._cached(('grp_gis', glb), get_gis)[gi], 'fuse'):
+                if self.fuse(fuse[1], fuse[2]) != '0':
+                    continue
+                attrs = {attr[0]: attr for attr in fuse[3:] if isinstance(attr, list) and attr}
+                if 'unused' in attrs:
+                    continue
+                if 'pin' in attrs:
+                    sources.append(('pin', attrs['pin'][1]))
+                elif 'glb' in attrs:
+                    sources.append(('mc', attrs['glb'][1], attrs['mc'][1]))
+            return tuple(sources)
+        return self._cached(('grp', glb, gi), get)
+
+    #
+    # Product terms
+    #
+    def pt_columns(self, glb):
+        def get():
+            columns = []
+            for idx in range(0, self.num_mcs):
+                cols = {col[2]: col[1] for col in children(self.dev.mc('product_terms', glb, idx), 'column')}
+                columns += [cols[ptname] for ptname in self.pt_names]
+            cols = {col[2]: col[1] for col in children(self.dev.glb('product_terms', glb), 'column')}
+            columns += [cols[ptname] for ptname in self.shared_pt_names]
+            return columns
+        return self._cached(('pt_columns', glb), get)
+
+    def pterm(self, glb, pt):
+        '''
+        Literals (gi, inverted) of a product term, the PT is their AND.
+        None for a product term that can't become true.
+        '''
+        def get():
+            col = self.pt_columns(glb)[pt]
+            literals = []
+            for gi in range(0, self.num_gis):
+                normal, inverted = self.gi_rows[gi]
+                use_normal   = self.fuse(normal, col) == '0'
+                use_inverted = self.fuse(inverted, col) == '0'
+                if use_normal and use_inverted:
+                    return None
+                if use_normal:
+                    literals.append((gi, False))
+                elif use_inverted:
+                    literals.append((gi, True))
+            return tuple(literals)
+        return self._cached(('pterm', glb, pt), get)
+
+    #
+    # GLB, ELA and macrocell configuration
+    #
+    def glb_config(self, glb):
+        def get():
+            config = {}
+            for clks in self.dev.glb('bclk_polarity', glb).search('clk'):
+                config[f'bclk{clks[1]}{clks[2]}_polarity'] = self.value(clks)
+            config['shared_pt_clk_polarity']  = self.value(self.dev.glb('shared_pt_clk_polarity', glb))
+            config['shared_pt_init_polarity'] = self.value(self.dev.glb('shared_pt_init_polarity', glb))
+            return config
+        return self._cached(('glb_config', glb), get)
+
+    def ela_config(self, glb, mc):
+        def get():
+            return {feature: self.value(self.dev.mc(feature, glb, mc)) for feature in (
+                'cluster_routing', 'wide_routing', 'pt0_xor', 'clock_source', 'clock_enable_source',
+                'async_source', 'init_source', 'pt4_output_enable')}
+        return self._cached(('ela_config', glb, mc), get)
+
+    def mc_config(self, glb, mc):
+        def get():
+            config = {feature: self.value(self.dev.mc(feature, glb, mc)) for feature in (
+                'init_state', 'init_source', 'async_source', 'invert', 'clock_enable_source',
+                'clock_source', 'macrocell_function')}
+            input_bypass = self.dev.pin_at('macrocell_data', glb, mc)
+            config['input_bypass'] = self.value(input_bypass) if input_bypass else '1'
+            return config
+        return self._cached(('mc_config', glb, mc), get)
+
+    def mc_input_pin(self, glb, mc):
+        '''Pin that feeds the macrocell's input bypass, None if there's none.'''
+        input_bypass = self.dev.pin_at('macrocell_data', glb, mc)
+        return input_bypass[1] if input_bypass else None
+
+    def ela_routing(self, glb):
+        '''
+        Per macrocell a dict with
+          'mc'  : product terms ORed into the macrocell (logic allocation)
+          '5pt' : product terms of the ELA's own sum (fast bypass)
+          'pt'  : the five PTs that are redirected to macrocell functions,
+                  None where the PT goes to the sum instead
+        '''
+        def get():
+            pts, sums, cluster_to, wide = [], [], [], []
+            for mc in range(0, self.num_mcs):
+                config = self.ela_config(glb, mc)
+                redirect = (config['pt0_xor'] == '0',
+                            config['clock_source'][1:3] == '01',
+                            config['clock_enable_source'][1] == '0' or config['async_source'] == '0',
+                            config['init_source'] == '0',
+                            config['pt4_output_enable'] == '0')
+                pts.append(tuple(mc*5 + idx if redirect[idx] else None for idx in range(0, 5)))
+                sums.append(frozenset(mc*5 + idx for idx in range(0, 5) if not redirect[idx]))
+                cluster_to.append(mc + {'00': -2, '10': 0, '01': 1, '11': -1}[config['cluster_routing']])
+                wide.append(config['wide_routing'] == '1')
+
+            # cluster allocator
+            ca = [set() for mc in range(0, self.num_mcs)]
+            for mc in range(0, self.num_mcs):
+                if 0 <= cluster_to[mc] < self.num_mcs:
+                    ca[cluster_to[mc]] |= sums[mc]
+
+            # wide routing steers the allocated sum 4 macrocells up, wrapping around
+            def allocated(mc, visited):
+                terms = set(ca[mc])
+                src = (mc - 4) % self.num_mcs
+                if not wide[src] and src not in visited:
+                    terms |= allocated(src, visited | {src})
+                return terms
+
+            return [{'mc'  : frozenset(allocated(mc, {mc})) if wide[mc] else frozenset(),
+                     '5pt' : sums[mc],
+                     'pt'  : pts[mc]} for mc in range(0, self.num_mcs)]
+        return self._cached(('ela_routing', glb), get)
+
+    #
+    # Output routing
+    #
+    def orp(self, pin):
+        '''
+        Output routing of an output pin as dict with
+          'glb', 'mc' : location of the pin's ORP slot
+          'orm'       : macrocell selected by the output routing multiplexer
+          'source'    : 'mc', 'orm', 'fast_bypass' or 'fast_bypass_inverted'
+        '''
+        def get():
+            drive_type = self.dev.pin('drive_type', pin)
+            glb = drive_type.search('glb')[0][1]
+            mc  = drive_type.search('mc')[0][1]
+
+            offset = int(self.value_byvalue(self.dev.pin_at('output_routing', glb, mc)), 2)
+            orp = {'glb': glb, 'mc': mc, 'orm': (mc + offset) % self.num_mcs, 'source': 'orm'}
+
+            if not self.dev.is_ze:
+                mode = int(self.value_byvalue(self.dev.pin_at('output_routing_mode', glb, mc)), 2)
+                modes = {value[1]: value[2] for value in self.dev.search('output_routing_mode/value')}
+                orp['source'] = modes.get(mode, 'mc')
+                if orp['source'] not in ('fast_bypass', 'fast_bypass_inverted', 'orm'):
+                    orp['source'] = 'mc'
+            return orp
+        return self._cached(('orp', pin), get)
+
+    #
+    # Global output enables
+    #
+    def goe(self):
+        '''
+        Per GOE a tuple (inverted, kind, ref): kind 'glb' for the shared PT OE
+        of GLB ref, 'pin' for pin ref or 'const' for constant '1'.
+        '''
+        def get():
+            num_internal_ptoes = 4 if self.dev.search('goe_source') else 2
+            shared = []
+            for idx in range(0, num_internal_ptoes):
+                shared.append(('const', '1'))
+                for glb in self.dev.search('shared_pt_oe_bus/glb'):
+                    if self.value(glb.search(f'goe{idx}')) == '0':
+                        shared[idx] = ('glb', glb[1])
+                        break
+
+            oepins = self.oe_pins()
+            source = self.dev.search('goe_source')
+            if source:
+                goes = [('pin', oepins[0]) if self.value(source.search('goe0/fuse')) == '0' else shared[0],
+                        ('pin', oepins[1]) if self.value(source.search('goe1/fuse')) == '0' else shared[1],
+                        shared[2], shared[3]]
+            else:
+                goes = [shared[0], shared[1], ('pin', oepins[0]), ('pin', oepins[1])]
+
+            polarity = self.dev.search('goe_polarity')
+            return [(self.value(polarity.search(f'goe{idx}/fuse')) == '0',) + goes[idx] for idx in range(0, 4)]
+        return self._cached('goe', get)
+
+    #
+    # Dead logic analysis
+    #
+    def pin_output_enabled(self, pin):
+        '''False if the pin's output buffer is constantly disabled.'''
+        io_cell = self.io_cell(pin)
+        if io_cell['drive_type'] == '0':
+            return True
+        oe_source = io_cell['oe_source']
+        return oe_source in self.oe_goe or oe_source in (self.oe_orm, self.oe_orm_inv, self.oe_on)
+
+    def used_logic(self):
+        '''
+        Logic that contributes to any enabled pin output as dict of sets
+          'mc' : (glb, mc)    'pt' : (glb, pt)    'gi' : (glb, gi)
+          'pin': output pins that are enabled
+        '''
+        def get():
+            used = {'mc': set(), 'pt': set(), 'gi': set(), 'pin': set()}
+            work = []
+
+            def use(kind, item):
+                if item not in used[kind]:
+                    used[kind].add(item)
+                    work.append((kind, item))
+
+            def use_goe(idx):
+                inverted, kind, ref = self.goe()[idx]
+                if kind == 'glb':
+                    use('pt', (ref, self.shared_pt_oe))
+
+            for pin, glb, mc in self.output_pins():
+                if not self.pin_output_enabled(pin):
+                    continue
+                used['pin'].add(pin)
+
+                orp = self.orp(pin)
+                if orp['source'] in ('fast_bypass', 'fast_bypass_inverted'):
+                    for pt in self.ela_routing(glb)[mc]['5pt']:
+                        use('pt', (glb, pt))
+                elif orp['source'] == 'orm':
+                    use('mc', (glb, orp['orm']))
+                else:
+                    use('mc', (glb, mc))
+
+                io_cell = self.io_cell(pin)
+                if io_cell['drive_type'] == '1':
+                    if io_cell['oe_source'] in self.oe_goe:
+                        use_goe(self.oe_goe[io_cell['oe_source']])
+                    elif io_cell['oe_source'] in (self.oe_orm, self.oe_orm_inv):
+                        pt = self.ela_routing(glb)[orp['orm']]['pt'][4]
+                        if pt is not None:
+                            use('pt', (glb, pt))
+
+            if self.dev.is_ze:
+                for pin in self.dev.search('input_threshold/pin'):
+                    glb = self.bie_glb(pin[1])
+                    if glb is not None:
+                        use('pt', (glb, self.shared_pt_oe))
+                # OSC/TIMER control by MC 15
+                for glb in (self.dev.osc_glb, self.dev.timer_glb):
+                    if glb is not None:
+                        use('mc', (glb, self.num_mcs-1))
+
+            while work:
+                kind, item = work.pop()
+                if kind == 'mc':
+                    glb, mc = item
+                    for pt in self.mc_pterms(glb, mc):
+                        use('pt', (glb, pt))
+                elif kind == 'pt':
+                    glb, pt = item
+                    for gi, inverted in self.pterm(glb, pt) or ():
+                        use('gi', (glb, gi))
+                elif kind == 'gi':
+                    glb, gi = item
+                    for source in self.grp(glb, gi):
+                        if source[0] == 'mc':
+                            use('mc', source[1:])
+
+            return used
+        return self._cached('used_logic', get)
+
+    def mc_pterms(self, glb, mc):
+        '''Product terms a macrocell's output depends on.'''
+        config  = self.mc_config(glb, mc)
+        routing = self.ela_routing(glb)[mc]
+        pts = set()
+
+        if config['input_bypass'] != '0':
+            pts |= routing['mc']
+            if routing['pt'][0] is not None:
+                pts.add(routing['pt'][0])
+
+        if config['macrocell_function'] != '00':
+            for pt in routing['pt'][1:4]:
+                if pt is not None:
+                    pts.add(pt)
+            if config['clock_source'] == self.clk_shared_pt or config['clock_enable_source'] == '00':
+                pts.add(self.shared_pt_clk)
+            if config['init_source'] == '1':
+                pts.add(self.shared_pt_init)
+
+        return pts
@@ -0,0 +1,466 @@
+#
+# LC4K Fusemap Netlist
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_netlist.py <sx file> <jed file> [-o <file>.blif | <file>.json] [-w <wrapper>]
+#
+# Decompiles a fusemap into a netlist of what the device computes. The
+# configuration is decoded by lc4k_fusemap, only logic that contributes
+# to an enabled pin output is kept:
+#
+#   g<glb>_gi<n>      GRP input, AND of its sources
+#   g<glb>_pt<n>      product term
+#   g<glb>_mc<n>      macrocell output, g<glb>_mc<n>_d its D input
+#
+# Every combinational net is a sum of products, written as .names cover
+# to BLIF or as $sop cell to yosys JSON. Constant ports are tied to the
+# constant bits in JSON. Registers are yosys gate cells, $_DFFSR_PPP_ for
+# D/T flip-flops and $_DLATCHSR_PPP_ for latches, with clock enable and
+# toggle folded into their D input. Their power up value is the init
+# attribute of the Q net in JSON. BLIF writes registers without async
+# set/reset as .latch with the power up value as init, the others stay
+# gate cells as .latch has no async controls.
+#
+# The ports are those of the generated core entity, so the netlist can
+# replace the core in a wrapper design. -w adds a test wrapper of the
+# design to the JSON netlist, with the netlist as its core, see
+# lc4k_wrapper. ZE input latches are treated as transparent and the
+# OSC/TIMER outputs as '0'.
+#
+
+import json
+
+from lc4k_fusemap import lc4k_fusemap
+
+
+FALSE = '$false'
+TRUE  = '$true'
+
+FLOP  = '$_DFFSR_PPP_'
+LATCH = '$_DLATCHSR_PPP_'
+
+
+class lc4k_netlist():
+
+    def __init__(self, fusemap, name=None):
+        '''fusemap is the lc4k_fusemap of the design, name the model name.'''
+        self.fusemap = fusemap
+        self.dev = fusemap.dev
+        self.name = name or f'{self.dev.name.lower()}_core'
+
+        self.inputs  = []
+        self.outputs = []
+        # net -> list of cubes, a cube is a tuple of (net, value) literals
+        self.covers  = {}
+        # nets that are constant after folding
+        self.consts  = {}
+        # (type, {port: net})
+        self.cells   = []
+        # power up values of register outputs
+        self.init    = {}
+
+        self.build()
+
+    #
+    # Covers
+    #
+    def resolve(self, net):
+        return self.consts.get(net, net)
+
+    def sop(self, net, cubes, port=False):
+        '''
+        Define net as sum of cubes. Constant literals are folded, constant
+        results are only kept as cover for ports.
+        '''
+        folded = []
+        for cube in cubes:
+            literals = []
+            for literal, value in cube:
+                literal = self.resolve(literal)
+                if literal in (TRUE, FALSE):
+                    if (literal == TRUE) != bool(value):
+                        break
+                else:
+                    literals.append((literal, value))
+            else:
+                if not literals:
+                    folded = [()]
+                    break
+                folded.append(tuple(literals))
+
+        if not port and folded in ([], [()]):
+            self.consts[net] = TRUE if folded else FALSE
+        else:
+            self.covers[net] = folded
+        return net
+
+    def xor(self, net, a, b, invert=False):
+        return self.sop(net, [((a, 1), (b, 0 if not invert else 1)), ((a, 0), (b, 1 if not invert else 0))])
+
+    #
+    # Nets of the device
+    #
+    def gi_net(self, glb, gi):
+        return f'g{glb}_gi{gi}'
+
+    def pt_net(self, glb, pt):
+        return FALSE if pt is None else f'g{glb}_pt{pt}'
+
+    def mc_net(self, glb, mc):
+        return f'g{glb}_mc{mc}'
+
+    def build(self):
+        fusemap = self.fusemap
+        dev = self.dev
+        used = fusemap.used_logic()
+
+        # ports
+        for pin in dev.search('input_threshold/pin'):
+            self.inputs.append(f'i_{pin[1]}')
+        output_pins = fusemap.output_pins()
+        for pin, glb, mc in output_pins:
+            self.outputs += [f'o_{pin}', f'oe_{pin}']
+        if dev.is_ze:
+            self.inputs.append('i_oscclk')
+
+        # macrocells that are replaced by OSC/TIMER outputs towards the GRP
+        osctimer = set()
+        if dev.is_ze:
+            for glb, feature in ((dev.osc_glb, 'osctimer/osc_out'), (dev.timer_glb, 'osctimer/timer_out')):
+                if glb is not None and fusemap.value(dev.search(feature)) == '0':
+                    osctimer.add((glb, fusemap.num_mcs-1))
+
+        def source_net(source):
+            if source[0] == 'pin':
+                return f'i_{source[1]}'
+            return FALSE if source[1:] in osctimer else self.mc_net(*source[1:])
+
+        # GRP inputs and product terms
+        for glb, gi in sorted(used['gi']):
+            self.sop(self.gi_net(glb, gi), [tuple((source_net(source), 1) for source in fusemap.grp(glb, gi))])
+
+        for glb, pt in sorted(used['pt']):
+            literals = fusemap.pterm(glb, pt)
+            cubes = [] if literals is None else [tuple((self.gi_net(glb, gi), 0 if inverted else 1) for gi, inverted in literals)]
+            self.sop(self.pt_net(glb, pt), cubes)
+
+        # GLB clocks and shared product terms
+        clkpins = fusemap.clk_pins()
+        clk = [f'i_{clkpins[idx]}' if idx in clkpins else FALSE for idx in range(0, 4)]
+
+        def bclk_net(glb, idx):
+            net = f'g{glb}_bclk{idx}'
+            if net not in self.covers and net not in self.consts:
+                pair = idx ^ 1
+                polarity = fusemap.glb_config(glb)[f'bclk{min(idx, pair)}{max(idx, pair)}_polarity'][idx % 2]
+                self.sop(net, [((clk[idx], 1),)] if polarity == '1' else [((clk[pair], 0),)])
+            return net
+
+        def shared_net(glb, pt, name, polarity):
+            net = f'g{glb}_{name}'
+            if net not in self.covers and net not in self.consts:
+                self.sop(net, [((self.pt_net(glb, pt), 1 if fusemap.glb_config(glb)[polarity] == '1' else 0),)])
+            return net
+
+        # macrocells
+        for glb, mc in sorted(used['mc']):
+            config  = fusemap.mc_config(glb, mc)
+            routing = fusemap.ela_routing(glb)[mc]
+            pts = routing['pt']
+            q = self.mc_net(glb, mc)
+            d = f'{q}_d'
+
+            if config['input_bypass'] == '0':
+                self.sop(d, [((f'i_{fusemap.mc_input_pin(glb, mc)}', 1),)])
+            else:
+                la = self.sop(f'{q}_la', [((self.pt_net(glb, pt), 1),) for pt in sorted(routing['mc'])])
+                self.xor(d, la, self.pt_net(glb, pts[0]), config['invert'] == '1')
+
+            function = config['macrocell_function']
+            if function == '00':
+                self.sop(q, [((d, 1),)])
+                continue
+
+            def shared_clk():
+                return shared_net(glb, fusemap.shared_pt_clk, 'shared_pt_clock', 'shared_pt_clk_polarity')
+
+            clock_source = config['clock_source']
+            if clock_source in fusemap.clk_bclk:
+                clk_net = bclk_net(glb, fusemap.clk_bclk[clock_source])
+            elif clock_source == fusemap.clk_pt:
+                clk_net = self.pt_net(glb, pts[1])
+            elif clock_source == fusemap.clk_pt_inv:
+                clk_net = self.sop(f'{q}_clk', [((self.pt_net(glb, pts[1]), 0),)])
+            elif clock_source == fusemap.clk_shared_pt:
+                clk_net = shared_clk()
+            else:
+                clk_net = FALSE
+
+            clock_enable_source = config['clock_enable_source']
+            if clock_enable_source == '00':
+                ce_net = shared_clk()
+            elif clock_enable_source == '10':
+                ce_net = self.sop(f'{q}_ce', [((self.pt_net(glb, pts[2]), 0),)])
+            elif clock_enable_source == '01':
+                ce_net = self.pt_net(glb, pts[2])
+            else:
+                ce_net = TRUE
+
+            if config['init_source'] == '1':
+                init_net = shared_net(glb, fusemap.shared_pt_init, 'shared_pt_init', 'shared_pt_init_polarity')
+            else:
+                init_net = self.pt_net(glb, pts[3])
+            async_net = self.pt_net(glb, pts[2] if config['async_source'] == '0' else None)
+            if config['init_state'] == '0':
+                preset, reset = init_net, async_net
+            else:
+                preset, reset = async_net, init_net
+
+            if function == '10':
+                enable = self.sop(f'{q}_en', [((clk_net, 1), (ce_net, 1))])
+                self.cells.append((LATCH, {'E': enable, 'S': preset, 'R': reset, 'D': d, 'Q': q}))
+            else:
+                if function == '01':
+                    # toggle
+                    d_next = self.sop(f'{q}_next', [((ce_net, 1), (d, 1), (q, 0)), ((ce_net, 0), (q, 1)), ((d, 0), (q, 1))])
+                else:
+                    d_next = self.sop(f'{q}_next', [((ce_net, 1), (d, 1)), ((ce_net, 0), (q, 1))])
+                self.cells.append((FLOP, {'C': clk_net, 'S': preset, 'R': reset, 'D': d_next, 'Q': q}))
+            self.init[q] = '1' if config['init_state'] == '0' else '0'
+
+        # global output enables
+        def goe_net(idx):
+            net = f'goe{idx}'
+            if net not in self.covers and net not in self.consts:
+                inverted, kind, ref = fusemap.goe()[idx]
+                if kind == 'glb':
+                    source = self.pt_net(ref, fusemap.shared_pt_oe)
+                elif kind == 'pin':
+                    source = f'i_{ref}'
+                else:
+                    source = TRUE
+                self.sop(net, [((source, 0 if inverted else 1),)])
+            return net
+
+        # output pins
+        for pin, glb, mc in output_pins:
+            if pin not in used['pin']:
+                self.sop(f'o_{pin}', [], port=True)
+                self.sop(f'oe_{pin}', [], port=True)
+                continue
+
+            orp = fusemap.orp(pin)
+            routing = fusemap.ela_routing(glb)
+            if orp['source'] == 'fast_bypass':
+                value = self.sop(f'p{pin}_orm', [((self.pt_net(glb, pt), 1),) for pt in sorted(routing[mc]['5pt'])])
+            elif orp['source'] == 'fast_bypass_inverted':
+                value = self.sop(f'p{pin}_orm', [tuple((self.pt_net(glb, pt), 0) for pt in sorted(routing[mc]['5pt']))])
+            elif orp['source'] == 'orm':
+                value = self.mc_net(glb, orp['orm'])
+            else:
+                value = self.mc_net(glb, mc)
+
+            io_cell = fusemap.io_cell(pin)
+            if io_cell['drive_type'] == '0':
+                # open drain
+                self.sop(f'o_{pin}', [], port=True)
+                self.sop(f'oe_{pin}', [((value, 0),)], port=True)
+                continue
+
+            self.sop(f'o_{pin}', [((value, 1),)], port=True)
+            oe_source = io_cell['oe_source']
+            orm_oe = self.pt_net(glb, routing[orp['orm']]['pt'][4])
+            if oe_source in fusemap.oe_goe:
+                oe = [((goe_net(fusemap.oe_goe[oe_source]), 1),)]
+            elif oe_source == fusemap.oe_orm:
+                oe = [((orm_oe, 1),)]
+            elif oe_source == fusemap.oe_orm_inv:
+                oe = [((orm_oe, 0),)]
+            elif oe_source == fusemap.oe_on:
+                oe = [()]
+            else:
+                oe = []
+            self.sop(f'oe_{pin}', oe, port=True)
+
+        # bus maintenance, constant per device or pin
+        if dev.is_ze:
+            for pin in dev.search('input_threshold/pin'):
+                mode = fusemap.value(dev.pin('bus_maintenance', pin[1]))
+                for port, value in (('pu', '00'), ('pd', '11'), ('kp', '10')):
+                    self.outputs.append(f'{port}_{pin[1]}')
+                    self.sop(f'{port}_{pin[1]}', [()] if mode == value else [], port=True)
+        else:
+            mode = fusemap.value(dev.search('bus_maintenance/fuse'))
+            for port, value in (('o_pu', '11'), ('o_pd', '00'), ('o_kp', '01')):
+                self.outputs.append(port)
+                self.sop(port, [()] if mode == value else [], port=True)
+
+        # nets that turned out constant after they were referenced
+        ports = set(self.outputs)
+        changed = True
+        while changed:
+            changed = False
+            for net, cubes in list(self.covers.items()):
+                if any(literal in self.consts for cube in cubes for literal, value in cube):
+                    del self.covers[net]
+                    self.sop(net, cubes, port=net in ports)
+                    changed = True
+
+    #
+    # BLIF
+    #
+    def write_blif(self, f):
+        f.write(f'# {self.dev.name}, decompiled by lc4k_netlist\n')
+        f.write(f'.model {self.name}\n')
+        f.write('.inputs ' + ' '.join(self.inputs) + '\n')
+        f.write('.outputs ' + ' '.join(self.outputs) + '\n')
+        f.write(f'.names {FALSE}\n.names {TRUE}\n1\n')
+
+        for net, cubes in self.covers.items():
+            inputs = []
+            for cube in cubes:
+                for literal, value in cube:
+                    if literal not in inputs:
+                        inputs.append(literal)
+            f.write('.names ' + ' '.join(inputs + [net]) + '\n')
+            for cube in cubes:
+                values = dict(cube)
+                row = ''.join([str(values[literal]) if literal in values else '-' for literal in inputs])
+                f.write(f'{row} 1\n' if row else '1\n')
+
+        for celltype, ports in self.cells:
+            q = ports['Q']
+            if self.resolve(ports['S']) == FALSE and self.resolve(ports['R']) == FALSE:
+                control = ('re', ports['C']) if celltype == FLOP else ('ah', ports['E'])
+                f.write(f'.latch {self.resolve(ports["D"])} {q} {control[0]} {self.resolve(control[1])} {self.init[q]}\n')
+            else:
+                f.write(f'.subckt {celltype} ' + ' '.join([f'{port}={self.resolve(net)}' for port, net in ports.items()]) + '\n')
+
+        f.write('.end\n')
+
+    #
+    # yosys JSON
+    #
+    def json_module(self):
+        bits = {FALSE: '0', TRUE: '1'}
+        # constant ports are connected to the constant bits, without cell
+        for net, cubes in self.covers.items():
+            if cubes in ([], [()]):
+                bits[net] = '1' if cubes else '0'
+
+        def bit(net):
+            net = self.resolve(net)
+            if net not in bits:
+                bits[net] = len(bits)
+            return bits[net]
+
+        def param(value, width=32):
+            return format(value, f'0{width}b')
+
+        ports = {}
+        for port in self.inputs:
+            ports[port] = {'direction': 'input', 'bits': [bit(port)]}
+        for port in self.outputs:
+            ports[port] = {'direction': 'output', 'bits': [bit(port)]}
+
+        cells = {}
+        for net, cubes in self.covers.items():
+            if cubes in ([], [()]):
+                continue
+            inputs = []
+            for cube in cubes:
+                for literal, value in cube:
+                    if literal not in inputs:
+                        inputs.append(literal)
+            # two bits per input and cube: bit 0 input must be '0', bit 1 input must be '1'
+            table = 0
+            for idx, cube in enumerate(cubes):
+                for literal, value in cube:
+                    table |= 1 << (2 * len(inputs) * idx + 2 * inputs.index(literal) + value)
+            cells[f'{net}_sop'] = {
+                'hide_name': 0,
+                'type': '$sop',
+                'parameters': {'WIDTH': param(len(inputs)), 'DEPTH': param(len(cubes)),
+                               'TABLE': param(table, 2 * len(inputs) * len(cubes))},
+                'attributes': {},
+                'port_directions': {'A': 'input', 'Y': 'output'},
+                'connections': {'A': [bit(literal) for literal in inputs], 'Y': [bit(net)]},
+            }
+
+        for celltype, connections in self.cells:
+            cells[f'{connections["Q"]}_reg'] = {
+                'hide_name': 0,
+                'type': celltype,
+                'parameters': {},
+                'attributes': {},
+                'port_directions': {port: 'output' if port == 'Q' else 'input' for port in connections},
+                'connections': {port: [bit(net)] for port, net in connections.items()},
+            }
+
+        netnames = {}
+        for net, number in bits.items():
+            if net not in (FALSE, TRUE):
+                attributes = {'init': self.init[net]} if net in self.init else {}
+                netnames[net] = {'hide_name': 0, 'bits': [number], 'attributes': attributes}
+
+        return {'attributes': {}, 'ports': ports, 'cells': cells, 'netnames': netnames}
+
+    def write_json(self, f, modules=None):
+        '''yosys JSON of the netlist, with further modules like a wrapper that instantiates it.'''
+        modules = dict(modules or {})
+        modules[self.name] = self.json_module()
+        json.dump({'creator': f'lc4k_netlist, {self.dev.name}', 'modules': modules}, f, indent=1)
+        f.write('\n')
+
+
+def main():
+    import argparse
+    import os
+    import sys
+
+    import jedec
+    from lc4k_device import load_device
+    from lc4k_wrapper import wrapper_module
+
+    parser = argparse.ArgumentParser(description='Decompile a JEDEC fusemap into a BLIF or yosys JSON netlist.')
+    parser.add_argument('sx', help='re4k device file (.sx)')
+    parser.add_argument('jed', help='JEDEC file of the design')
+    parser.add_argument('-o', '--output', help='output file, format by extension .blif or .json, stdout by default')
+    parser.add_argument('-f', '--format', choices=('blif', 'json'), help='output format, overrides the extension')
+    parser.add_argument('-m', '--model', help='model name, <device>_core by default')
+    parser.add_argument('-w', '--wrapper', help='test wrapper of the design, added to the JSON netlist with the netlist as its core')
+    parser.add_argument('-c', '--cache-dir', help='device cache directory')
+    args = parser.parse_args()
+
+    output_format = args.format
+    if not output_format:
+        output_format = 'json' if args.output and os.path.splitext(args.output)[1] == '.json' else 'blif'
+    if args.wrapper and output_format != 'json':
+        parser.error('-w requires JSON output')
+
+    jed = jedec.Jedec()
+    jed.load(args.jed, verify=True)
+    dev = load_device(args.sx, args.cache_dir)
+    netlist = lc4k_netlist(lc4k_fusemap(dev, jed.fuse_data), args.model)
+
+    modules = {}
+    if args.wrapper:
+        try:
+            name, core, modules[name] = wrapper_module(args.wrapper)
+        except (OSError, ValueError) as e:
+            sys.exit(f'{args.wrapper}: {e}')
+        if core != netlist.name:
+            sys.exit(f'{args.wrapper}: core {core} isn\'t the netlist {netlist.name}')
+
+    f = open(args.output, 'w') if args.output else sys.stdout
+    if output_format == 'json':
+        netlist.write_json(f, modules)
+    else:
+        netlist.write_blif(f)
+    if args.output:
+        f.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#
+# LC4K Generator Profiler
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# Instrumentation for lc4k_generator and its subclasses, used by
+# gen_lc4k_core.py --profile. Nothing is hooked unless a profiler is set
+# up, the generator itself only calls mark() at section boundaries which
+# is a no-op by default.
+#
+#   wrap(cls)        subclass of a generator class whose emit_* methods
+#                    and mark() sections are timed
+#   searches()       context in which Sexp.search() and
+#                    lc4k_device.search() calls are counted per pattern
+#   report()         phases, sections, searches and memory as dict
+#
+# With memory, tracemalloc runs while profiling and each phase records
+# its current and peak traced memory. The top allocation sites of the
+# whole run are part of the report.
+#
+
+import contextlib
+import os
+import time
+import tracemalloc
+
+
+class lc4k_profiler():
+
+    def __init__(self, memory=False, top=20):
+        self.memory = memory
+        self.top = top
+        self.phases = {}
+        self.searches_by_pattern = {}
+        self.snapshot = None
+        # open phase and section as (name, start)
+        self._phase = None
+        self._section = None
+
+    #
+    # Timing records
+    #
+    def record(self, table, name, seconds):
+        entry = table.get(name)
+        if entry is None:
+            entry = table[name] = {'calls': 0, 'seconds': 0.0}
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        return entry
+
+    def begin_phase(self, name):
+        self._phase = (name, time.perf_counter())
+        self._section = None
+        if self.memory:
+            tracemalloc.reset_peak()
+
+    def end_phase(self):
+        now = time.perf_counter()
+        self.end_section(now)
+        name, start = self._phase
+        entry = self.record(self.phases, name, now - start)
+        if self.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            entry['memory_current'] = current
+            entry['memory_peak'] = max(entry.get('memory_peak', 0), peak)
+        self._phase = None
+
+    def mark(self, name):
+        '''Start section name of the open phase, ends the previous section.'''
+        now = time.perf_counter()
+        self.end_section(now)
+        if self._phase is not None:
+            self._section = (name, now)
+
+    def end_section(self, now):
+        if self._section is not None:
+            name, start = self._section
+            sections = self.phases.setdefault(self._phase[0], {'calls': 0, 'seconds': 0.0}).setdefault('sections', {})
+            self.record(sections, name, now - start)
+            self._section = None
+
+    #
+    # Generator classes
+    #
+    def wrap(self, cls):
+        '''Subclass of generator class cls, instances report to this profiler.'''
+        profiler = self
+
+        def timed_emit(name):
+            emit = getattr(cls, name)
+            def timed(self, *args, **kwargs):
+                # emits called from emits belong to the outer phase
+                if profiler._phase is not None:
+                    return emit(self, *args, **kwargs)
+                profiler.begin_phase(name)
+                try:
+                    return emit(self, *args, **kwargs)
+                finally:
+                    profiler.end_phase()
+            return timed
+
+        def mark(self, name):
+            profiler.mark(name)
+
+        methods = {name: timed_emit(name) for name in dir(cls) if name.startswith('emit_')}
+        methods['mark'] = mark
+        methods['__slots__'] = ()
+        return type(f'profiled_{cls.__name__}', (cls,), methods)
+
+    #
+    # Searches
+    #
+    @staticmethod
+    def pattern_name(pattern):
+        if callable(pattern):
+            code = getattr(pattern, '__code__', None)
+            if code is not None:
+                return f'{os.path.basename(code.co_filename)}:{code.co_firstlineno} {pattern.__name__}'
+            return repr(pattern)
+        return str(pattern)
+
+    @contextlib.contextmanager
+    def searches(self):
+        '''Count and time Sexp.search() and lc4k_device.search() per pattern.'''
+        from simp_sexp import Sexp
+        from lc4k_device import lc4k_device
+
+        profiler = self
+
+        def timed_search(kind, search):
+            def timed(self, pattern, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return search(self, pattern, *args, **kwargs)
+                finally:
+                    profiler.record(profiler.searches_by_pattern, f'{kind} {profiler.pattern_name(pattern)}',
+                                    time.perf_counter() - start)
+            return timed
+
+        sexp_search, device_search = Sexp.search, lc4k_device.search
+        Sexp.search = timed_search('sexp', sexp_search)
+        lc4k_device.search = timed_search('device', device_search)
+        try:
+            yield self
+        finally:
+            Sexp.search, lc4k_device.search = sexp_search, device_search
+
+    #
+    # Whole run
+    #
+    @contextlib.contextmanager
+    def run(self):
+        '''Profile searches and, if enabled, memory while the context is active.'''
+        if self.memory:
+            tracemalloc.start()
+        try:
+            with self.searches():
+                yield self
+            if self.memory:
+                self.snapshot = tracemalloc.take_snapshot()
+        finally:
+            if self.memory:
+                tracemalloc.stop()
+
+    def report(self):
+        report = {
+            'phases'   : self.phases,
+            'searches' : dict(sorted(self.searches_by_pattern.items(), key=lambda item: -item[1]['seconds'])),
+        }
+        if self.snapshot is not None:
+            report['memory_top'] = [
+                {'location': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+                 'size': stat.size, 'count': stat.count}
+                for stat in self.snapshot.statistics('lineno')[:self.top]]
+        return report
@@ -0,0 +1,187 @@
+#
+# LC4K Device Registry
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_registry.py [<sx file or dir> ...] [-c <cache dir>] [--json] [--names]
+#
+# Metadata of all devices without parsing their S-expressions. The facts
+# tools commonly need are kept in a JSON index in the cache directory:
+#
+#   name, part, family, package   LC4064ZE_csBGA64, LC4064ZE, ZE, csBGA64
+#   rows, columns                 fusemap dimensions like lc4k_generator
+#   dimensions                    what they're taken from and checked against
+#   glbs, num_mcs, is_ze          logic blocks
+#   pins                          pin classes: io, input, clk and oe pins
+#
+# A device is only parsed, through load_device(), when its .sx file is new
+# or its size or modification time changed. device() loads the full
+# lc4k_device on demand.
+#
+
+import json
+import os
+import re
+import tempfile
+
+from lc4k_device import find_sx_files, load_device, version as device_version
+
+
+# bump when the metadata changes, invalidates the index
+version = 3
+
+default_cache_dir = os.environ.get('LC4K_CACHE_DIR') or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'gen', '.cache')
+
+
+def device_info(dev):
+    '''Metadata of lc4k_device dev.'''
+    match = re.match(r'(LC4\d+([A-Za-z]+))_(\w+)', dev.name)
+    part, family, package = match.groups() if match else (dev.name, None, None)
+
+    pins = dev.search('input_threshold/pin')
+    io_pins = {pin[1] for pin in dev.search('slew_rate/pin')}
+
+    def pin_map(key):
+        found = {}
+        for pin in pins:
+            entry = pin.search(lambda x: x[0] == key)
+            if entry:
+                found[str(entry[0][1])] = pin[1]
+        return found
+
+    return {
+        'name'    : dev.name,
+        'part'    : part,
+        'family'  : family,
+        'package' : package,
+        'rows'    : dev.num_rows,
+        'columns' : dev.num_columns,
+        'dimensions' : dev.dimension_source,
+        'glbs'    : dev.glbs,
+        'num_mcs' : 16 * len(dev.glbs),
+        'is_ze'   : dev.is_ze,
+        'pins'    : {
+            'io'    : [pin[1] for pin in pins if pin[1] in io_pins],
+            'input' : [pin[1] for pin in pins if pin[1] not in io_pins],
+            'clk'   : pin_map('clk'),
+            'oe'    : pin_map('oe'),
+        },
+    }
+
+def file_stamp(filename):
+    stat = os.stat(filename)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class lc4k_registry():
+    '''
+    Device metadata by name, for the .sx files below paths (the re4k
+    submodule by default). The index is kept in cache_dir.
+    '''
+
+    def __init__(self, paths=None, cache_dir=default_cache_dir):
+        self.cache_dir = cache_dir
+        self.files = {os.path.splitext(os.path.basename(sx_file))[0]: sx_file for sx_file in find_sx_files(paths)}
+        self.devices = {}
+        self._update()
+
+    @property
+    def index_file(self):
+        return os.path.join(self.cache_dir, 'registry.json') if self.cache_dir else None
+
+    def _key(self):
+        return f'{version}.{device_version}'
+
+    def _update(self):
+        index = {}
+        if self.index_file:
+            try:
+                with open(self.index_file) as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                pass
+            if index.get('version') != self._key():
+                index = {}
+        entries = index.get('devices', {})
+
+        changed = False
+        for name, sx_file in self.files.items():
+            stamp = file_stamp(sx_file)
+            entry = entries.get(name)
+            if entry is None or entry['stamp'] != stamp or entry['file'] != os.path.abspath(sx_file):
+                entry = {'file'  : os.path.abspath(sx_file),
+                         'stamp' : stamp,
+                         'info'  : device_info(load_device(sx_file, self.cache_dir))}
+                changed = True
+            self.devices[name] = entry
+
+        if changed and self.index_file:
+            # merge, the index may cover devices outside of paths
+            entries.update(self.devices)
+            self._save({'version': self._key(), 'devices': entries})
+
+    def _save(self, index):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=self.cache_dir, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(index, f, indent=1, sort_keys=True)
+            os.replace(tmpname, self.index_file)
+        except BaseException:
+            os.unlink(tmpname)
+            raise
+
+    #
+    # Lookups
+    #
+    def names(self):
+        return sorted(self.devices)
+
+    def __contains__(self, name):
+        return name in self.devices
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def info(self, name):
+        return self.devices[name]['info']
+
+    def sx_file(self, name):
+        return self.files[name]
+
+    def device(self, name):
+        '''Full lc4k_device of name, parsed or loaded from the cache.'''
+        return load_device(self.files[name], self.cache_dir)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='List the LC4K devices and their properties.')
+    parser.add_argument('sx', nargs='*', help='re4k device files (.sx) or directories, all of re4k by default')
+    parser.add_argument('-c', '--cache-dir', default=default_cache_dir,
+                        help='directory of the index (default: $LC4K_CACHE_DIR or src/gen/.cache)')
+    parser.add_argument('--json', action='store_true', help='print the metadata as JSON')
+    parser.add_argument('--names', action='store_true', help='only print the device names')
+    args = parser.parse_args()
+
+    registry = lc4k_registry(args.sx, args.cache_dir)
+
+    if args.json:
+        print(json.dumps({name: registry.info(name) for name in registry}, indent=1))
+    elif args.names:
+        for name in registry:
+            print(name)
+    else:
+        print(f"{'device':<20s} {'family':<6s} {'package':<10s} {'rows':>5s} {'columns':>7s} "
+              f"{'glbs':>4s} {'mcs':>4s} {'io':>4s} {'in':>4s}  dimensions")
+        for name in registry:
+            info = registry.info(name)
+            print(f"{name:<20s} {info['family'] or '':<6s} {info['package'] or '':<10s} {info['rows']:5d} "
+                  f"{info['columns']:7d} {len(info['glbs']):4d} {info['num_mcs']:4d} "
+                  f"{len(info['pins']['io']):4d} {len(info['pins']['input']):4d}  {info['dimensions']}")
+
+
+if __name__ == "__main__":
+    main()
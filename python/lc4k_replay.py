@@ -0,0 +1,290 @@
+#
+# LC4K Test Vector Replay
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_replay.py <sx file> <jed file or dir> [...] [-p <pin order>] [--vhdl <file>]
+#
+# Replays the V field test vectors of JEDEC files against their fusemaps.
+# Vectors are checked with lc4k_sim, one lane per file, or written as
+# VHDL testbench of the generated core with --vhdl.
+#
+# Column pin-1 of a vector is pin of the QP numbering. That's the pin
+# number of the re4k device for packages with numbered pins, BGA balls
+# require the order of the balls in a pin order file, one name per line.
+#
+# Each vector is one simulation step, or three if it pulses C or K pins:
+# the pins at their level between pulses, the pulse and the level again.
+# The outputs are compared after the last step:
+#
+#   H, L   output enabled and high/low
+#   Z      output disabled
+#
+# Pins that aren't driven by the vector read their expected H or L value,
+# as driven by the core itself, and '0' otherwise.
+#
+
+import numpy as np
+
+import jedec
+from lc4k_sim import lc4k_simulator
+
+
+def load_pin_order(filename):
+    '''Pin names of a pin order file in QP order, blank lines and # comments are skipped.'''
+    pins = []
+    with open(filename) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                pins.append(line)
+    return pins
+
+def qp_pins(dev, num_pins, pin_order=None):
+    '''
+    Device pin of each QP column, None for pins that are no I/O of the
+    core like power supply and JTAG.
+    '''
+    pins = [pin[1] for pin in dev.search('input_threshold/pin')]
+    if pin_order is None:
+        if not all(isinstance(pin, int) for pin in pins):
+            raise ValueError(f'{dev.name} has no numbered pins, the QP columns require a pin order')
+        pin_order = range(1, num_pins + 1)
+    elif len(pin_order) != num_pins:
+        raise ValueError(f'pin order has {len(pin_order)} pins, QP says {num_pins}')
+
+    by_name = {str(pin): pin for pin in pins}
+    return [by_name.get(str(pin)) for pin in pin_order]
+
+
+class lc4k_replay():
+
+    def __init__(self, fusemap, num_pins, pin_order=None):
+        '''Replay vectors of num_pins QP pins for the lc4k_fusemap of the design.'''
+        self.sim = lc4k_simulator(fusemap)
+        self.columns = qp_pins(fusemap.dev, num_pins, pin_order)
+
+        in_idx  = {pin: idx for idx, pin in enumerate(self.sim.input_pins)}
+        out_idx = {pin: idx for idx, pin in enumerate(self.sim.output_pins)}
+        self.in_columns  = np.array([col for col, pin in enumerate(self.columns) if pin in in_idx], dtype=np.intp)
+        self.in_index    = np.array([in_idx[self.columns[col]] for col in self.in_columns], dtype=np.intp)
+        self.out_columns = np.array([col for col, pin in enumerate(self.columns) if pin in out_idx], dtype=np.intp)
+        self.out_index   = np.array([out_idx[self.columns[col]] for col in self.out_columns], dtype=np.intp)
+
+    def stimulus(self, drive, pulse, expect):
+        '''
+        Simulation steps of the vectors, steps x 1 x input_pins bool for
+        lc4k_simulator.run(), and the step of each vector to compare.
+        '''
+        level = np.where(drive >= 0, drive, np.where((expect == 0) | (expect == 1), expect, 0)).astype(bool)
+        pulsed = pulse.any(axis=1)
+        steps = np.where(pulsed, 3, 1)
+        compare = np.cumsum(steps) - 1
+
+        qp = np.repeat(level, steps, axis=0)
+        pulse_steps = compare[pulsed] - 1
+        qp[pulse_steps] ^= pulse[pulsed]
+
+        stimulus = np.zeros((len(qp), 1, self.sim.num_pins), dtype=bool)
+        stimulus[:, 0, self.in_index] = qp[:, self.in_columns]
+        return stimulus, compare
+
+    def replay(self, drive, pulse, expect):
+        '''
+        Simulate the vectors of jedec.Jedec.vector_values(). Returns the
+        failed checks, vectors x QP pins bool.
+        '''
+        stimulus, compare = self.stimulus(drive, pulse, expect)
+        out, oe, state = self.sim.run(stimulus)
+        out = out[compare, 0][:, self.out_index]
+        oe  = oe[compare, 0][:, self.out_index]
+
+        # expectations on pins without output fail
+        failed = expect != jedec.EXPECT_NONE
+        failed[:, self.out_columns] = False
+
+        exp = expect[:, self.out_columns]
+        failed[:, self.out_columns] = np.where(exp == jedec.EXPECT_Z, oe,
+                                               np.where(exp == jedec.EXPECT_NONE, False, ~oe | (out != (exp == 1))))
+        return failed
+
+    def check(self, jed):
+        '''Failed checks of the test vectors of jedec.Jedec jed, see replay().'''
+        return self.replay(*jed.vector_values())
+
+
+def write_testbench(filename, replay, jed, entity):
+    '''
+    VHDL testbench of core entity that applies the vectors of jed and
+    checks the outputs. The core gets the fusemap of jed as g_fusemap.
+    '''
+    from jed2vhdl import fusemap_vector
+
+    dev = replay.sim.fusemap.dev
+    pins = [pin[1] for pin in dev.search('input_threshold/pin')]
+    outputs = set(replay.sim.output_pins)
+    drive, pulse, expect = jed.vector_values()
+
+    lines = []
+    def line(text=''):
+        lines.append(text + '\n')
+
+    line('library ieee;')
+    line('use ieee.std_logic_1164.all;')
+    line()
+    line(f'entity {entity}_tb is')
+    line('end;')
+    line()
+    line(f'architecture sim of {entity}_tb is')
+    line()
+    line(f'  constant c_fusemap : std_logic_vector(0 to {len(jed.fuses)}-1) :=')
+    lines.append(fusemap_vector(jed.fuses, 88, hex=True).rstrip('\n') + ';\n')
+    line()
+    for pin in pins:
+        line(f'  signal pad_{pin} : std_logic;')
+        if pin in outputs:
+            line(f'  signal o_{pin}, oe_{pin} : std_logic;')
+    line()
+    line('begin')
+    line()
+    line(f'  core_b : entity work.{entity}')
+    line('    generic map (')
+    line('      g_fusemap => c_fusemap')
+    line('    )')
+    line('    port map (')
+    ports = []
+    for pin in pins:
+        ports.append(f'      i_{pin} => pad_{pin}')
+        if pin in outputs:
+            ports.append(f'      o_{pin} => o_{pin}')
+            ports.append(f'      oe_{pin} => oe_{pin}')
+    if dev.is_ze:
+        ports.append("      i_oscclk => '0'")
+    lines.append(',\n'.join(ports) + '\n')
+    line('    );')
+    line()
+    line('  -- pads are pulled low, driven by the core and the test')
+    for pin in pins:
+        line(f"  pad_{pin} <= 'L';")
+        if pin in outputs:
+            line(f"  pad_{pin} <= o_{pin} when oe_{pin} = '1' else 'Z';")
+    line()
+    line('  stimulus : process')
+    line('    variable errors : natural := 0;')
+    line()
+    line('    procedure check(value, expected : std_logic; vector : natural; pin : string) is')
+    line('    begin')
+    line('      if value /= expected then')
+    line('        report "vector " & integer\'image(vector) & ": pin " & pin & " failed" severity error;')
+    line('        errors := errors + 1;')
+    line('      end if;')
+    line('    end procedure;')
+    line()
+    line('  begin')
+
+    inverse = {"'0'": "'1'", "'1'": "'0'"}
+    previous = {}
+    for vector, number in enumerate(jed.vector_numbers):
+        line(f'    -- vector {number}')
+        for col, pin in enumerate(replay.columns):
+            if pin is None:
+                continue
+            value = "'Z'" if drive[vector, col] < 0 else f"'{drive[vector, col]}'"
+            if previous.get(pin) != value:
+                line(f'    pad_{pin} <= {value};')
+                previous[pin] = value
+        line('    wait for 10 ns;')
+
+        pulsed = [replay.columns[col] for col in np.flatnonzero(pulse[vector]) if replay.columns[col] is not None]
+        if pulsed:
+            for pin in pulsed:
+                line(f'    pad_{pin} <= {inverse[previous[pin]]};')
+            line('    wait for 10 ns;')
+            for pin in pulsed:
+                line(f'    pad_{pin} <= {previous[pin]};')
+            line('    wait for 10 ns;')
+
+        for col, pin in enumerate(replay.columns):
+            value = expect[vector, col]
+            if value == jedec.EXPECT_NONE:
+                continue
+            if pin not in outputs:
+                line(f'    report "vector {number}: pin {col+1} is no output" severity error;')
+                line('    errors := errors + 1;')
+            elif value == jedec.EXPECT_Z:
+                line(f"    check(oe_{pin}, '0', {number}, \"{pin}\");")
+            else:
+                line(f"    check(oe_{pin}, '1', {number}, \"{pin}\");")
+                line(f"    check(o_{pin}, '{value}', {number}, \"{pin}\");")
+
+    line()
+    line('    assert errors = 0 report integer\'image(errors) & " failed checks" severity failure;')
+    line(f'    report "{len(jed.vector_numbers)} vectors passed" severity note;')
+    line('    wait;')
+    line('  end process;')
+    line()
+    line('end;')
+
+    with open(filename, 'w') as f:
+        f.writelines(lines)
+
+
+def main():
+    import argparse
+    import sys
+
+    from lc4k_device import load_device
+    from lc4k_fusemap import lc4k_fusemap
+
+    parser = argparse.ArgumentParser(description='Replay the test vectors of JEDEC files against their fusemaps.')
+    parser.add_argument('sx', help='re4k device file (.sx)')
+    parser.add_argument('jed', nargs='+', help='JEDEC files or directories of the device')
+    parser.add_argument('-p', '--pin-order', help='file with the pin names in QP order, required for BGA packages')
+    parser.add_argument('--vhdl', help='write a VHDL testbench of a single JEDEC file instead')
+    parser.add_argument('-c', '--cache-dir', help='device cache directory')
+    args = parser.parse_args()
+
+    jed_files = jedec.find_jed_files(args.jed)
+    if args.vhdl and len(jed_files) != 1:
+        parser.error('--vhdl requires a single JEDEC file')
+
+    dev = load_device(args.sx, args.cache_dir)
+    pin_order = load_pin_order(args.pin_order) if args.pin_order else None
+
+    failed = 0
+    for jed_file in jed_files:
+        jed = jedec.Jedec()
+        try:
+            jed.load(jed_file, verify=True, vectors=True)
+            replay = lc4k_replay(lc4k_fusemap(dev, jed.fuse_data), jed.number_of_pins, pin_order)
+        except (OSError, ValueError) as e:
+            print(f'FAIL  {jed_file}  {e}')
+            failed += 1
+            continue
+
+        if args.vhdl:
+            write_testbench(args.vhdl, replay, jed, f'{dev.name.lower()}_core')
+            break
+
+        if not jed.number_of_vectors:
+            print(f'NONE  {jed_file}')
+            continue
+
+        errors = replay.check(jed)
+        vectors = errors.any(axis=1)
+        if vectors.any():
+            failed += 1
+            print(f'FAIL  {jed_file}  {vectors.sum()} of {jed.number_of_vectors} vectors')
+            for vector in np.flatnonzero(vectors)[:10]:
+                pins = ' '.join(str(col + 1) for col in np.flatnonzero(errors[vector]))
+                print(f'        vector {jed.vector_numbers[vector]}: pins {pins}')
+        else:
+            print(f'OK    {jed_file}  {jed.number_of_vectors} vectors')
+
+    if not args.vhdl:
+        print(f'{len(jed_files)} files, {failed} failed', file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
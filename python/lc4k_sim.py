@@ -0,0 +1,276 @@
+#
+# LC4K Fusemap Simulator
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_sim.py <sx file> <jed file> [-l <lanes>] [-s <steps>] [--vcd <file>]
+#
+# Cycle-based simulation of a fusemap for many independent stimulus lanes.
+# Builds on lc4k_eval, lanes are bit-sliced like the evaluator's vectors
+# and each macrocell register holds one row of words.
+#
+# Per step, the pins of all lanes are applied, the combinational logic is
+# settled and the registers are updated, following lc4k_macrocell:
+#
+#   D-FF / T-FF   rising edge of the selected clock, with clock enable
+#   latch         transparent while clock and clock enable are '1'
+#   init          async reset/preset from the shared or PT init and the
+#                 async PT, reset has priority
+#
+# A rising edge is a clock that's '0' in the previous step and '1' now.
+# Flip-flops load once per step. The logic is settled again after the
+# update, open latches take the new D inputs and the logic is settled
+# until the latch outputs are stable, so a latch passes on what an upstream
+# latch opened in the same step. The pin outputs of the step are taken from
+# there. Clocks and inits that are derived from registers see the update in
+# the next step.
+#
+
+import numpy as np
+
+from lc4k_eval import lc4k_evaluator, pack, unpack, ONES, ZEROS
+
+
+class lc4k_simulator(lc4k_evaluator):
+
+    # macrocell_r.macrocell_function
+    function_comb  = '00'
+    function_tff   = '01'
+    function_latch = '10'
+    function_dff   = '11'
+
+    def __init__(self, fusemap):
+        super().__init__(fusemap)
+        num_mcs = fusemap.num_mcs
+        num_pts = fusemap.num_pts
+        num_glbs = len(self.glbs)
+
+        # rows of the control table: product terms of all GLBs including
+        # their constant '0' row, then per GLB bclk0..3, shared PT clock and
+        # shared PT init, at last constant '1'
+        def pt_row(glb, pt):
+            return glb * (num_pts + 1) + (num_pts if pt is None else pt)
+
+        def ctl_row(glb, idx):
+            return num_glbs * (num_pts + 1) + glb * 6 + idx
+
+        ones_row = num_glbs * (num_pts + 1) + num_glbs * 6
+
+        # block clocks from the dedicated clock pins, '0' for missing ones
+        pin_idx = {pin: idx for idx, pin in enumerate(self.input_pins)}
+        clkpins = fusemap.clk_pins()
+        clk = [pin_idx[clkpins[idx]] if idx in clkpins else self.num_pins for idx in range(0, 4)]
+
+        self.bclk_index  = []
+        self.bclk_invert = []
+        self.shared_invert = []
+        for glb in self.glbs:
+            config = fusemap.glb_config(glb)
+            for idx, pair in ((0, 1), (1, 0), (2, 3), (3, 2)):
+                polarity = config[f'bclk{min(idx, pair)}{max(idx, pair)}_polarity'][idx % 2]
+                self.bclk_index.append(clk[idx] if polarity == '1' else clk[pair])
+                self.bclk_invert.append(ZEROS if polarity == '1' else ONES)
+            self.shared_invert.append(ZEROS if config['shared_pt_clk_polarity'] == '1' else ONES)
+            self.shared_invert.append(ZEROS if config['shared_pt_init_polarity'] == '1' else ONES)
+        self.bclk_index    = np.array(self.bclk_index, dtype=np.intp)
+        self.bclk_invert   = np.array(self.bclk_invert, dtype=np.uint64)
+        self.shared_invert = np.array(self.shared_invert, dtype=np.uint64)
+        self.shared_index  = np.array([pt_row(glb, pt) for glb in range(0, num_glbs)
+                                       for pt in (fusemap.shared_pt_clk, fusemap.shared_pt_init)], dtype=np.intp)
+
+        # macrocell controls as rows of the control table
+        self.clk_index   = np.zeros(self.num_regs, dtype=np.intp)
+        self.clk_invert  = np.zeros(self.num_regs, dtype=np.uint64)
+        self.ce_index    = np.zeros(self.num_regs, dtype=np.intp)
+        self.ce_invert   = np.zeros(self.num_regs, dtype=np.uint64)
+        self.preset_index = np.zeros(self.num_regs, dtype=np.intp)
+        self.reset_index  = np.zeros(self.num_regs, dtype=np.intp)
+        self.tff   = np.zeros(self.num_regs, dtype=bool)
+        self.latch = np.zeros(self.num_regs, dtype=bool)
+
+        for glb_num, glb in enumerate(self.glbs):
+            routing = fusemap.ela_routing(glb)
+            for mc in range(0, num_mcs):
+                config = fusemap.mc_config(glb, mc)
+                pts = routing[mc]['pt']
+                idx = glb_num * num_mcs + mc
+
+                clock_source = config['clock_source']
+                if clock_source in fusemap.clk_bclk:
+                    self.clk_index[idx] = ctl_row(glb_num, fusemap.clk_bclk[clock_source])
+                elif clock_source in (fusemap.clk_pt, fusemap.clk_pt_inv):
+                    self.clk_index[idx] = pt_row(glb_num, pts[1])
+                    self.clk_invert[idx] = ONES if clock_source == fusemap.clk_pt_inv else ZEROS
+                elif clock_source == fusemap.clk_shared_pt:
+                    self.clk_index[idx] = ctl_row(glb_num, 4)
+                else:
+                    self.clk_index[idx] = pt_row(glb_num, None)
+
+                clock_enable_source = config['clock_enable_source']
+                if clock_enable_source == '00':
+                    self.ce_index[idx] = ctl_row(glb_num, 4)
+                elif clock_enable_source in ('10', '01'):
+                    self.ce_index[idx] = pt_row(glb_num, pts[2])
+                    self.ce_invert[idx] = ONES if clock_enable_source == '10' else ZEROS
+                else:
+                    self.ce_index[idx] = ones_row
+
+                shared_init = ctl_row(glb_num, 5) if config['init_source'] == '1' else pt_row(glb_num, pts[3])
+                async_init  = pt_row(glb_num, pts[2] if config['async_source'] == '0' else None)
+                if config['init_state'] == '0':
+                    self.preset_index[idx], self.reset_index[idx] = shared_init, async_init
+                else:
+                    self.preset_index[idx], self.reset_index[idx] = async_init, shared_init
+
+                self.tff[idx]   = config['macrocell_function'] == self.function_tff
+                self.latch[idx] = config['macrocell_function'] == self.function_latch
+
+    #
+    # Simulation on bit-sliced words
+    #
+    def controls(self, pins, pts):
+        '''Control table for the pin words and the product terms of each GLB.'''
+        words = pins.shape[1]
+        zeros = np.zeros((1, words), dtype=np.uint64)
+        pts = np.concatenate(pts)
+        bclks = np.concatenate((pins, zeros))[self.bclk_index] ^ self.bclk_invert[:, None]
+        shared = pts[self.shared_index] ^ self.shared_invert[:, None]
+        ctl = np.concatenate((bclks.reshape(-1, 4, words), shared.reshape(-1, 2, words)), axis=1).reshape(-1, words)
+        return np.concatenate((pts, ctl, ~zeros))
+
+    def step(self, pins, regs, prev_clk=None):
+        '''
+        One step for the pin words. regs are the macrocell outputs of the
+        previous step, prev_clk the macrocell clocks there, None for the
+        first step. Returns regs, clocks and product terms of this step.
+        '''
+        regs, pts, din = self.settle(pins, regs)
+        table = self.controls(pins, pts)
+
+        clk    = table[self.clk_index] ^ self.clk_invert[:, None]
+        ce     = table[self.ce_index] ^ self.ce_invert[:, None]
+        preset = table[self.preset_index]
+        reset  = table[self.reset_index]
+
+        edge = clk & ~prev_clk if prev_clk is not None else np.zeros_like(clk)
+        load = np.where(self.latch[:, None], clk & ce, edge & ce)
+        update = np.where(self.tff[:, None], regs ^ (load & din), (regs & ~load) | (din & load))
+        update = (update | preset) & ~reset
+        update[self.comb] = regs[self.comb]
+
+        # open latches are transparent, their D inputs may change with the
+        # update of other latches
+        held = regs
+        for _ in range(0, int(self.latch.sum()) + 2):
+            regs, pts, din = self.settle(pins, update)
+            latched = (((held & ~load) | (din & load)) | preset) & ~reset
+            if np.array_equal(latched[self.latch], update[self.latch]):
+                return regs, clk, pts
+            update[self.latch] = latched[self.latch]
+
+        raise ValueError('latch loop, transparent latches don\'t settle')
+
+    #
+    # Simulation on lanes
+    #
+    def run(self, stimulus, state=None):
+        '''
+        Simulate stimulus (steps x lanes x input_pins, bool). Registers start
+        from state (lanes x macrocells, power up values by default).
+        Returns output values and output enables, steps x lanes x
+        output_pins each, and the final state.
+        '''
+        stimulus = np.asarray(stimulus, dtype=bool)
+        steps, lanes = stimulus.shape[:2]
+        out = np.empty((steps, lanes, len(self.orp)), dtype=bool)
+        oe  = np.empty((steps, lanes, len(self.orp)), dtype=bool)
+
+        if state is None:
+            regs = self.initial_state((lanes + 63) // 64)
+        else:
+            regs = pack(state)
+
+        clk = None
+        for step in range(0, steps):
+            pins = pack(stimulus[step])
+            regs, clk, pts = self.step(pins, regs, clk)
+            out_words, oe_words = self.outputs(pins, regs, pts)
+            out[step] = unpack(out_words, lanes)
+            oe[step]  = unpack(oe_words, lanes)
+
+        return out, oe, unpack(regs, lanes)
+
+
+def write_vcd(filename, names, values, timescale='1 ns'):
+    '''VCD of signals names with values (steps x signals of '0', '1' or 'z').'''
+    def ident(idx):
+        # printable VCD identifier, base 94 from '!'
+        chars = chr(33 + idx % 94)
+        while idx >= 94:
+            idx = idx // 94 - 1
+            chars += chr(33 + idx % 94)
+        return chars
+
+    ids = [ident(idx) for idx in range(0, len(names))]
+    with open(filename, 'w') as f:
+        f.write(f'$timescale {timescale} $end\n$scope module lc4k $end\n')
+        for ident, name in zip(ids, names):
+            f.write(f'$var wire 1 {ident} {name} $end\n')
+        f.write('$upscope $end\n$enddefinitions $end\n')
+        previous = [None] * len(names)
+        for step, row in enumerate(values):
+            changes = [f'{value}{ident}\n' for ident, value, old in zip(ids, row, previous) if value != old]
+            if changes:
+                f.write(f'#{step}\n' + ''.join(changes))
+            previous = list(row)
+        f.write(f'#{len(values)}\n')
+
+
+def main():
+    import argparse
+    import time
+
+    import jedec
+    from lc4k_device import load_device
+    from lc4k_fusemap import lc4k_fusemap
+
+    parser = argparse.ArgumentParser(description='Simulate a fusemap for random stimulus lanes.')
+    parser.add_argument('sx', help='re4k device file (.sx)')
+    parser.add_argument('jed', help='JEDEC file of the design')
+    parser.add_argument('-l', '--lanes', type=int, default=4096, help='number of stimulus lanes')
+    parser.add_argument('-s', '--steps', type=int, default=1000, help='number of steps')
+    parser.add_argument('--vcd', help='write the pin trace of lane 0 to this file')
+    parser.add_argument('-c', '--cache-dir', help='device cache directory')
+    args = parser.parse_args()
+
+    jed = jedec.Jedec()
+    jed.load(args.jed, verify=True)
+    dev = load_device(args.sx, args.cache_dir)
+
+    start = time.perf_counter()
+    sim = lc4k_simulator(lc4k_fusemap(dev, jed.fuse_data))
+    t_setup = time.perf_counter() - start
+
+    # random pins, the dedicated clock pins toggle every step
+    stimulus = np.random.default_rng(0).integers(0, 2, (args.steps, args.lanes, sim.num_pins), dtype=np.uint8).astype(bool)
+    for clkpin in sim.fusemap.clk_pins().values():
+        stimulus[:, :, sim.input_pins.index(clkpin)] = (np.arange(args.steps) % 2 == 1)[:, None]
+
+    start = time.perf_counter()
+    out, oe, state = sim.run(stimulus)
+    t_sim = time.perf_counter() - start
+
+    lane_steps = args.steps * args.lanes
+    print(f'{dev.name}: setup {t_setup:.3f}s, {args.lanes} lanes x {args.steps} steps in {t_sim:.3f}s '
+          f'({lane_steps / max(t_sim, 1e-9):.0f} lane steps/s)')
+
+    if args.vcd:
+        names = [f'i_{pin}' for pin in sim.input_pins] + [f'o_{pin}' for pin in sim.output_pins]
+        values = [[str(int(value)) for value in stimulus[step, 0]] +
+                  [str(int(value)) if enabled else 'z' for value, enabled in zip(out[step, 0], oe[step, 0])]
+                  for step in range(0, args.steps)]
+        write_vcd(args.vcd, names, values)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#
+# LC4K Test Wrapper
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+# lc4k_wrapper.py <wrapper> <jed file> [-w <width>]
+#
+# Reads the test wrappers tests/<test>/<device>/cpld/*_cpld.vhd: the
+# c_fusemap constant they set the g_fusemap of the core with, and the
+# device pins their RTL ports are connected to. The command line writes
+# c_fusemap as JEDEC file, so the test fusemaps can be fed to the tools
+# that read JEDEC files. wrapper_module translates a wrapper into a yosys
+# JSON module for lc4k_netlist -w.
+#
+
+import itertools
+import re
+
+
+def wrapper_fusemap(filename):
+    '''c_fusemap of a test wrapper as str of '0'/'1', from bit or hex string literals.'''
+    with open(filename) as f:
+        text = f.read()
+    match = re.search(r'constant\s+c_fusemap\s*:\s*std_logic_vector\(0 to (\d+)\s*-\s*1\)\s*:=(.*?);', text, re.DOTALL)
+    if not match:
+        raise ValueError('no c_fusemap constant')
+
+    bits = []
+    for hex, literal in re.findall(r'(x?)"([0-9A-Fa-f]*)"', match.group(2)):
+        bits.append(''.join(f'{int(digit, 16):04b}' for digit in literal) if hex else literal)
+    bits = ''.join(bits)
+    if len(bits) != int(match.group(1)):
+        raise ValueError(f'c_fusemap has {len(bits)} bits, declared {match.group(1)}')
+    return bits
+
+def wrapper_ports(filename):
+    '''
+    Device pins of the RTL port bits in a test wrapper. Returns the pins of
+    the inputs and outputs, {port bit: pin} each, and the unconnected pins.
+    The outputs are resolved through the wrapper's assignments of the core
+    signals to its output ports.
+    '''
+    with open(filename) as f:
+        text = f.read()
+
+    # o_d <= d_out; or o_d(idx) <= d_out(idx) when ... in a generate
+    outputs = {signal: port for port, signal in re.findall(r'^\s*(o_\w+)(?:\(\w+\))?\s*<=\s*(\w+)', text, re.MULTILINE)}
+
+    inputs = {}
+    pins = {}
+    ncon = []
+    for kind, pin, signal, index in re.findall(r'^\s*(i|o)_(\w+)\s*=>\s*(\w+)(\(\d+\))?', text, re.MULTILINE):
+        if kind == 'i' and signal == 'ncon':
+            ncon.append(pin)
+        elif kind == 'i' and signal.startswith('i_'):
+            inputs[signal + index] = pin
+        elif kind == 'o' and signal in outputs:
+            pins[outputs[signal] + index] = pin
+    return inputs, pins, ncon
+
+def wrapper_module(filename):
+    '''
+    A test wrapper as yosys JSON module, the core is a cell of the core's
+    entity. Returns the entity name, the core entity name and the module.
+    Covers the statements of the test wrappers: the core instance, plain
+    and conditional assignments, also in for generate loops, with 'Z' as
+    tristate buffer.
+    '''
+    with open(filename) as f:
+        text = re.sub(r'--.*', '', f.read())
+
+    entity = re.search(r'^entity (\w+) is(.*?)^end;', text, re.MULTILINE | re.DOTALL)
+    if not entity:
+        raise ValueError('no entity found')
+    body = text[entity.end():]
+    body = body[re.search(r'^begin\s*$', body, re.MULTILINE).end():]
+
+    # name -> indices of its bits, [None] for std_logic
+    ranges = {}
+    ports = []
+    for name, mode, high, low in re.findall(r'(\w+)\s*:\s*(in|out)\s+std_logic(?:_vector\((\d+)\s+downto\s+(\d+)\))?',
+                                            entity.group(2)):
+        ranges[name] = list(range(int(low), int(high) + 1)) if high else [None]
+        ports.append((name, mode))
+    for names, ref in re.findall(r'^\s*signal\s+([\w\s,]+?)\s*:\s*std_logic(?:_vector\((\w+)\'range\))?\s*;', text, re.MULTILINE):
+        for name in re.split(r'\s*,\s*', names):
+            ranges[name] = ranges[ref] if ref else [None]
+
+    # bits are numbered from 2 like yosys does, assignments alias a bit to its source
+    numbers = itertools.count(2)
+    bits = {}
+    alias = {}
+    driven = set()
+    assigned = set()
+    cells = {}
+
+    def bit(name, index=None):
+        if name in ("'0'", "'1'"):
+            return name[1]
+        if name not in ranges:
+            raise ValueError(f'unknown signal {name}')
+        if index is None and ranges[name] != [None]:
+            raise ValueError(f'{name} is a vector')
+        if (name, index) not in bits:
+            bits[(name, index)] = next(numbers)
+        return bits[(name, index)]
+
+    def find(number):
+        while number in alias:
+            number = alias[number]
+        return number
+
+    def drive(number, what):
+        number = find(number)
+        if number in driven or number in ('0', '1'):
+            raise ValueError(f'multiple drivers of {what}')
+        driven.add(number)
+        return number
+
+    def operand(operand, index):
+        match = re.fullmatch(r"('[01Z]'|\w+)(?:\((\w+)\))?", operand.strip())
+        if not match:
+            raise ValueError(f'unsupported operand {operand}')
+        name, idx = match.groups()
+        if name == "'Z'":
+            return 'Z'
+        if idx is not None:
+            return bit(name, int(idx))
+        return bit(name, index if name in ranges and ranges[name] != [None] else None)
+
+    def add_cell(celltype, connections, outputs=('Y',)):
+        cells[f'${len(cells)}'] = {
+            'hide_name': 1,
+            'type': celltype,
+            'parameters': {},
+            'attributes': {},
+            'port_directions': {port: 'output' if port in outputs else 'input' for port in connections},
+            'connections': connections,
+        }
+
+    for name, mode in ports:
+        if mode == 'in':
+            for index in ranges[name]:
+                drive(bit(name, index), name)
+
+    # core instance
+    instance = re.search(r'(\w+)\s*:\s*entity\s+work\.(\w+)\s+generic map\s*\(.*?\)\s*port map\s*\((.*?)\)\s*;', body, re.DOTALL)
+    if not instance:
+        raise ValueError('no core instance found')
+    core = instance.group(2)
+    connections = {}
+    directions = {}
+    for formal, actual in re.findall(r'(\w+)\s*=>\s*(open|\'[01]\'|\w+(?:\(\d+\))?)', instance.group(3)):
+        directions[formal] = 'input' if formal.startswith('i_') else 'output'
+        if actual == 'open':
+            connections[formal] = next(numbers)
+        else:
+            connections[formal] = operand(actual, None)
+            if directions[formal] == 'output':
+                drive(connections[formal], actual)
+    body = body[:instance.start()] + body[instance.end():]
+
+    # generate loops are unrolled
+    statements = []
+    for label, var, ref, loop in re.findall(r'(\w+)\s*:\s*for\s+(\w+)\s+in\s+(\w+)\'range\s+generate(.*?)end generate\s*;', body, re.DOTALL):
+        for index in ranges[ref]:
+            unrolled = re.sub(rf'\b{var}\b', str(index), loop)
+            statements += re.findall(r'^\s*(\w+)(?:\((\d+)\))?\s*<=\s*(.*?);', unrolled, re.MULTILINE | re.DOTALL)
+    body = re.sub(r'\w+\s*:\s*for\s.*?end generate\s*;', '', body, flags=re.DOTALL)
+    statements += re.findall(r'^\s*(\w+)(?:\((\d+)\))?\s*<=\s*(.*?);', body, re.MULTILINE | re.DOTALL)
+
+    for target, idx, expr in statements:
+        indices = [int(idx)] if idx else ranges[target]
+        for index in indices:
+            # a when c = '1' else b when d = '1' else e, built from the last else
+            terms = [term.strip() for term in re.split(r'\belse\b', expr)]
+            value = operand(terms[-1], index)
+            for term in reversed(terms[:-1]):
+                match = re.fullmatch(r'(.+?)\s+when\s+(\w+(?:\(\w+\))?)\s*=\s*\'1\'', term, re.DOTALL)
+                if not match:
+                    raise ValueError(f'unsupported expression {term}')
+                a, s = operand(match.group(1), index), operand(match.group(2), index)
+                y = next(numbers)
+                if value == 'Z':
+                    add_cell('$_TBUF_', {'A': [a], 'E': [s], 'Y': [y]})
+                else:
+                    add_cell('$_MUX_', {'A': [value], 'B': [a], 'S': [s], 'Y': [y]})
+                driven.add(y)
+                value = y
+            if value == 'Z':
+                raise ValueError(f'unsupported expression {expr}')
+            target_bit = bit(target, index if ranges[target] != [None] else None)
+            if target_bit in assigned or find(target_bit) in driven or find(target_bit) in ('0', '1'):
+                raise ValueError(f'multiple drivers of {target}')
+            assigned.add(target_bit)
+            alias[find(target_bit)] = find(value)
+
+    def resolve(numbers):
+        return [find(number) if isinstance(number, int) else number for number in numbers]
+
+    for cell in cells.values():
+        cell['connections'] = {port: resolve(numbers) for port, numbers in cell['connections'].items()}
+    cells[instance.group(1)] = {
+        'hide_name': 0,
+        'type': core,
+        'parameters': {},
+        'attributes': {},
+        'port_directions': directions,
+        'connections': {formal: resolve([number]) for formal, number in connections.items()},
+    }
+
+    module_ports = {name: {'direction': 'input' if mode == 'in' else 'output',
+                           'bits': resolve([bit(name, index) for index in ranges[name]])} for name, mode in ports}
+    netnames = {}
+    for name in ranges:
+        if all((name, index) in bits for index in ranges[name]):
+            netnames[name] = {'hide_name': 0, 'bits': resolve([bits[(name, index)] for index in ranges[name]]), 'attributes': {}}
+    return entity.group(1), core, {'attributes': {}, 'ports': module_ports, 'cells': cells, 'netnames': netnames}
+
+
+def main():
+    import argparse
+    import os
+    import sys
+
+    import jedec
+
+    parser = argparse.ArgumentParser(description='Write the c_fusemap of a test wrapper as JEDEC file.')
+    parser.add_argument('wrapper', help='test wrapper, tests/<test>/<device>/cpld/*_cpld.vhd')
+    parser.add_argument('jed', help='JEDEC file to write')
+    parser.add_argument('-w', '--width', type=int, default=80, help='number of fuses per L field')
+    args = parser.parse_args()
+
+    try:
+        fuses = wrapper_fusemap(args.wrapper)
+    except (OSError, ValueError) as e:
+        sys.exit(f'{args.wrapper}: {e}')
+
+    jed = jedec.Jedec()
+    jed.fuse_data = fuses
+    jed.save(args.jed, os.path.basename(args.wrapper), args.width)
+
+
+if __name__ == "__main__":
+    main()
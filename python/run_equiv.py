@@ -0,0 +1,165 @@
+#--------------------------------------------------------------------
+#
+# run_equiv.py [<test dir> ...] [-j <jobs>] [-f] [-k <pattern>]
+#
+# Run the yosys equivalence checks of tests/ in parallel. Every
+# <test>/<device> pair is a job that runs equiv.ys like tests/common.mk
+# does. The cores of all devices are generated upfront in src/gen.
+#
+# Passing results are cached in tests/.equiv_cache.json. The key is a
+# content hash of the generated core, the src/rtl files, the test's rtl
+# and cpld sources and equiv.ys, so a job only reruns when one of them
+# changes. A timing report of all jobs is printed at the end.
+#
+#--------------------------------------------------------------------
+
+#--------------------------------------------------------------------
+# Imports
+#--------------------------------------------------------------------
+
+# System
+import argparse
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+#--------------------------------------------------------------------
+# Private
+#--------------------------------------------------------------------
+
+root_dir  = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+tests_dir = os.path.join(root_dir, 'tests')
+gen_dir   = os.path.join(root_dir, 'src', 'gen')
+rtl_dir   = os.path.join(root_dir, 'src', 'rtl')
+
+yosys_cmd = ['yosys', '-m', 'ghdl', '-s', '../../equiv.ys']
+
+def find_jobs(paths, patterns):
+    '''(test, device) pairs below the test directories, filtered by patterns.'''
+    jobs = []
+    for path in paths:
+        for equiv in sorted(glob.glob(os.path.join(path, '**', 'equiv.ys'), recursive=True)):
+            test_dir = os.path.dirname(equiv)
+            for device_dir in sorted(glob.glob(os.path.join(test_dir, 'LC*'))):
+                job = (os.path.basename(test_dir), os.path.basename(device_dir))
+                if not patterns or any(fnmatch.fnmatch('/'.join(job), pattern) for pattern in patterns):
+                    jobs.append((test_dir, job[1]))
+    return jobs
+
+def job_name(job):
+    test_dir, device = job
+    return f'{os.path.basename(test_dir)}/{device}'
+
+def core_file(device):
+    return os.path.join(gen_dir, f'{device.lower()}_core.vhd')
+
+def hash_files(files):
+    digest = hashlib.sha256()
+    for filename in files:
+        digest.update(os.path.relpath(filename, root_dir).encode())
+        try:
+            with open(filename, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except FileNotFoundError:
+            digest.update(b'missing')
+    return digest.hexdigest()
+
+def job_key(job):
+    '''Content hash of everything a job's result depends on.'''
+    test_dir, device = job
+    device_dir = os.path.join(test_dir, device)
+    files  = [core_file(device)]
+    files += sorted(glob.glob(os.path.join(rtl_dir, '*.vhd')))
+    files += sorted(glob.glob(os.path.join(device_dir, 'rtl', '*')))
+    files += sorted(glob.glob(os.path.join(device_dir, 'cpld', '*')))
+    files += [os.path.join(test_dir, 'equiv.ys')]
+    return hash_files(files)
+
+def run_job(job):
+    '''Returns (passed, seconds).'''
+    test_dir, device = job
+    work_dir = os.path.join(test_dir, device, 'yosys')
+    os.makedirs(work_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    with open(os.path.join(work_dir, 'equiv.log'), 'w') as log:
+        result = subprocess.run(yosys_cmd, cwd=work_dir, stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode == 0, time.perf_counter() - start
+
+def load_cache(filename):
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(filename, cache):
+    with open(filename + '.tmp', 'w') as f:
+        json.dump(cache, f, indent=1, sort_keys=True)
+    os.replace(filename + '.tmp', filename)
+
+#--------------------------------------------------------------------
+# Public - Main
+#--------------------------------------------------------------------
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser(description='Run the equivalence tests in parallel with cached results.')
+    parser.add_argument('tests', nargs='*', default=[tests_dir], help='test directories, all of tests/ by default')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help='number of parallel jobs')
+    parser.add_argument('-f', '--force', action='store_true', help='ignore cached results')
+    parser.add_argument('-k', '--select', action='append', metavar='PATTERN',
+                        help='only run <test>/<device> matching the pattern, e.g. "oe/*"')
+    parser.add_argument('--cache', default=os.path.join(tests_dir, '.equiv_cache.json'), help='cache file')
+    parser.add_argument('--no-gen', action='store_true', help='don\'t regenerate the cores in src/gen')
+    args = parser.parse_args()
+
+    jobs = find_jobs(args.tests, args.select)
+    if not jobs:
+        sys.exit('no tests found')
+
+    t_start = time.perf_counter()
+
+    # generate the cores once for all devices
+    devices = sorted({device for test_dir, device in jobs})
+    if not args.no_gen:
+        result = subprocess.run(['make', '-j', str(args.jobs)] + devices, cwd=gen_dir)
+        if result.returncode != 0:
+            sys.exit('core generation failed')
+
+    cache = {} if args.force else load_cache(args.cache)
+    keys = {job: job_key(job) for job in jobs}
+    todo = [job for job in jobs if cache.get(job_name(job), {}).get('key') != keys[job]]
+
+    results = {}
+    for job in jobs:
+        if job not in todo:
+            results[job] = ('cached', cache[job_name(job)]['seconds'])
+
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        for job, (passed, seconds) in zip(todo, pool.map(run_job, todo)):
+            results[job] = ('pass' if passed else 'fail', seconds)
+            if passed:
+                cache[job_name(job)] = {'key': keys[job], 'seconds': round(seconds, 3)}
+            else:
+                cache.pop(job_name(job), None)
+            print(f"{results[job][0].upper():<6s}  {job_name(job)}", flush=True)
+
+    save_cache(args.cache, cache)
+
+    # timing report, slowest first
+    print()
+    print(f"{'test':<40s} {'status':<6s} {'seconds':>8s}")
+    for job, (status, seconds) in sorted(results.items(), key=lambda item: -item[1][1]):
+        print(f'{job_name(job):<40s} {status:<6s} {seconds:8.2f}')
+
+    failed = [job for job in jobs if results[job][0] == 'fail']
+    print(f'{len(jobs)} tests, {len(todo)} run, {len(jobs) - len(todo)} cached, {len(failed)} failed '
+          f'in {time.perf_counter() - t_start:.2f}s', file=sys.stderr)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,692 @@
+-- ----------------------------------------------------------------------------
+--
+-- LC4K Core
+--
+-- Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+--
+-- ----------------------------------------------------------------------------
+--
+-- Components of the core with the fusemap as input port, see
+-- gen_lc4k_core.py --fusemap-port. They are the counterparts of
+-- lc4k_components with the configuration generics turned into ports, so
+-- the structure is fixed and the configuration is plain data.
+--
+-- As there's no static configuration to initialize the registers from,
+-- macrocells take their power up value while i_por is '1'.
+--
+-- ----------------------------------------------------------------------------
+
+-------------------------------------------------------------------------------
+-- IO Cell
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_io_cell is
+  port (
+    i_io_cell : in  io_cell_r;
+    --
+    i_pin     : in  std_logic;
+    o_pin     : out std_logic;
+    o_pin_oe  : out std_logic;
+    --
+    i_orm     : in  std_logic;
+    i_orm_oe  : in  std_logic;
+    i_goe     : in  std_logic_vector(0 to 3);
+    o_mc_grp  : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_io_cell is
+
+  signal oe : std_logic;
+
+begin
+
+  -- fused output enable multiplexer
+  with i_io_cell.oe_source select
+    oe <= i_goe(0)     when "000",
+          i_goe(1)     when "100",
+          i_goe(2)     when "010",
+          i_goe(3)     when "110",
+          i_orm_oe     when "001",
+          not i_orm_oe when "101",
+          '1'          when "011",
+          '0'          when others;
+
+  pp_od_p : process (i_io_cell, i_orm, oe)
+  begin
+    if i_io_cell.drive_type = '1' then
+      -- push pull
+      o_pin    <= i_orm;
+      o_pin_oe <= oe;
+    else
+      -- open drain
+      o_pin    <= '0';
+      o_pin_oe <= not i_orm;
+    end if;
+  end process;
+
+  o_mc_grp <= i_pin;
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- ZE IO Cell
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_ze_io_cell is
+  port (
+    i_bus_maintenance : in  fv_t(0 to 1);
+    i_io_cell         : in  io_cell_r;
+    i_pgdf            : in  f_t;
+    --
+    i_pin    : in  std_logic;
+    o_pin    : out std_logic;
+    o_pin_oe : out std_logic;
+    o_pin_pu : out std_logic;
+    o_pin_pd : out std_logic;
+    o_pin_kp : out std_logic;
+    --
+    i_orm    : in  std_logic;
+    i_orm_oe : in  std_logic;
+    i_goe    : in  std_logic_vector(0 to 3);
+    i_bie    : in  std_logic;
+    o_mc_grp : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_ze_io_cell is
+
+  signal in_latch : std_logic;
+
+begin
+
+  process (i_pin, i_bie, i_pgdf)
+  begin
+    if (i_bie or i_pgdf) = '1' then
+      in_latch <= i_pin;
+    end if;
+  end process;
+
+  std_io_b : entity work.lc4k_cfg_io_cell
+    port map (
+      i_io_cell => i_io_cell,
+      --
+      i_pin    => in_latch,
+      o_pin    => o_pin,
+      o_pin_oe => o_pin_oe,
+      --
+      i_orm    => i_orm,
+      i_orm_oe => i_orm_oe,
+      i_goe    => i_goe,
+      o_mc_grp => o_mc_grp
+    );
+
+  o_pin_pu <= '1' when i_bus_maintenance = "00" else '0';
+  o_pin_pd <= '1' when i_bus_maintenance = "11" else '0';
+  o_pin_kp <= '1' when i_bus_maintenance = "10" else '0';
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- IN Cell
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_in_cell is
+  port (
+    i_input_threshold : in  f_t;
+    --
+    i_pin    : in  std_logic;
+    --
+    o_mc_grp : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_in_cell is
+
+begin
+
+  o_mc_grp <= i_pin;
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- ZE IN Cell
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_ze_in_cell is
+  port (
+    i_bus_maintenance : in  fv_t(0 to 1);
+    i_input_threshold : in  f_t;
+    i_pgdf            : in  f_t;
+    --
+    i_pin    : in  std_logic;
+    o_pin_pu : out std_logic;
+    o_pin_pd : out std_logic;
+    o_pin_kp : out std_logic;
+    --
+    i_bie    : in  std_logic;
+    o_mc_grp : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_ze_in_cell is
+
+  signal in_latch : std_logic;
+
+begin
+
+  process (i_pin, i_bie, i_pgdf)
+  begin
+    if (i_bie or i_pgdf) = '1' then
+      in_latch <= i_pin;
+    end if;
+  end process;
+
+  o_mc_grp <= in_latch;
+
+  o_pin_pu <= '1' when i_bus_maintenance = "00" else '0';
+  o_pin_pd <= '1' when i_bus_maintenance = "11" else '0';
+  o_pin_kp <= '1' when i_bus_maintenance = "10" else '0';
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- Macrocell
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_macrocell is
+  port (
+    i_config          : in  macrocell_r;
+    i_zht             : in  f_t;
+    i_por             : in  std_logic;  -- Power up value while '1'
+    --
+    i_shared_pt_init  : in  std_logic;
+    i_io_cell         : in  std_logic;
+    i_logic_alloc     : in  std_logic;
+    i_bclk0           : in  std_logic;
+    i_bclk1           : in  std_logic;
+    i_bclk2           : in  std_logic;
+    i_bclk3           : in  std_logic;
+    i_pt0             : in  std_logic;  -- Single PT for XOR/OR
+    i_pt1             : in  std_logic;  -- Individual Clock (PT Clock)
+    i_pt2             : in  std_logic;  -- Individual Initialization or Individual Clock Enable (PT Initialization/CE)
+    i_pt3             : in  std_logic;  -- Individual Initialization (PT Initialization)
+    i_shared_pt_clock : in  std_logic;
+    o_to_orp_grp      : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_macrocell is
+
+  signal reset, preset : std_logic;
+  signal por_init, async_init : std_logic;
+  signal shared_init : std_logic;
+  --
+  signal din : std_logic;
+  signal clk : std_logic;
+  signal ce  : std_logic;
+  signal ff, latch : std_logic;
+
+begin
+
+  -- build preset and reset, the power up value is the inverse of
+  -- init_state and so set through the shared init
+  shared_init <= i_shared_pt_init when i_config.init_source = '1' else i_pt3;
+  por_init    <= i_por or shared_init;
+  --
+  async_init <= i_pt2 when i_config.async_source = '0' else '0';
+  --
+  preset <= por_init when i_config.init_state = '0' else async_init;
+  reset  <= por_init when i_config.init_state = '1' else async_init;
+
+  -- build din
+  process (i_config, i_io_cell, i_logic_alloc, i_pt0)
+    variable delay_mux_v : std_logic;
+    variable din_xor_v   : std_logic;
+    variable single_pt_v : std_logic;
+  begin
+    delay_mux_v := i_io_cell;           -- ignored zero hold time setting
+    single_pt_v := i_pt0 xor i_config.invert;
+    din_xor_v   := i_logic_alloc xor single_pt_v;
+    if i_config.input_bypass = '0' then
+      din       <= delay_mux_v;
+    else
+      din       <= din_xor_v;
+    end if;
+  end process;
+
+  -- build clock enable
+  with i_config.clock_enable_source select ce <=
+    i_shared_pt_clock when "00",
+    not i_pt2         when "10",
+    i_pt2             when "01",
+    '1'               when others;
+
+  -- build clock
+  with i_config.clock_source select clk <=
+    i_bclk0           when "000",
+    i_bclk1           when "100",
+    i_bclk2           when "010",
+    i_bclk3           when "110",
+    i_pt1             when "001",
+    not i_pt1         when "101",
+    i_shared_pt_clock when "011",
+    '0'               when others;
+
+  -- macrocell function, both register types and the output selected by
+  -- the configuration
+  latch_p : process (preset, reset, clk, ce, din)
+  begin
+    if reset = '1' then
+      latch <= '0';
+    elsif preset = '1' then
+      latch <= '1';
+    elsif (clk and ce) = '1' then
+      latch <= din;
+    end if;
+  end process;
+  --
+  ff_p : process (preset, reset, clk)
+  begin
+    if reset = '1' then
+      ff <= '0';
+    elsif preset = '1' then
+      ff <= '1';
+    elsif rising_edge(clk) then
+      if ce = '1' then
+        if i_config.macrocell_function = "01" then
+          -- tff
+          if din = '1' then
+            ff <= not ff;
+          end if;
+        else
+          ff <= din;
+        end if;
+      end if;
+    end if;
+  end process;
+  --
+  with i_config.macrocell_function select o_to_orp_grp <=
+    din   when "00",
+    latch when "10",
+    ff    when others;
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- Enhanced Logic Allocator
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_ela is
+  port (
+    i_config  : in  ela_r;
+    --
+    i_cluster : in  std_logic_vector(0 to 4);
+    o_to_m2   : out std_logic;
+    o_to_m1   : out std_logic;
+    o_to_p1   : out std_logic;
+    i_from_m4 : in  std_logic;
+    i_from_m1 : in  std_logic;
+    i_from_p2 : in  std_logic;
+    i_from_p1 : in  std_logic;
+    o_to_p4   : out std_logic;
+    o_5pt     : out std_logic;
+    o_mc      : out std_logic;
+    o_pt      : out std_logic_vector(0 to 4)
+  );
+end;
+
+architecture rtl of lc4k_cfg_ela is
+
+  signal cluster : std_logic_vector(i_cluster'range);
+  signal sum, self, ca : std_logic;
+
+begin
+
+  -----------------------------------------------------------------------------
+  -- Determine which product terms are used for the OR
+  --
+  process (i_config, i_cluster)
+  begin
+    -- PT0 used for XOR in macrocell?
+    if i_config.pt0_xor = '0' then
+      cluster(0) <= '0';
+      o_pt(0)    <= i_cluster(0);
+    else
+      cluster(0) <= i_cluster(0);
+      o_pt(0)    <= '0';
+    end if;
+    -- PT1 used as clock in macrocell?
+    if i_config.clock_source(1 to 2) = "01" then
+      cluster(1) <= '0';
+      o_pt(1)    <= i_cluster(1);
+    else
+      cluster(1) <= i_cluster(1);
+      o_pt(1)    <= '0';
+    end if;
+    -- PT2 used as clock enable source or as async source?
+    if i_config.clock_enable_source(1) = '0' or i_config.async_source = '0' then
+      cluster(2) <= '0';
+      o_pt(2)    <= i_cluster(2);
+    else
+      cluster(2) <= i_cluster(2);
+      o_pt(2)    <= '0';
+    end if;
+    -- PT3 used as init source?
+    if i_config.init_source = '0' then
+      cluster(3) <= '0';
+      o_pt(3)    <= i_cluster(3);
+    else
+      cluster(3) <= i_cluster(3);
+      o_pt(3)    <= '0';
+    end if;
+    -- PT4 used as output enable?
+    if i_config.pt4_output_enable = '0' then
+      cluster(4) <= '0';
+      o_pt(4)    <= i_cluster(4);
+    else
+      cluster(4) <= i_cluster(4);
+      o_pt(4)    <= '0';
+    end if;
+  end process;
+  --
+  sum   <= cluster(0) or cluster(1) or cluster(2) or cluster(3) or cluster(4);
+  o_5pt <= sum;
+
+  -----------------------------------------------------------------------------
+  -- Cluster allocator
+  --
+  o_to_m2 <= sum when i_config.cluster_routing = "00" else '0';
+  self    <= sum when i_config.cluster_routing = "10" else '0';
+  o_to_p1 <= sum when i_config.cluster_routing = "01" else '0';
+  o_to_m1 <= sum when i_config.cluster_routing = "11" else '0';
+  --
+  ca <= i_from_m4 or i_from_m1 or self or i_from_p2 or i_from_p1;
+
+  -----------------------------------------------------------------------------
+  -- Wide routing
+  --
+  o_mc    <= ca when i_config.wide_routing = '1' else '0';
+  o_to_p4 <= ca when i_config.wide_routing = '0' else '0';
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- Generic Logic Block
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_glb is
+  port (
+    i_config : in  glb_r;
+    i_pts    : in  pterms_t;
+    i_mcs    : in  macrocells_t;
+    i_elas   : in  elas_t;
+    i_zht    : in  f_t;
+    i_por    : in  std_logic;
+    --
+    i_clk0  : in  std_logic;
+    i_clk1  : in  std_logic;
+    i_clk2  : in  std_logic;
+    i_clk3  : in  std_logic;
+    i_grp   : in  std_logic_vector(0 to num_gis-1);
+    i_ios   : in  std_logic_vector(0 to num_mcs-1);
+    o_mcs   : out std_logic_vector(0 to num_mcs-1);
+    o_5pts  : out std_logic_vector(0 to num_mcs-1);
+    o_ptoes : out std_logic_vector(0 to num_mcs-1);
+    o_shared_ptoe : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_glb is
+
+  signal bclk0, bclk1, bclk2, bclk3 : std_logic;
+
+  signal shared_pt_init, shared_pt_clock : std_logic;
+
+  signal pterms : std_logic_vector(0 to num_pts-1);
+
+  type ela_conn_r is record
+    to_m1, to_m2  : std_logic;
+    to_p1, to_p4  : std_logic;
+    from_m4       : std_logic;
+    to_mc         : std_logic;
+    pt            : std_logic_vector(0 to 4);
+  end record;
+  constant ela_conn_z : ela_conn_r := ('0', '0', '0', '0', '0', '0', (others => '0'));
+  type ela_conns_t is array (integer range -1 to num_mcs+1) of ela_conn_r;
+  signal ela_conns : ela_conns_t;
+
+begin
+
+  -----------------------------------------------------------------------------
+  -- GLB Clock Generator
+  --
+  bclk0 <= i_clk0 when i_config.bclk01_polarity(0) = '1' else not i_clk1;
+  bclk1 <= i_clk1 when i_config.bclk01_polarity(1) = '1' else not i_clk0;
+  bclk2 <= i_clk2 when i_config.bclk23_polarity(0) = '1' else not i_clk3;
+  bclk3 <= i_clk3 when i_config.bclk23_polarity(1) = '1' else not i_clk2;
+
+
+  -----------------------------------------------------------------------------
+  -- Product Terms
+  --
+  process (i_pts, i_grp)
+    variable pt_v : std_logic;
+  begin
+    for pt in 0 to num_pts-1 loop
+      pt_v := '1';
+      for gi in 0 to num_gis-1 loop
+        pt_v :=     pt_v
+                and (    i_grp(gi) or i_pts(pt).normal(gi))
+                and (not i_grp(gi) or i_pts(pt).invert(gi));
+      end loop;
+
+      pterms(pt) <= pt_v;
+    end loop;
+  end process;
+  --
+  shared_pt_clock <= pterms(80) when i_config.shared_pt_clk_polarity  = '1' else not pterms(80);
+  shared_pt_init  <= pterms(81) when i_config.shared_pt_init_polarity = '1' else not pterms(81);
+  o_shared_ptoe   <= pterms(82);
+
+
+  -----------------------------------------------------------------------------
+  -- Enhanced Logic Allocators
+  --
+  -- initialize unused ela connections
+  ela_conns(-1)         <= ela_conn_z;
+  ela_conns(num_mcs)    <= ela_conn_z;
+  ela_conns(num_mcs+1)  <= ela_conn_z;
+  --
+  slice_gen : for idx in 0 to num_mcs-1 generate
+    ela_b : entity work.lc4k_cfg_ela
+      port map (
+        i_config  => i_elas(idx),
+        --
+        i_cluster => pterms(idx*5 to idx*5+4),
+        o_to_m2   => ela_conns(idx).to_m2,
+        o_to_m1   => ela_conns(idx).to_m1,
+        o_to_p1   => ela_conns(idx).to_p1,
+        i_from_m4 => ela_conns(idx).from_m4,
+        i_from_m1 => ela_conns(idx-1).to_p1,
+        i_from_p2 => ela_conns(idx+2).to_m2,
+        i_from_p1 => ela_conns(idx+1).to_m1,
+        o_to_p4   => ela_conns(idx).to_p4,
+        o_5pt     => o_5pts(idx),
+        o_mc      => ela_conns(idx).to_mc,
+        o_pt      => ela_conns(idx).pt
+      );
+    -- wire up wide routing
+    ela_conns((idx + 4) mod num_mcs).from_m4 <= ela_conns(idx).to_p4;
+    -- provide individual PT OEs
+    o_ptoes(idx) <= ela_conns(idx).pt(4);
+
+    macrocell_b : entity work.lc4k_cfg_macrocell
+      port map (
+        i_config          => i_mcs(idx),
+        i_zht             => i_zht,
+        i_por             => i_por,
+        --
+        i_shared_pt_init  => shared_pt_init,
+        i_io_cell         => i_ios(idx),
+        i_logic_alloc     => ela_conns(idx).to_mc,
+        i_bclk0           => bclk0,
+        i_bclk1           => bclk1,
+        i_bclk2           => bclk2,
+        i_bclk3           => bclk3,
+        i_pt0             => ela_conns(idx).pt(0),
+        i_pt1             => ela_conns(idx).pt(1),
+        i_pt2             => ela_conns(idx).pt(2),
+        i_pt3             => ela_conns(idx).pt(3),
+        i_shared_pt_clock => shared_pt_clock,
+        o_to_orp_grp      => o_mcs(idx)
+      );
+
+  end generate;
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- On-Chip Oscillator and Timer
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_osctimer is
+  port (
+    i_config    : in  osctimer_r;
+    --
+    i_oscclk    : in  std_logic;
+    i_dynoscdis : in  std_logic;
+    i_timerres  : in  std_logic;
+    o_oscout    : out std_logic;
+    o_timerout  : out std_logic
+  );
+end;
+
+architecture rtl of lc4k_cfg_osctimer is
+
+  signal timer    : unsigned(19 downto 0);
+  signal timerout : std_logic;
+  signal reload   : unsigned(timer'range);
+
+begin
+
+  o_oscout <= i_oscclk;
+
+  reload <= ( 6 => i_config.timer_div(0) nand i_config.timer_div(1),
+              9 => i_config.timer_div(1),
+             19 => i_config.timer_div(0),
+             others => '0');
+
+  timer_p : process (i_dynoscdis, i_timerres, i_oscclk)
+  begin
+    if i_dynoscdis = '1' or i_timerres = '1' then
+      timer    <= reload-1;
+      timerout <= '0';
+
+    elsif rising_edge(i_oscclk) then
+      if timer > 0 then
+        timer <= timer - 1;
+      else
+        timer    <= reload-1;
+        timerout <= not timerout;
+      end if;
+    end if;
+  end process;
+  --
+  o_timerout <= timerout;
+
+end;
+
+
+-------------------------------------------------------------------------------
+-- Global Routing Pool of a GLB
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_cfg_grp is
+  generic (
+    g_num_columns : natural;
+    g_mux_size    : natural;
+    -- g_mux_size inputs per GI, num_gis * g_mux_size in total
+    g_muxes       : grp_muxes_t
+  );
+  port (
+    i_fusemap : in  std_logic_vector;
+    --
+    i_sources : in  std_logic_vector;
+    o_grp     : out std_logic_vector(0 to num_gis-1)
+  );
+end;
+
+architecture rtl of lc4k_cfg_grp is
+
+  alias fusemap : std_logic_vector(0 to i_fusemap'length-1) is i_fusemap;
+  alias muxes   : grp_muxes_t(0 to g_muxes'length-1) is g_muxes;
+  alias sources : std_logic_vector(0 to i_sources'length-1) is i_sources;
+
+begin
+
+  -----------------------------------------------------------------------------
+  -- GI muxes, a source is routed to the GI when its fuse is '0'
+  --
+  gi_gen : for gi in 0 to num_gis-1 generate
+    process (fusemap, sources)
+      variable gi_v : std_logic;
+    begin
+      gi_v := '1';
+      for idx in gi*g_mux_size to (gi+1)*g_mux_size-1 loop
+        if muxes(idx).source >= 0 then
+          gi_v :=     gi_v
+                  and (    fusemap(muxes(idx).row * g_num_columns + muxes(idx).column)
+                       or sources(muxes(idx).source));
+        end if;
+      end loop;
+
+      o_grp(gi) <= gi_v;
+    end process;
+  end generate;
+
+end;
@@ -0,0 +1,599 @@
+// ----------------------------------------------------------------------------
+//
+// LC4K Core
+//
+// Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+//
+// ----------------------------------------------------------------------------
+//
+// Verilog counterparts of lc4k_components.vhd for the cores generated with
+// gen_lc4k_core.py --verilog.
+//
+// Verilog has no records, the configuration parameters are the fields of
+// the lc4k_pack records concatenated in declaration order. Vectors are
+// ascending like fv_t, the first field starts at bit 0.
+//
+
+// ----------------------------------------------------------------------------
+// IO Cell
+// ----------------------------------------------------------------------------
+module lc4k_io_cell #(
+  // oe_source[0:2], drive_type, slew_rate, input_threshold
+  parameter [0:5] g_io_cell = 6'b111111
+) (
+  input        i_pin,
+  output       o_pin,
+  output       o_pin_oe,
+  //
+  input        i_orm,
+  input        i_orm_oe,
+  input  [0:3] i_goe,
+  output       o_mc_grp
+);
+
+  localparam [0:2] oe_source  = g_io_cell[0:2];
+  localparam       drive_type = g_io_cell[3];
+
+  reg oe;
+
+  // fused output enable multiplexer
+  always @(*)
+    case (oe_source)
+      3'b000  : oe = i_goe[0];
+      3'b100  : oe = i_goe[1];
+      3'b010  : oe = i_goe[2];
+      3'b110  : oe = i_goe[3];
+      3'b001  : oe = i_orm_oe;
+      3'b101  : oe = ~i_orm_oe;
+      3'b011  : oe = 1'b1;
+      default : oe = 1'b0;
+    endcase
+
+  // push pull or open drain
+  assign o_pin    = drive_type ? i_orm : 1'b0;
+  assign o_pin_oe = drive_type ? oe    : ~i_orm;
+
+  assign o_mc_grp = i_pin;
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// ZE IO Cell
+// ----------------------------------------------------------------------------
+module lc4k_ze_io_cell #(
+  parameter [0:1] g_bus_maintenance = 2'b11,
+  parameter [0:5] g_io_cell         = 6'b111111,
+  parameter       g_pgdf            = 1'b1
+) (
+  input        i_pin,
+  output       o_pin,
+  output       o_pin_oe,
+  output       o_pin_pu,
+  output       o_pin_pd,
+  output       o_pin_kp,
+  //
+  input        i_orm,
+  input        i_orm_oe,
+  input  [0:3] i_goe,
+  input        i_bie,
+  output       o_mc_grp
+);
+
+  reg in_latch;
+
+  always @(*)
+    if (i_bie | g_pgdf)
+      in_latch = i_pin;
+
+  lc4k_io_cell #(
+    .g_io_cell (g_io_cell)
+  ) std_io_b (
+    .i_pin    (in_latch),
+    .o_pin    (o_pin),
+    .o_pin_oe (o_pin_oe),
+    //
+    .i_orm    (i_orm),
+    .i_orm_oe (i_orm_oe),
+    .i_goe    (i_goe),
+    .o_mc_grp (o_mc_grp)
+  );
+
+  assign o_pin_pu = g_bus_maintenance == 2'b00;
+  assign o_pin_pd = g_bus_maintenance == 2'b11;
+  assign o_pin_kp = g_bus_maintenance == 2'b10;
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// IN Cell
+// ----------------------------------------------------------------------------
+module lc4k_in_cell #(
+  parameter g_input_threshold = 1'b1
+) (
+  input  i_pin,
+  //
+  output o_mc_grp
+);
+
+  assign o_mc_grp = i_pin;
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// ZE IN Cell
+// ----------------------------------------------------------------------------
+module lc4k_ze_in_cell #(
+  parameter [0:1] g_bus_maintenance = 2'b11,
+  parameter       g_input_threshold = 1'b1,
+  parameter       g_pgdf            = 1'b1
+) (
+  input  i_pin,
+  output o_pin_pu,
+  output o_pin_pd,
+  output o_pin_kp,
+  //
+  input  i_bie,
+  output o_mc_grp
+);
+
+  reg in_latch;
+
+  always @(*)
+    if (i_bie | g_pgdf)
+      in_latch = i_pin;
+
+  lc4k_in_cell #(
+    .g_input_threshold (g_input_threshold)
+  ) std_in_b (
+    .i_pin    (in_latch),
+    .o_mc_grp (o_mc_grp)
+  );
+
+  assign o_pin_pu = g_bus_maintenance == 2'b00;
+  assign o_pin_pd = g_bus_maintenance == 2'b11;
+  assign o_pin_kp = g_bus_maintenance == 2'b10;
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// Macrocell
+// ----------------------------------------------------------------------------
+module lc4k_macrocell #(
+  // init_state, init_source, async_source, input_bypass, invert,
+  // clock_enable_source[0:1], clock_source[0:2], macrocell_function[0:1]
+  parameter [0:11] g_config = 12'b111111111111,
+  parameter        g_zht    = 1'b1
+) (
+  input  i_shared_pt_init,
+  input  i_io_cell,
+  input  i_logic_alloc,
+  input  i_bclk0,
+  input  i_bclk1,
+  input  i_bclk2,
+  input  i_bclk3,
+  input  i_pt0,               // Single PT for XOR/OR
+  input  i_pt1,               // Individual Clock (PT Clock)
+  input  i_pt2,               // Individual Initialization or Individual Clock Enable (PT Initialization/CE)
+  input  i_pt3,               // Individual Initialization (PT Initialization)
+  input  i_shared_pt_clock,
+  output o_to_orp_grp
+);
+
+  localparam       init_state          = g_config[0];
+  localparam       init_source         = g_config[1];
+  localparam       async_source        = g_config[2];
+  localparam       input_bypass        = g_config[3];
+  localparam       invert              = g_config[4];
+  localparam [0:1] clock_enable_source = g_config[5:6];
+  localparam [0:2] clock_source        = g_config[7:9];
+  localparam [0:1] macrocell_function  = g_config[10:11];
+
+  wire reset, preset;
+  wire por_init, async_init;
+  wire shared_init;
+  //
+  wire din;
+  reg  clk;
+  reg  ce;
+
+  // build preset and reset
+  assign shared_init = init_source ? i_shared_pt_init : i_pt3;
+  assign por_init    = 1'b0 ^ shared_init;  // TODO: inject POR
+  //
+  assign async_init = async_source ? 1'b0 : i_pt2;
+  //
+  assign preset = init_state ? async_init : por_init;
+  assign reset  = init_state ? por_init   : async_init;
+
+  // build din, ignored zero hold time setting
+  assign din = input_bypass ? i_logic_alloc ^ (i_pt0 ^ invert) : i_io_cell;
+
+  // build clock enable
+  always @(*)
+    case (clock_enable_source)
+      2'b00   : ce = i_shared_pt_clock;
+      2'b10   : ce = ~i_pt2;
+      2'b01   : ce = i_pt2;
+      default : ce = 1'b1;
+    endcase
+
+  // build clock
+  always @(*)
+    case (clock_source)
+      3'b000  : clk = i_bclk0;
+      3'b100  : clk = i_bclk1;
+      3'b010  : clk = i_bclk2;
+      3'b110  : clk = i_bclk3;
+      3'b001  : clk = i_pt1;
+      3'b101  : clk = ~i_pt1;
+      3'b011  : clk = i_shared_pt_clock;
+      default : clk = 1'b0;
+    endcase
+
+  // macrocell function
+  generate
+    if (macrocell_function == 2'b00) begin : comb
+      assign o_to_orp_grp = din;
+    end
+    //
+    else if (macrocell_function == 2'b10) begin : latch
+      reg q = ~init_state;
+
+      always @(*)
+        if (reset)
+          q = 1'b0;
+        else if (preset)
+          q = 1'b1;
+        else if (clk & ce)
+          q = din;
+
+      assign o_to_orp_grp = q;
+    end
+    //
+    else if (macrocell_function == 2'b01) begin : tff
+      reg q = ~init_state;
+
+      always @(posedge clk or posedge reset or posedge preset)
+        if (reset)
+          q <= 1'b0;
+        else if (preset)
+          q <= 1'b1;
+        else if (ce & din)
+          q <= ~q;
+
+      assign o_to_orp_grp = q;
+    end
+    //
+    else begin : dff
+      reg q = ~init_state;
+
+      always @(posedge clk or posedge reset or posedge preset)
+        if (reset)
+          q <= 1'b0;
+        else if (preset)
+          q <= 1'b1;
+        else if (ce)
+          q <= din;
+
+      assign o_to_orp_grp = q;
+    end
+  endgenerate
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// Enhanced Logic Allocator
+// ----------------------------------------------------------------------------
+module lc4k_ela #(
+  // cluster_routing[0:1], wide_routing, pt0_xor, clock_source[0:2],
+  // clock_enable_source[0:1], async_source, init_source, pt4_output_enable
+  parameter [0:11] g_config = 12'b111111111111
+) (
+  input  [0:4] i_cluster,
+  output       o_to_m2,
+  output       o_to_m1,
+  output       o_to_p1,
+  input        i_from_m4,
+  input        i_from_m1,
+  input        i_from_p2,
+  input        i_from_p1,
+  output       o_to_p4,
+  output       o_5pt,
+  output       o_mc,
+  output [0:4] o_pt
+);
+
+  localparam [0:1] cluster_routing     = g_config[0:1];
+  localparam       wide_routing        = g_config[2];
+  localparam       pt0_xor             = g_config[3];
+  localparam [0:2] clock_source        = g_config[4:6];
+  localparam [0:1] clock_enable_source = g_config[7:8];
+  localparam       async_source        = g_config[9];
+  localparam       init_source         = g_config[10];
+  localparam       pt4_output_enable   = g_config[11];
+
+  // PTs that the macrocell uses are removed from the OR:
+  // PT0 for XOR, PT1 as clock, PT2 as clock enable or async source,
+  // PT3 as init source and PT4 as output enable
+  localparam [0:4] macrocell_pts = {
+    ~pt0_xor,
+    clock_source[1:2] == 2'b01,
+    ~clock_enable_source[1] | ~async_source,
+    ~init_source,
+    ~pt4_output_enable
+  };
+
+  wire [0:4] cluster;
+  wire       sum, to_self, ca;
+
+  // ---------------------------------------------------------------------------
+  // Determine which product terms are used for the OR
+  //
+  assign cluster = i_cluster & ~macrocell_pts;
+  assign o_pt    = i_cluster &  macrocell_pts;
+  //
+  assign sum   = |cluster;
+  assign o_5pt = sum;
+
+  // ---------------------------------------------------------------------------
+  // Cluster allocator
+  //
+  assign o_to_m2 = cluster_routing == 2'b00 ? sum : 1'b0;
+  assign to_self = cluster_routing == 2'b10 ? sum : 1'b0;
+  assign o_to_p1 = cluster_routing == 2'b01 ? sum : 1'b0;
+  assign o_to_m1 = cluster_routing == 2'b11 ? sum : 1'b0;
+  //
+  assign ca = i_from_m4 | i_from_m1 | to_self | i_from_p2 | i_from_p1;
+
+  // ---------------------------------------------------------------------------
+  // Wide routing
+  //
+  assign o_mc    = wide_routing ? ca   : 1'b0;
+  assign o_to_p4 = wide_routing ? 1'b0 : ca;
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// Generic Logic Block
+// ----------------------------------------------------------------------------
+module lc4k_glb #(
+  // bclk01_polarity[0:1], bclk23_polarity[0:1], shared_pt_clk_polarity,
+  // shared_pt_init_polarity
+  parameter [0:5] g_config = 6'b111111,
+  // fusemap and the coordinates of the PT fuses like decode_pterms():
+  // normal and inverted row of each GI, column of each PT, 16 bits each
+  parameter integer               g_num_columns  = 1,
+  parameter integer               g_fusemap_size = 1,
+  parameter [0:g_fusemap_size-1]  g_fusemap      = {g_fusemap_size{1'b1}},
+  parameter [0:36*2*16-1]         g_gi_rows      = {36*2*16{1'b0}},
+  parameter [0:83*16-1]           g_pt_columns   = {83*16{1'b0}},
+  // 16 macrocells and ELAs, 12 bits each
+  parameter [0:16*12-1]           g_mcs          = {16*12{1'b1}},
+  parameter [0:16*12-1]           g_elas         = {16*12{1'b1}},
+  parameter                       g_zht          = 1'b1
+) (
+  input         i_clk0,
+  input         i_clk1,
+  input         i_clk2,
+  input         i_clk3,
+  input  [0:35] i_grp,
+  input  [0:15] i_ios,
+  output [0:15] o_mcs,
+  output [0:15] o_5pts,
+  output [0:15] o_ptoes,
+  output        o_shared_ptoe
+);
+
+  localparam num_mcs = 16;
+  localparam num_gis = 36;
+  localparam num_pts = 83;
+
+  localparam [0:1] bclk01_polarity         = g_config[0:1];
+  localparam [0:1] bclk23_polarity         = g_config[2:3];
+  localparam       shared_pt_clk_polarity  = g_config[4];
+  localparam       shared_pt_init_polarity = g_config[5];
+
+  // normal or inverted fuses of a PT's GI inputs
+  function [0:num_gis-1] pt_fuses(input integer pt, input integer inverted);
+    integer gi, row;
+    begin
+      for (gi = 0; gi < num_gis; gi = gi + 1) begin
+        row = g_gi_rows[(gi*2 + inverted)*16 +: 16];
+        pt_fuses[gi] = g_fusemap[row * g_num_columns + g_pt_columns[pt*16 +: 16]];
+      end
+    end
+  endfunction
+
+  wire bclk0, bclk1, bclk2, bclk3;
+
+  wire shared_pt_init, shared_pt_clock;
+
+  wire [0:num_pts-1] pterms;
+
+  // ELA connections, the ends of the chains are unused
+  wire [-1:num_mcs-1]  to_p1;
+  wire [0:num_mcs]     to_m1;
+  wire [0:num_mcs+1]   to_m2;
+  wire [0:num_mcs-1]   to_p4, from_m4, to_mc;
+  wire [0:num_mcs*5-1] pts;
+
+  // ---------------------------------------------------------------------------
+  // GLB Clock Generator
+  //
+  assign bclk0 = bclk01_polarity[0] ? i_clk0 : ~i_clk1;
+  assign bclk1 = bclk01_polarity[1] ? i_clk1 : ~i_clk0;
+  assign bclk2 = bclk23_polarity[0] ? i_clk2 : ~i_clk3;
+  assign bclk3 = bclk23_polarity[1] ? i_clk3 : ~i_clk2;
+
+
+  // ---------------------------------------------------------------------------
+  // Product Terms
+  //
+  genvar pt;
+  generate
+    for (pt = 0; pt < num_pts; pt = pt + 1) begin : pt_gen
+      localparam [0:num_gis-1] normal = pt_fuses(pt, 0);
+      localparam [0:num_gis-1] invert = pt_fuses(pt, 1);
+
+      assign pterms[pt] = &((i_grp | normal) & (~i_grp | invert));
+    end
+  endgenerate
+  //
+  assign shared_pt_clock = shared_pt_clk_polarity  ? pterms[80] : ~pterms[80];
+  assign shared_pt_init  = shared_pt_init_polarity ? pterms[81] : ~pterms[81];
+  assign o_shared_ptoe   = pterms[82];
+
+
+  // ---------------------------------------------------------------------------
+  // Enhanced Logic Allocators
+  //
+  // initialize unused ela connections
+  assign to_p1[-1]        = 1'b0;
+  assign to_m1[num_mcs]   = 1'b0;
+  assign to_m2[num_mcs]   = 1'b0;
+  assign to_m2[num_mcs+1] = 1'b0;
+  //
+  genvar idx;
+  generate
+    for (idx = 0; idx < num_mcs; idx = idx + 1) begin : slice_gen
+      lc4k_ela #(
+        .g_config (g_elas[idx*12 +: 12])
+      ) ela_b (
+        .i_cluster (pterms[idx*5 +: 5]),
+        .o_to_m2   (to_m2[idx]),
+        .o_to_m1   (to_m1[idx]),
+        .o_to_p1   (to_p1[idx]),
+        .i_from_m4 (from_m4[idx]),
+        .i_from_m1 (to_p1[idx-1]),
+        .i_from_p2 (to_m2[idx+2]),
+        .i_from_p1 (to_m1[idx+1]),
+        .o_to_p4   (to_p4[idx]),
+        .o_5pt     (o_5pts[idx]),
+        .o_mc      (to_mc[idx]),
+        .o_pt      (pts[idx*5 +: 5])
+      );
+      // wire up wide routing
+      assign from_m4[(idx + 4) % num_mcs] = to_p4[idx];
+      // provide individual PT OEs
+      assign o_ptoes[idx] = pts[idx*5 + 4];
+
+      lc4k_macrocell #(
+        .g_config (g_mcs[idx*12 +: 12]),
+        .g_zht    (g_zht)
+      ) macrocell_b (
+        .i_shared_pt_init  (shared_pt_init),
+        .i_io_cell         (i_ios[idx]),
+        .i_logic_alloc     (to_mc[idx]),
+        .i_bclk0           (bclk0),
+        .i_bclk1           (bclk1),
+        .i_bclk2           (bclk2),
+        .i_bclk3           (bclk3),
+        .i_pt0             (pts[idx*5 + 0]),
+        .i_pt1             (pts[idx*5 + 1]),
+        .i_pt2             (pts[idx*5 + 2]),
+        .i_pt3             (pts[idx*5 + 3]),
+        .i_shared_pt_clock (shared_pt_clock),
+        .o_to_orp_grp      (o_mcs[idx])
+      );
+    end
+  endgenerate
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// On-Chip Oscillator and Timer
+// ----------------------------------------------------------------------------
+module lc4k_osctimer #(
+  // timer_div[0:1]
+  parameter [0:1] g_config = 2'b11
+) (
+  input  i_oscclk,
+  input  i_dynoscdis,
+  input  i_timerres,
+  output o_oscout,
+  output o_timerout
+);
+
+  localparam [0:1] timer_div = g_config[0:1];
+
+  // bits 19, 9 and 6 like lc4k_osctimer's c_reload
+  localparam [19:0] c_reload = {timer_div[0], 9'b0, timer_div[1], 2'b0,
+                                ~(timer_div[0] & timer_div[1]), 6'b0};
+
+  reg [19:0] timer;
+  reg        timerout;
+
+  wire clear = i_dynoscdis | i_timerres;
+
+  assign o_oscout = i_oscclk;
+
+  always @(posedge i_oscclk or posedge clear)
+    if (clear) begin
+      timer    <= c_reload - 1;
+      timerout <= 1'b0;
+    end
+    else if (timer > 0)
+      timer <= timer - 1;
+    else begin
+      timer    <= c_reload - 1;
+      timerout <= ~timerout;
+    end
+  //
+  assign o_timerout = timerout;
+
+endmodule
+
+
+// ----------------------------------------------------------------------------
+// Global Routing Pool of a GLB
+// ----------------------------------------------------------------------------
+module lc4k_grp #(
+  parameter integer                     g_num_columns  = 1,
+  parameter integer                     g_fusemap_size = 1,
+  parameter [0:g_fusemap_size-1]        g_fusemap      = {g_fusemap_size{1'b1}},
+  parameter integer                     g_mux_size     = 1,
+  parameter integer                     g_num_sources  = 1,
+  // g_mux_size inputs per GI, row, column and source of each input with
+  // 16 bits each, source 16'hffff for an unused input
+  parameter [0:36*g_mux_size*3*16-1]    g_muxes        = {36*g_mux_size*3*16{1'b1}}
+) (
+  input  [0:g_num_sources-1] i_sources,
+  output [0:35]              o_grp
+);
+
+  localparam num_gis = 36;
+
+  // ---------------------------------------------------------------------------
+  // GI muxes, a source is routed to the GI when its fuse is '0'
+  //
+  genvar gi, idx;
+  generate
+    for (gi = 0; gi < num_gis; gi = gi + 1) begin : gi_gen
+      wire [0:g_mux_size-1] inputs;
+
+      for (idx = 0; idx < g_mux_size; idx = idx + 1) begin : mux_gen
+        localparam integer mux    = (gi*g_mux_size + idx) * 3*16;
+        localparam integer row    = g_muxes[mux      +: 16];
+        localparam integer column = g_muxes[mux + 16 +: 16];
+        localparam [15:0]  source = g_muxes[mux + 32 +: 16];
+
+        if (source == 16'hffff) begin : unused
+          assign inputs[idx] = 1'b1;
+        end
+        else begin : used
+          assign inputs[idx] = g_fusemap[row * g_num_columns + column] | i_sources[source];
+        end
+      end
+
+      assign o_grp[gi] = &inputs;
+    end
+  endgenerate
+
+endmodule
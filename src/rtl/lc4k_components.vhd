@@ -757,3 +757,56 @@ begin
   o_timerout <= timerout;
 
 end;
+
+
+-------------------------------------------------------------------------------
+-- Global Routing Pool of a GLB
+-------------------------------------------------------------------------------
+library ieee;
+use ieee.std_logic_1164.all;
+
+use work.lc4k_pack.all;
+
+entity lc4k_grp is
+  generic (
+    g_fusemap     : std_logic_vector;
+    g_num_columns : natural;
+    g_mux_size    : natural;
+    -- g_mux_size inputs per GI, num_gis * g_mux_size in total
+    g_muxes       : grp_muxes_t
+  );
+  port (
+    i_sources : in  std_logic_vector;
+    o_grp     : out std_logic_vector(0 to num_gis-1)
+  );
+end;
+
+architecture rtl of lc4k_grp is
+
+  alias fusemap : std_logic_vector(0 to g_fusemap'length-1) is g_fusemap;
+  alias muxes   : grp_muxes_t(0 to g_muxes'length-1) is g_muxes;
+  alias sources : std_logic_vector(0 to i_sources'length-1) is i_sources;
+
+begin
+
+  -----------------------------------------------------------------------------
+  -- GI muxes, a source is routed to the GI when its fuse is '0'
+  --
+  gi_gen : for gi in 0 to num_gis-1 generate
+    process (sources)
+      variable gi_v : std_logic;
+    begin
+      gi_v := '1';
+      for idx in gi*g_mux_size to (gi+1)*g_mux_size-1 loop
+        if muxes(idx).source >= 0 then
+          gi_v :=     gi_v
+                  and (    fusemap(muxes(idx).row * g_num_columns + muxes(idx).column)
+                       or sources(muxes(idx).source));
+        end if;
+      end loop;
+
+      o_grp(gi) <= gi_v;
+    end process;
+  end generate;
+
+end;
@@ -58,6 +58,17 @@ package lc4k_pack is
   --
   type pterms_t is array (natural range 0 to num_pts-1) of pterm_r;
 
+  -- fusemap rows of the GIs' normal and inverted PT inputs
+  type gi_row_r is record
+    normal : natural;
+    invert : natural;
+  end record;
+  --
+  type gi_rows_t is array (natural range 0 to num_gis-1) of gi_row_r;
+
+  -- fusemap columns of a GLB's PTs
+  type pt_columns_t is array (natural range 0 to num_pts-1) of natural;
+
   type glb_r is record
     bclk01_polarity : fv_t(0 to 1);
     bclk23_polarity : fv_t(0 to 1);
@@ -69,6 +80,27 @@ package lc4k_pack is
     timer_div : fv_t(0 to 1);
   end record;
 
+  -- GRP mux input: coordinates of its fuse and index of the source,
+  -- -1 for an unused input
+  type grp_mux_r is record
+    row    : natural;
+    column : natural;
+    source : integer;
+  end record;
+  --
+  type grp_muxes_t is array (natural range <>) of grp_mux_r;
+
+  -- Dense fusemap of size fuses from the list of indices of '0' fuses,
+  -- separated by spaces or commas. All other fuses are '1'.
+  function decode_fusemap (zeros : string; size : natural) return std_logic_vector;
+
+  -- PT configuration of a GLB from the fusemap, the fuses are at the GI
+  -- rows and the PT columns.
+  function decode_pterms (fusemap     : std_logic_vector;
+                          num_columns : natural;
+                          gi_rows     : gi_rows_t;
+                          pt_columns  : pt_columns_t) return pterms_t;
+
   -- pragma translate_off
   constant c_debug_enabled : boolean := false;
   function to_string (a : std_logic_vector) return string;
@@ -78,6 +110,45 @@ end;
 
 package body lc4k_pack is
 
+  function decode_fusemap (zeros : string; size : natural) return std_logic_vector is
+    variable fusemap : std_logic_vector(0 to size-1) := (others => '1');
+    variable index   : natural := 0;
+    variable in_num  : boolean := false;
+  begin
+    for i in zeros'range loop
+      if zeros(i) >= '0' and zeros(i) <= '9' then
+        index  := index * 10 + character'pos(zeros(i)) - character'pos('0');
+        in_num := true;
+      else
+        if in_num then
+          fusemap(index) := '0';
+        end if;
+        index  := 0;
+        in_num := false;
+      end if;
+    end loop;
+    if in_num then
+      fusemap(index) := '0';
+    end if;
+    return fusemap;
+  end function;
+
+  function decode_pterms (fusemap     : std_logic_vector;
+                          num_columns : natural;
+                          gi_rows     : gi_rows_t;
+                          pt_columns  : pt_columns_t) return pterms_t is
+    alias fm : std_logic_vector(0 to fusemap'length-1) is fusemap;
+    variable pterms : pterms_t;
+  begin
+    for pt in pterms'range loop
+      for gi in gi_rows'range loop
+        pterms(pt).normal(gi) := fm(gi_rows(gi).normal * num_columns + pt_columns(pt));
+        pterms(pt).invert(gi) := fm(gi_rows(gi).invert * num_columns + pt_columns(pt));
+      end loop;
+    end loop;
+    return pterms;
+  end function;
+
   -- pragma translate_off
   function to_string (a : std_logic_vector) return string is
     variable b : string (1 to a'length) := (others => NUL);
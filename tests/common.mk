@@ -1,10 +1,14 @@
 
 SRC_GEN := ../../src/gen
+PYTHON_DIR := ../../python
+RE4K := ../../re4k
 
 ARCHS := $(shell ls -d LC*)
+# equiv_netlist.ys checks the JSON netlist of the test fusemap against the RTL
+NETLIST := $(if $(wildcard equiv_netlist.ys),$(ARCHS),)
 
 .PHONY: all
-all: $(addsuffix .do,$(ARCHS))
+all: $(addsuffix .do,$(ARCHS)) $(addsuffix .netlist,$(NETLIST))
 
 .PHONY: clean
 clean: $(addsuffix .clean,$(ARCHS))
@@ -16,5 +20,11 @@ clean: $(addsuffix .clean,$(ARCHS))
 	@mkdir -p $(@:.do=)/yosys
 	cd $(@:.do=)/yosys && yosys -m ghdl -s ../../equiv.ys
 
+%.netlist: %.do
+	python3 $(PYTHON_DIR)/lc4k_wrapper.py $(wildcard $*/cpld/*_cpld.vhd) $*/yosys/netlist.jed
+	python3 $(PYTHON_DIR)/lc4k_netlist.py -c $(SRC_GEN)/.cache $(shell find $(RE4K) -name $*.sx) $*/yosys/netlist.jed \
+	  -w $(wildcard $*/cpld/*_cpld.vhd) -o $*/yosys/netlist.json
+	cd $*/yosys && yosys -m ghdl -s ../../equiv_netlist.ys
+
 %.clean:
 	rm -rf $(@:.clean=)/yosys
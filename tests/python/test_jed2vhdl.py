@@ -0,0 +1,98 @@
+#
+# jed2vhdl formatting tests
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+
+import os
+import tempfile
+import unittest
+
+import jed2vhdl
+
+
+CORE = '''library ieee;
+use ieee.std_logic_1164.all;
+
+entity lc4032x_tqfp48_core is
+  generic (
+    g_fusemap : std_logic_vector(0 to 17100-1)
+  );
+  port (
+    i_2  : in  std_logic;
+    o_2  : out std_logic;
+    oe_2 : out std_logic
+  );
+end;
+'''
+
+
+class test_vector(unittest.TestCase):
+
+    def test_hex_literal(self):
+        self.assertEqual(jed2vhdl.hex_literal(b'00011111'), b'1F')
+        self.assertEqual(jed2vhdl.hex_literal(b''), b'')
+
+    def test_binary(self):
+        self.assertEqual(jed2vhdl.fusemap_vector(b'0101010101', 4), '"0101" &\n"0101" &\n"01"\n')
+        self.assertEqual(jed2vhdl.fusemap_vector(b'0101010101', 4, bare=True), '0101\n0101\n01\n')
+
+    def test_hex(self):
+        self.assertEqual(jed2vhdl.fusemap_vector(b'0001111110100', 10, hex=True), 'x"1F" &\nx"A" &\n"0"\n')
+        self.assertEqual(jed2vhdl.fusemap_vector(b'00011111', 4, bare=True, hex=True), 'x"1F"\n')
+        with self.assertRaises(ValueError):
+            jed2vhdl.fusemap_vector(b'000111110', 4, bare=True, hex=True)
+
+    def test_zeros(self):
+        self.assertEqual(jed2vhdl.zero_fuses(b'1011001'), [1, 4, 5])
+        self.assertEqual(jed2vhdl.fusemap_zeros(b'1011001', 2), '"1 4 " &\n"5"\n')
+        self.assertEqual(jed2vhdl.fusemap_zeros(b'1011001', 2, bare=True), '1 4 5\n')
+
+
+class test_package(unittest.TestCase):
+
+    def test_design_name(self):
+        self.assertEqual(jed2vhdl.design_name(os.path.join('dir', 'My-Design 2.jed')), 'my_design_2')
+        self.assertEqual(jed2vhdl.design_name('7seg.jed'), 'd_7seg')
+        self.assertEqual(jed2vhdl.fusemap_filename('dir/Top.jed', package=True), 'top_fusemap_pkg.vhd')
+        self.assertEqual(jed2vhdl.wrapper_filename('dir/Top.jed'), 'top_cpld.vhd')
+
+    def test_fusemap_package(self):
+        self.assertEqual(jed2vhdl.fusemap_package(b'000111110', 8, 'top', hex=True),
+                         'library ieee;\n'
+                         'use ieee.std_logic_1164.all;\n'
+                         '\n'
+                         'package top_fusemap_pkg is\n'
+                         '\n'
+                         '  constant c_fusemap : std_logic_vector(0 to 9-1) :=\n'
+                         'x"1F" &\n'
+                         '"0";\n'
+                         '\n'
+                         'end;\n')
+
+    def test_wrapper(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            core_file = os.path.join(tmpdir, 'core.vhd')
+            with open(core_file, 'w') as f:
+                f.write(CORE)
+            core, ports = jed2vhdl.core_ports(core_file)
+
+            with open(core_file, 'w') as f:
+                f.write(CORE.replace('g_fusemap', 'g_fusemap_zeros'))
+            with self.assertRaises(ValueError):
+                jed2vhdl.core_ports(core_file)
+
+        self.assertEqual(core, 'lc4032x_tqfp48_core')
+        self.assertEqual(ports, [('i_2', 'in'), ('o_2', 'out'), ('oe_2', 'out')])
+
+        wrapper = jed2vhdl.fusemap_wrapper(core, ports, 'top')
+        self.assertIn('entity top_cpld is\n', wrapper)
+        self.assertIn('    i_2  : in  std_logic;\n    o_2  : out std_logic;\n    oe_2 : out std_logic\n  );\n', wrapper)
+        self.assertIn('use work.top_fusemap_pkg.all;\n', wrapper)
+        self.assertIn('  core_b : entity work.lc4032x_tqfp48_core\n', wrapper)
+        self.assertIn('      g_fusemap => c_fusemap\n', wrapper)
+        self.assertIn('      oe_2 => oe_2\n    );\n', wrapper)
+
+
+if __name__ == '__main__':
+    unittest.main()
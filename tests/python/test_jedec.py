@@ -0,0 +1,139 @@
+#
+# JEDEC parser tests
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+
+import os
+import tempfile
+import unittest
+
+import jedec
+
+
+def jedec_data(fuses, checksum=None, vectors=()):
+    '''JEDEC file with fuses (str of '0'/'1'), 4 fuses per L field, framed by STX and ETX.'''
+    fields = [f'QF{len(fuses)}*', 'QP4*', 'F0*', 'N design test*']
+    fields += [f'L{start:05d} {fuses[start:start+4]}*' for start in range(0, len(fuses), 4)]
+    if checksum is not None:
+        fields.append(f'C{checksum}*')
+    fields += [f'V{number:04d} {vector}*' for number, vector in enumerate(vectors, 1)]
+    return ('\x02test design*\r\n' + '\r\n'.join(fields) + '\r\n\x030000\r\n').encode('ascii')
+
+
+class test_parse(unittest.TestCase):
+
+    def test_header(self):
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('1010'))
+        self.assertEqual(jed._header_lines, ['test design'])
+        self.assertEqual((jed.number_of_fuses, jed.number_of_pins), (4, 4))
+
+    def test_fuses(self):
+        jed = jedec.Jedec()
+        jed.parse(b'*QF12*F1*L00004 0 1\r\n0 0*')
+        self.assertEqual(jed.fuse_data, '111101001111')
+
+    def test_array(self):
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('110000101111'))
+        self.assertEqual(jed.array(4).tolist(), [[1, 1, 0, 0], [0, 0, 1, 0], [1, 1, 1, 1]])
+        self.assertEqual(jed.view(6)[1, 0], ord('1'))
+        self.assertEqual(jed.view(6)[1, 1], ord('0'))
+
+    def test_fuses_beyond_count(self):
+        jed = jedec.Jedec()
+        with self.assertRaises(ValueError):
+            jed.parse(b'*QF4*F0*L0002 011*')
+
+    def test_invalid_fuses(self):
+        jed = jedec.Jedec()
+        with self.assertRaises(ValueError):
+            jed.parse(b'*QF4*F0*L0000 0x10*')
+
+
+class test_checksum(unittest.TestCase):
+
+    def test_compute(self):
+        # fuse 0 is the LSB of the first byte: 0x01 + 0x03
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('1000000011'))
+        self.assertEqual(jed.compute_checksum(), 0x0004)
+
+        jed.parse(jedec_data('1' * 16))
+        self.assertEqual(jed.compute_checksum(), 0x01FE)
+
+    def test_verify(self):
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('1000000011', '0004'))
+        self.assertTrue(jed.verify_checksum())
+
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('1000000011', '0005'))
+        self.assertFalse(jed.verify_checksum())
+
+    def test_load_verify(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'test.jed')
+            with open(filename, 'wb') as f:
+                f.write(jedec_data('1000000011', '0005'))
+            jedec.Jedec().load(filename)
+            with self.assertRaises(jedec.ChecksumError):
+                jedec.Jedec().load(filename, verify=True)
+
+
+class test_vectors(unittest.TestCase):
+
+    def test_skipped(self):
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('1010', vectors=['01HL']))
+        self.assertEqual(jed.number_of_vectors, 0)
+
+    def test_values(self):
+        jed = jedec.Jedec()
+        jed.parse(jedec_data('1010', vectors=['01HL', 'CKZX', 'c1 hN']), vectors=True)
+        self.assertEqual(jed.vector_numbers, [1, 2, 3])
+        self.assertEqual(bytes(jed.vector_array()[2]), b'C1HN')
+
+        drive, pulse, expect = jed.vector_values()
+        self.assertEqual(drive.tolist(), [[0, 1, -1, -1], [0, 1, -1, -1], [0, 1, -1, -1]])
+        self.assertEqual(pulse.tolist(), [[False] * 4, [True, True, False, False], [True, False, False, False]])
+        self.assertEqual(expect.tolist(), [[-1, -1, 1, 0], [-1, -1, jedec.EXPECT_Z, jedec.EXPECT_NONE], [-1, -1, 1, -1]])
+
+    def test_pin_count(self):
+        jed = jedec.Jedec()
+        with self.assertRaises(ValueError):
+            jed.parse(jedec_data('1010', vectors=['01H']), vectors=True)
+
+    def test_invalid_condition(self):
+        jed = jedec.Jedec()
+        with self.assertRaises(ValueError):
+            jed.parse(jedec_data('1010', vectors=['01HQ']), vectors=True)
+
+
+class test_files(unittest.TestCase):
+
+    def test_format(self):
+        jed = jedec.Jedec()
+        jed.fuse_data = '1000000011'
+        data = jed.format('test', 4)
+        self.assertEqual(data, b'\x02test*\r\nQF10*\r\nF0*\r\nL00000 1000*\r\nL00004 0000*\r\nL00008 11*\r\n'
+                               b'C0004*\r\n\x030C04\r\n')
+
+        parsed = jedec.Jedec()
+        parsed.parse(data)
+        self.assertEqual(parsed.fuse_data, '1000000011')
+        self.assertTrue(parsed.has_checksum and parsed.verify_checksum())
+
+    def test_find_jed_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ('b.jed', os.path.join('sub', 'a.jed'), 'c.txt'):
+                os.makedirs(os.path.dirname(os.path.join(tmpdir, name)), exist_ok=True)
+                open(os.path.join(tmpdir, name), 'w').close()
+            single = os.path.join(tmpdir, 'z.jed')
+            self.assertEqual(jedec.find_jed_files([tmpdir, single]),
+                             sorted([os.path.join(tmpdir, 'b.jed'), os.path.join(tmpdir, 'sub', 'a.jed'), single]))
+
+
+if __name__ == '__main__':
+    unittest.main()
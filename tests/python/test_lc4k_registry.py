@@ -0,0 +1,84 @@
+#
+# LC4K Device Registry tests
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+
+import os
+import tempfile
+import unittest
+
+from lc4k_registry import lc4k_registry
+
+
+def device_sx(name, num_glbs, gi_mux_size, ze=False):
+    '''
+    Minimal device file: GRP, block clock polarity, two I/O pins and a
+    clock input pin. The fusemap width follows from the GRP like for the
+    real parts.
+    '''
+    columns = (gi_mux_size + 166) * num_glbs // 2
+    grp = ' '.join([f'(glb {glb} (gi 0 ' + ' '.join([f'(fuse {fuse} {glb})' for fuse in range(0, gi_mux_size)]) + '))'
+                    for glb in range(0, num_glbs)])
+    bclk = ' '.join([f'(glb {glb} (fuse 97 {glb}))' for glb in range(0, num_glbs)])
+    osctimer = '(osctimer (osc_out (fuse 96 0)))' if ze else ''
+    return (f'({name}\n'
+            f'(global_routing_pool {grp})\n'
+            f'(bclk_polarity {bclk})\n'
+            f'(input_threshold (pin 1 (fuse 99 0)) (pin 2 (fuse 99 1)) (pin 3 (clk 0) (fuse 99 {columns - 1})))\n'
+            f'(slew_rate (pin 1 (fuse 98 0)) (pin 2 (fuse 98 1)))\n'
+            f'{osctimer})\n')
+
+
+class test_registry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        sx_dir = os.path.join(self.tmpdir.name, 'sx')
+        os.makedirs(sx_dir)
+        for name, num_glbs, gi_mux_size, ze in (('LC4064ZE_TQFP48', 4, 12, True),
+                                                 ('LC4032x_TQFP44', 2, 6, False)):
+            with open(os.path.join(sx_dir, f'{name}.sx'), 'w') as f:
+                f.write(device_sx(name, num_glbs, gi_mux_size, ze))
+        self.registry = lc4k_registry([sx_dir], os.path.join(self.tmpdir.name, 'cache'))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_names(self):
+        self.assertEqual(self.registry.names(), ['LC4032x_TQFP44', 'LC4064ZE_TQFP48'])
+
+    def test_ze_part(self):
+        info = self.registry.info('LC4064ZE_TQFP48')
+        self.assertEqual((info['part'], info['family'], info['package']), ('LC4064ZE', 'ZE', 'TQFP48'))
+        self.assertEqual((info['rows'], info['columns']), (100, 356))
+        self.assertEqual(info['glbs'], [0, 1, 2, 3])
+        self.assertEqual(info['num_mcs'], 64)
+        self.assertTrue(info['is_ze'])
+
+    def test_x_part(self):
+        info = self.registry.info('LC4032x_TQFP44')
+        self.assertEqual((info['part'], info['family'], info['package']), ('LC4032x', 'x', 'TQFP44'))
+        self.assertEqual((info['rows'], info['columns']), (100, 172))
+        self.assertFalse(info['is_ze'])
+
+    def test_pins(self):
+        pins = self.registry.info('LC4032x_TQFP44')['pins']
+        self.assertEqual(pins['io'], [1, 2])
+        self.assertEqual(pins['input'], [3])
+        self.assertEqual(pins['clk'], {'0': 3})
+
+    def test_dimension_source(self):
+        self.assertEqual(self.registry.info('LC4032x_TQFP44')['dimensions'],
+                         'fuse coordinates, input threshold row, GRP width')
+
+    def test_index_reused(self):
+        index_file = self.registry.index_file
+        mtime = os.stat(index_file).st_mtime_ns
+        registry = lc4k_registry([os.path.dirname(self.registry.sx_file('LC4032x_TQFP44'))], self.registry.cache_dir)
+        self.assertEqual(registry.info('LC4064ZE_TQFP48'), self.registry.info('LC4064ZE_TQFP48'))
+        self.assertEqual(os.stat(index_file).st_mtime_ns, mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()
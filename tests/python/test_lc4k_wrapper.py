@@ -0,0 +1,113 @@
+#
+# LC4K Test Wrapper tests
+#
+# Copyright 2026, Arnim Laeuger (devsaurus@users.noreply.github.com)
+#
+
+import os
+import tempfile
+import unittest
+
+from lc4k_wrapper import wrapper_fusemap, wrapper_module, wrapper_ports
+
+
+WRAPPER = '''library ieee;
+use ieee.std_logic_1164.all;
+
+entity oe_cpld is
+
+  port (
+    i_oe  : in  std_logic;
+    i_d   : in  std_logic_vector(1 downto 0);
+    o_d   : out std_logic_vector(1 downto 0)
+  );
+
+end;
+
+architecture struct of oe_cpld is
+
+  constant c_fusemap : std_logic_vector(0 to 12-1) :=
+    "0101" &
+    x"F0";
+
+  signal ncon : std_logic;
+
+  signal d_out, d_oe : std_logic_vector(o_d'range);
+
+begin
+
+  cpld_b : entity work.test_core
+    generic map (
+      g_fusemap => c_fusemap
+    )
+    port map (
+      i_A1   => i_d(0),
+      o_A1   => open,
+      i_A2   => i_d(1),
+      i_A3   => i_oe,
+      i_B1   => ncon,
+      o_B1   => d_out(0),
+      oe_B1  => d_oe(0),
+      o_B2   => d_out(1),
+      oe_B2  => d_oe(1),
+      --
+      i_oscclk => '0'
+    );
+
+  ncon <= '1';
+
+  oe_gen: for idx in o_d'range generate
+    o_d(idx) <= d_out(idx) when d_oe(idx) = '1' else 'Z';
+  end generate;
+
+end;
+'''
+
+
+class test_wrapper(unittest.TestCase):
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.filename = os.path.join(tmpdir.name, 'oe_cpld.vhd')
+        with open(self.filename, 'w') as f:
+            f.write(WRAPPER)
+
+    def test_fusemap(self):
+        self.assertEqual(wrapper_fusemap(self.filename), '010111110000')
+
+    def test_ports(self):
+        inputs, outputs, ncon = wrapper_ports(self.filename)
+        self.assertEqual(inputs, {'i_d(0)': 'A1', 'i_d(1)': 'A2', 'i_oe': 'A3'})
+        self.assertEqual(outputs, {'o_d(0)': 'B1', 'o_d(1)': 'B2'})
+        self.assertEqual(ncon, ['B1'])
+
+    def test_module(self):
+        name, core, module = wrapper_module(self.filename)
+        self.assertEqual((name, core), ('oe_cpld', 'test_core'))
+        self.assertEqual({port: value['direction'] for port, value in module['ports'].items()},
+                         {'i_oe': 'input', 'i_d': 'input', 'o_d': 'output'})
+
+        instance = module['cells']['cpld_b']
+        self.assertEqual(instance['type'], 'test_core')
+        self.assertEqual(instance['connections']['i_A1'], module['ports']['i_d']['bits'][:1])
+        self.assertEqual(instance['connections']['i_B1'], ['1'])
+        self.assertEqual(instance['connections']['i_oscclk'], ['0'])
+
+        # o_d(idx) <= d_out(idx) when d_oe(idx) = '1' else 'Z'
+        tbufs = [cell for cell in module['cells'].values() if cell['type'] == '$_TBUF_']
+        self.assertEqual(len(tbufs), 2)
+        for index, tbuf in enumerate(tbufs):
+            self.assertEqual(tbuf['connections']['A'], instance['connections'][f'o_B{index + 1}'])
+            self.assertEqual(tbuf['connections']['E'], instance['connections'][f'oe_B{index + 1}'])
+            self.assertEqual(tbuf['connections']['Y'], module['ports']['o_d']['bits'][index:index + 1])
+
+    def test_multiple_drivers(self):
+        with open(self.filename, 'w') as f:
+            f.write(WRAPPER.replace("ncon <= '1';", "ncon <= '1';\n  ncon <= i_oe;"))
+        with self.assertRaises(ValueError):
+            wrapper_module(self.filename)
+
+
+if __name__ == '__main__':
+    unittest.main()
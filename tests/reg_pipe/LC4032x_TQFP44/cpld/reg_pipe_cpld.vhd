@@ -18,106 +18,106 @@ end;
 architecture struct of reg_pipe_cpld is
 
   constant c_fusemap : std_logic_vector(0 to 17200-1) :=
-"1111100011000110001100011111110001111111000111111100010000111111111111111111111111111111111000110001100011000100001000011111110001111111000111111111111000111111111111111111" &
-"1101100011000110001100011111110001111111000111111100011000111111111111111111111111111111011000110001100011000000001100011111110001111111000111111111111000111111111111111111" &
-"1111100011000110001000011111110001111111000111111100011000111111111111111111111111111111111000110001100010000100001100011111110001111111000111111111111000111111111111111111" &
-"1101100011000110001100011111110001111111000111111100011000111111111111111111111111111111011000110001100011000000001100011111110001111111000111111111111000111111111111111111" &
-"1101100011000110001100011111110001111111000111111000011000111111111111111111111111111111011000110001100011000100001100011111110001111110000111111111111000111111111111111111" &
-"1111100011000110001100011111110001111111000111111100011000111111111111111111111111111111111000110001100011000000001100011111110001111111000111111111111000111111111111111111" &
-"1101100011000110001100011111110001111110000111111100011000111111111111111111111111111101111000110001100011000100000100011111110001111111000111111111111000111111111111111111" &
-"1111100011000110001100011111110001111111000111111100011000111111111111111111111111111111111000110001100011000100001100011111110001111111000111111111111000111111111111111111" &
-"1111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111" &
-"1101111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1101111111111111110111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111101111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1101111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111101111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1010111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111101111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111011" &
-"1011111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1101111111111111111111111111111111111101111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111011110111101111011111111101111111110111111111011110111111111111111111111111111111111101111011110111101111111110111111111011111111101111111111111101111111111111111111111" &
-"1010111101111011110111111111011111111101111111110111101111111111111111111111111111111110110111101111011110111111111011111111101111111110111111111111110111111111111111111111" &
-"1111011111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1101111111111111111111111111011111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1011111111111011111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111011111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1101111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111110111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111101111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111101111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111011111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111110111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111111011111111101111111110111111110111111111111111111111111111111111110011111111001111111110111111111011111111101111111111111111110111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111001111111100111111110011111111001111111100111111111111110011111111001111111100111111110011111111001111111100111111110011111111001111111" &
-"1111111001111111100111111111011111111101111111110111111110111111111111111111111111111111111110011111111001111111110111111111011111111101111111111111111110111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111111011111111101111111110111111110111111111111111111111111111111111110011111111001111111110111111111011111111101111111111111111110111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111101111111100111111111011111111001111111100111111111111110111111111011111111101111111110111111111011111111100111111111011111111001111111" &
-"1111111001111111100111111111011111111101111111101111111110011111111001111111100111111111111111011111111011111111100111111110011111111001111111100111111110011111111001111111" &
-"1111111001111111100111111111011111111001111111100111111110011111111001111111100111111111111111111111111101111111100111111110011111111001111111100111111110011111111001111111" &
-"1111111001111111100111111110011111111001111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111001111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111101" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111001111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111001111111111111111111111111111111111111111111111111111111111111111111111111100111111110011111111001111111101111111110011111111001111111"
+x"F8C631FC7F1FC43FFFFFFFE318C421FC7F1FFE3FFFF" &
+x"D8C631FC7F1FC63FFFFFFF6318C031FC7F1FFE3FFFF" &
+x"F8C621FC7F1FC63FFFFFFFE3188431FC7F1FFE3FFFF" &
+x"D8C631FC7F1FC63FFFFFFF6318C031FC7F1FFE3FFFF" &
+x"D8C631FC7F1F863FFFFFFF6318C431FC7E1FFE3FFFF" &
+x"F8C631FC7F1FC63FFFFFFFE318C031FC7F1FFE3FFFF" &
+x"D8C631FC7E1FC63FFFFFFDE318C411FC7F1FFE3FFFF" &
+x"F8C631FC7F1FC63FFFFFFFE318C431FC7F1FFE3FFFF" &
+x"FFFFFFFBFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFF" &
+x"DFFFFFFFFFFFFFFFFFFFFF7FFFFBFFFFFFFFFFFFFFF" &
+x"DFFFDFFFFFFFFFFFFFFFFF7FFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFBFFFFFFFFBFFFFFFFFFFFFFFFFFFFF" &
+x"DFFFFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFF" &
+x"BF7FFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"AFFFFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFDFFFFFFFFFFFFFFFBFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFDFFFFFFFFFFFFFFFFFFFFF7FFFFFFFFFFFFFFFFF" &
+x"BFFFFFFFFFFFFFFFFFFFFEFFFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFFB" &
+x"BFFFFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFF" &
+x"DFFFFFFFFDFFFFFFFFFFFF7FFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"F7BDEFFBFEFFBDFFFFFFFFBDEF7FDFF7FDFFFBFFFFF" &
+x"AF7BDFF7FDFF7BFFFFFFFEDEF7BFEFFBFEFFFDFFFFF" &
+x"F7FFFFFFFFFFFFFFFFFFFFDFFFFFFFFFFFFFFFFFFFF" &
+x"BFFFFFFFFFFFFFFFFFFFFEFFFFFBFFFFFFFFFFFFFFF" &
+x"DFFFFFF7FFFFFFFFFFFFFF7FFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"BFFBFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"FFBFFFFFFFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFF" &
+x"BFFFFFFFFFFFFFFFFFFFFEFFFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFDFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFF7FFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFF7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"DFFFFFFFFFFFFFFFFFFFFF7FFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFF7FFFFFFFFFFFFFFDFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFDFFFFFFFFFFFDFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFFFF7FFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFDFFFFFFFFF7FFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFFEFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFF" &
+x"FE7F9FF7FDFF7FBFFFFFFFF9FE7FDFF7FDFFFFBFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7F9FE7F9FE7F9FFF9FE7F9FE7F9FE7F9FE7F" &
+x"FE7F9FF7FDFF7FBFFFFFFFF9FE7FDFF7FDFFFFBFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFF" &
+x"FE7F9FF7FDFF7FBFFFFFFFF9FE7FDFF7FDFFFFBFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7FDFE7FDFE7F9FFFBFEFFBFEFFBFE7FDFE7F" &
+x"FE7F9FF7FDFEFF9FE7F9FFFDFEFF9FE7F9FE7F9FE7F" &
+x"FE7F9FF7F9FE7F9FE7F9FFFFFF7F9FE7F9FE7F9FE7F" &
+x"FE7F9FE7F9FFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7F9FFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFD" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7F9FFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7F9FFFFFFFFFFFFFFFFFF9FE7F9FEFF9FE7F"
 ;
 
   signal ncon : std_logic;
@@ -14,106 +14,106 @@ end;
 architecture struct of xor_in_cpld is
 
   constant c_fusemap : std_logic_vector(0 to 17200-1) :=
-"1111111111111111111111111111111111111111111111111111011111111111000011111111111111101111111111111111111111111111111111111111111111111111000111111111111000111111111111111011" &
-"1101111111111111111111111111111111111111111111111111011111111110100011111111111111101111111111111111111111111111111111111111111111111111000111111111111000111111111111111011" &
-"1111111111100111111111111111111111111111111111111111011111111111100011111111111111101111111111111111111111111111111111111111111111111110000111111111111000111111111111111011" &
-"1011111110011111111111111111111111111111111111111111011111111111100011111111111111101111011111111111111111111111111111111111111111111101000111111111111000111111111111111011" &
-"1111111111111111111111111111111111111111111111111010011111111111100011111111111111101111111111111001111111111111111111111111111111111111000111111111111000111111111111111011" &
-"0111111111111111111111111111111111111111111111110101011111111111100011111111111111101111011111100111111111111111111111111111111111111111000111111111111000111111111111111011" &
-"1111111111111111111111111111111111111111111111111111011111111111100011111111111111101111011111110101111111111111111111111111111111111111000111111111111000111111111111111011" &
-"1011111111111111111111111111011111111111111111111111011111111111100011111111111111101111111111101011111111111111111111111111111111111111000111111111111000111111111111111011" &
-"1101111111111111111111111111111111111111111111111100111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111" &
-"1111111111111111111111111111111111111111111111110011111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111101111111111111111111111" &
-"1101111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111011111111111111111111101111111111111111111111111111111111111011111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111010111111111111111111111111111111111111111111101111111111111111111111111111101011111111111111111111111111111111111111111111111111111" &
-"0111111111111111111111111111111111111110101111111111111111111111111111111111111111111111111111111111111111111111111010111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111100111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110011111111111111111111111111111111111111111111111111111111111111111" &
-"0111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110101111111111111111111111111111111111111111111" &
-"1111111111111111110111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111101011111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111100111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"0111111111111111111111111111111111111110011111111111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111110011111111111111111111111111111111111111111111111111111101111111111111111111111111111110011111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111101101111111111111111111111111111111111111111111111111111111111111111111111111111111111001111111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111111001111111111111111111111111111111111111111111111111111101111111111111111111111111111100111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111100111111111111111111111111111111111111111111111111111111111111111111111111111111111111011011111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111110101111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111101011111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111001111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111110110111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110011111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111011111101101111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111001111111111111111111111111111111111111111111111011111111111111111111111111111111111111111111111111111111111101111111111111111111111" &
-"0111111111111111111111111111111111111110110111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111001111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111100111111111111111111111111111111111111111111111" &
-"0111111111111111111100111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111011011111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"0111111111111111111110011111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111001111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111110110111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"0111111111111111111111111111111111111111111111111001111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110011111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111101101111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"0111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111010111111111111111111111111111111111111111111111111111111111111111111111111101111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1011111110101111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111101111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111010111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110101111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111001111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110110111111111111111111111111111111111111111111111111111111111111111" &
-"0111111111111111111101011111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111010111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111101111111110111111111011111111101111111111111111111111111111111111111111111111111111111011111111101111111110111111111011111111111111111111111111111111111111111111111" &
-"1111111101111111110111111111011111111101111111110111111111111111111011111111111111111111111111011111111101111111110111111111011111111101111111111111111110111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111001111111100111111110011111111001111111100111111111111110011111111001111111100111111110011111111001111111100111111110011111111001111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111101111111110111111111011111111101111111110111111111111111111011111111111111111111111111011111111101111111110111111111011111111101111111111111111110111111111111111111" &
-"1111111101111111110111111111011111111101111111110111111111111111111011111111111111111111111111011111111101111111110111111111011111111101111111111111111110111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111011111111101111111110111111111011111111101111111110011111111101111111100111111111111111111111111011111111101111111110111111111011111111100111111111011111111001111111" &
-"1111111001111111100111111110011111111001111111100111111110011111111001111111100111111111111110011111111001111111100111111110011111111001111111100111111110011111111001111111" &
-"1111111001111111100111111110011111111001111111100111111110011111111001111111100111111111111110011111111001111111100111111110011111111001111111100111111110011111111001111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111110111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111111" &
-"1111111001111111100111111110011111111001111111100111111110011111111001111111101111111111111110011111111001111111100111111110011111111001111111100111111110011111111001111111"
+x"FFFFFFFFFFFFF7FF0FFFEFFFFFFFFFFFFF1FFE3FFFB" &
+x"DFFFFFFFFFFFF7FE8FFFEFFFFFFFFFFFFF1FFE3FFFB" &
+x"FFE7FFFFFFFFF7FF8FFFEFFFFFFFFFFFFE1FFE3FFFB" &
+x"BF9FFFFFFFFFF7FF8FFFEF7FFFFFFFFFFD1FFE3FFFB" &
+x"FFFFFFFFFFFFA7FF8FFFEFFF9FFFFFFFFF1FFE3FFFB" &
+x"7FFFFFFFFFFF57FF8FFFEF7E7FFFFFFFFF1FFE3FFFB" &
+x"FFFFFFFFFFFFF7FF8FFFEF7F5FFFFFFFFF1FFE3FFFB" &
+x"BFFFFFF7FFFFF7FF8FFFEFFEBFFFFFFFFF1FFE3FFFB" &
+x"DFFFFFFFFFFFCFFFFFFFFFFFFFFFFFFFFFFFFDFFFFF" &
+x"FFFFFFFFFFFF3FFFFFFFFF7FFFFFFFFFFFFFFBFFFFF" &
+x"DFFFFFFFFFFFFFFEFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFF7FFFFDFFFFFFFFF7FFFFFFFFFFF" &
+x"FFFFFFFFFF5FFFFFFFFFFDFFFFFFF5FFFFFFFFFFFFF" &
+x"7FFFFFFFFEBFFFFFFFFFFFFFFFFFEBFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFDFFFFE7FFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFF9FFFFFFFFFFFFFFFF" &
+x"7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFD7FFFFFFFFFF" &
+x"FFFFDFFFFFFFFFFFFFFFFEFFFFFFFFFAFFFFFFFFFFF" &
+x"FFFFFFFFFF9FFFFFFFFFFF7FFFFFFFFFFFFFFFFFFFF" &
+x"7FFFFFFFFE7FFFFFFFFFFFFDFFFFFFFFFFFFFFFFFFF" &
+x"BFFFFFFCFFFFFFFFFFFFFDFFFFFFF9FFFFFFFFFFFFF" &
+x"FFFFFFFB7FFFFFFFFFFFFFFFFFFFE7FFFFFFFFFFFFF" &
+x"BFFFFFFE7FFFFFFFFFFFFDFFFFFFF3FFFFFFFFFFFFF" &
+x"FFFFFFF9FFFFFFFFFFFFFFFFFFFFEDFFFFFFFFFFFFF" &
+x"BFFFFFFD7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFAFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFCFFFFFFFFFFFFFFFFFFDFFFFFFFFFFFFFFFFFFFFF" &
+x"BFB7FFFFFFFFFFFFFFFFFFFFFF7FFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFF3FFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFF7EDFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFF3FFFFFFFFFFF7FFFFFFFFFFFFFFBFFFFF" &
+x"7FFFFFFFFEDFFFFFFFFFFFFFFFFFFFFFFFFFFDFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFE7FFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFDFFFFFFFFF9FFFFFFFFFFF" &
+x"7FFFF3FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFEDFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"7FFFF9FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFE7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"BFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FF7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFF6FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"7FFFFFFFFFFF9FFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFCFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFFFFFFFFFB7FFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"7FFFFFFFFDFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFD7FFFFFFFFFFFFFFFFFDFFFFFFFFFFFFFFFFFFFFF" &
+x"BFAFFFFFFFFFFFFFFFFFFFFFFFFFDFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFFFFFFFFFFFDFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFFFFD7FFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFAFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFEFFFFCFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFB7FFFFFFFFFFFFFFF" &
+x"7FFFF5FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFEBFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FF7FDFF7FDFFFFFFFFFFFFFDFF7FDFF7FFFFFFFFFFF" &
+x"FF7FDFF7FDFF7FFFEFFFFFFDFF7FDFF7FDFFFFBFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7F9FE7F9FE7F9FFF9FE7F9FE7F9FE7F9FE7F" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FF7FDFF7FDFF7FFFEFFFFFFDFF7FDFF7FDFFFFBFFFF" &
+x"FF7FDFF7FDFF7FFFEFFFFFFDFF7FDFF7FDFFFFBFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FEFFBFEFFBFEFF9FF7F9FFFFFEFFBFEFFBFE7FDFE7F" &
+x"FE7F9FE7F9FE7F9FE7F9FFF9FE7F9FE7F9FE7F9FE7F" &
+x"FE7F9FE7F9FE7F9FE7F9FFF9FE7F9FE7F9FE7F9FE7F" &
+x"FFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFBFFFFFFFFFFFFFFFFFFF" &
+x"FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF" &
+x"FE7F9FE7F9FE7F9FE7FBFFF9FE7F9FE7F9FE7F9FE7F"
 ;
 
   signal ncon : std_logic;